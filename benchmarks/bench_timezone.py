@@ -0,0 +1,88 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the speed of parsing datetime strings by their shape with parsing \
+them with every allowed format.
+
+Run from the root of the repository:
+
+.. code-block:: shell
+
+    python -m benchmarks.bench_timezone
+"""
+
+from timeit import repeat
+
+from landtransportsg import timezone
+
+VALUES = (
+    # e.g. bus arrivals, traffic images and train service alerts
+    '2026-10-16T08:32:17+08:00',
+    '2026-10-16T08:32:17.456+08:00',
+    '2026-10-16 08:32:17',
+    # e.g. planned bus routes and facility maintenance
+    '2026-10-16',
+    '20261016',
+    # e.g. first and last bus times
+    '0532',
+    '23:59',
+    # e.g. road names, bus stop codes and coordinates
+    'Victoria St',
+    '01012',
+    '1.29685',
+    '1.29685,103.85207',
+)
+NUMBER = 1000
+REPEAT = 5
+
+def _parse_with_formats(value):
+    return timezone._parse_datetime_formats(value)
+
+def _parse_without_cache(value):
+    timezone.datetime_or_none_from_string.cache_clear()
+    return _parse(value)
+
+def _parse(value):
+    try:
+        return timezone.datetime_from_string(value)
+    except ValueError:
+        return None
+
+def _best_time(parse):
+    return min(repeat(
+        lambda: [parse(value) for value in VALUES],
+        number=NUMBER,
+        repeat=REPEAT,
+    ))
+
+def main():
+    for value in VALUES:
+        assert _parse(value) == _parse_with_formats(value), value
+
+    formats_time = _best_time(_parse_with_formats)
+    print(f'{len(VALUES) * NUMBER} values, best of {REPEAT} runs')
+    print(f'{"formats":<18}{formats_time:8.3f}s')
+
+    for name, parse in (
+        ('shapes', _parse_without_cache),
+        ('shapes and cache', _parse),
+    ):
+        parse_time = _best_time(parse)
+        print(
+            f'{name:<18}{parse_time:8.3f}s'
+            f'{formats_time / parse_time:8.1f}x faster',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -14,13 +14,22 @@
 
 # pylint: disable=invalid-name,missing-function-docstring,unused-argument,wildcard-import
 
-"""Mock response to return link response."""
+"""Mock response to return link response, and keep the cache of every test \
+out of the working tree."""
 
 import pytest
 from requests_cache import CachedSession
 
 from tests.mocks.api_response_link import APIResponseLink
 
+@pytest.fixture(scope='session', autouse=True)
+def cache_in_tmp_path(tmp_path_factory):
+    """The default SQLite cache is created in the current directory, so run \
+    the tests in a temporary directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path_factory.mktemp('cache'))
+        yield
+
 @pytest.fixture
 def mock_requests_link_response(monkeypatch):
     """Requests.get() mocked to return sample API response with value string."""
@@ -21,16 +21,38 @@ from .electric_vehicle import Client as ElectricVehicle
 from .geospatial import Client as Geospatial
 from .public_transport import Client as PublicTransport
 from .traffic import Client as Traffic
+from .datamall import DataMall
+from .cache_warmer import CacheWarmer
+from .config import CacheConfig, ConnectionConfig, ResilienceConfig
+from .deadline import Deadline
+from .aio import (
+    AsyncActiveMobility,
+    AsyncElectricVehicle,
+    AsyncGeospatial,
+    AsyncPublicTransport,
+    AsyncTraffic,
+)
 
 from .author import AUTHOR
 from .version import VERSION
 
 __all__ = [
+    'DataMall',
+    'CacheWarmer',
+    'CacheConfig',
+    'ConnectionConfig',
+    'ResilienceConfig',
+    'Deadline',
     'ActiveMobility',
     'ElectricVehicle',
     'Geospatial',
     'PublicTransport',
     'Traffic',
+    'AsyncActiveMobility',
+    'AsyncElectricVehicle',
+    'AsyncGeospatial',
+    'AsyncPublicTransport',
+    'AsyncTraffic',
 ]
 __author__ = AUTHOR
 __version__ = VERSION
@@ -39,6 +39,7 @@ class Client(LandTransportSg):
     @typechecked
     def bicycle_parking(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[BicycleParkingArgsDict],
     ) -> list[BicycleParkingDict]:
         """Get bicycle parking locations within a radius.
@@ -47,6 +48,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: BicycleParkingArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: distance is a negative float.
 
         :return: Available bicycle parking locations at the specified \
@@ -71,6 +77,8 @@ class Client(LandTransportSg):
             BICYCLE_PARKING_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_ONE_DAY,
+            record_type=BicycleParkingDict,
+            deadline=deadline,
         )
 
         return bicycle_parking_locations
@@ -0,0 +1,1832 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Asyncio clients for interacting with all of the API endpoints.
+
+The asyncio clients send their requests with non-blocking I/O, using \
+    ``httpx.AsyncClient``, so one event loop can have hundreds of requests \
+    in flight without a thread for each of them.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from functools import partial, wraps
+from inspect import isgeneratorfunction
+from io import BytesIO
+from time import perf_counter
+from typing import Any
+
+import httpx
+from requests import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    PreparedRequest,
+    ReadTimeout,
+    Request,
+    RequestException,
+    Response,
+)
+from requests_cache import BaseCache
+from typeguard import typechecked
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+from .active_mobility import Client as ActiveMobility
+from .cache import canonical_params
+from .concurrency import AsyncSingleFlight, map_concurrently_async
+from .constants import (
+    ASYNC_MAX_CONCURRENCY,
+    BASE_API_DOMAIN,
+    PAGE_SIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+)
+from .deadline import MIN_TIMEOUT, Deadline, DeadlineRetry
+from .electric_vehicle import Client as ElectricVehicle
+from .exceptions import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    PaginationError,
+)
+from .geospatial import Client as Geospatial
+from .landtransportsg import LandTransportSg
+from .pagination import PaginationCursor
+from .public_transport import Client as PublicTransport
+from .public_transport.client import (
+    merge_station_crowd_density_forecast,
+    merge_station_crowd_density_real_time,
+)
+from .public_transport.constants import BUS_ARRIVALS_MAX_WORKERS, TRAIN_LINES
+from .public_transport.types import (
+    BusArrivalDict,
+    StationCrowdDensityForecastAllDict,
+    StationCrowdDensityRealTimeAllDict,
+)
+from .traffic import Client as Traffic
+from .types import Url
+
+class AsyncLandTransportSg:
+    """Asyncio counterpart of ``LandTransportSg``, and the base class of the \
+        other asyncio clients.
+
+    Requests are sent with non-blocking I/O. They share the blocking \
+        client's (``client``) cache backend, in-memory cache, memo, rate \
+        limiter and circuit breaker, and they are retried, given deadlines, \
+        hedged, coalesced and served stale in the same way. Their responses \
+        are decoded and sanitised by the blocking client, so the records are \
+        exactly the same. Responses that are cached by the asyncio client \
+        are served from the cache by the blocking client, and vice versa. \
+        Unless the cache backend keeps its responses in memory, it is read \
+        and written in a thread, so that it does not block the event loop.
+
+    Every public method of the blocking client (``client_class``) is \
+        available as a coroutine method with the same name and arguments, \
+        e.g. ``await client.send_request(url)``. Methods that return an \
+        iterator, e.g. ``iter_request()``, return an asynchronous iterator \
+        instead, and ``force_refresh()`` is an asynchronous context manager. \
+        The endpoint methods check their arguments and build their requests \
+        with the blocking client's methods, and then send the requests in \
+        the event loop.
+
+    A client is bound to the event loop that sends its first request, so \
+        create it and close it in the same event loop, e.g. with \
+        ``async with``.
+
+    Example usage:
+
+    .. code-block:: python
+
+        async with AsyncPublicTransport(API_KEY) as client:
+            bus_arrivals = await asyncio.gather(*[
+                client.bus_arrival(bus_stop_code=code) for code in codes
+            ])
+
+    :param account_key: The LTA DataMall-assigned Account key.
+    :type account_key: str
+
+    :param cache_backend: Cache backend name or instance to use. Defaults \
+        to "sqlite".
+    :type cache_backend: str | BaseCache
+
+    :param max_concurrency: Maximum number of connections that can be open \
+        at once, i.e. of requests that can be in flight at once. Other \
+        requests wait for a connection. Defaults to None, i.e. the larger \
+        of 100 and the ``pool_maxsize`` of the blocking client's \
+        ``connection``.
+    :type max_concurrency: int or None
+
+    :param transport: Transport to send the requests with, e.g. \
+        ``httpx.MockTransport`` in tests. If it is given, then \
+        ``max_concurrency`` does not apply to it. Defaults to None, i.e. \
+        connect to the LTA DataMall server.
+    :type transport: httpx.AsyncBaseTransport or None
+
+    :param kwargs: Other arguments to pass to the blocking client's \
+        constructor.
+    :type kwargs: Any
+
+    :raises ValueError: max_concurrency is less than 1.
+    """
+
+    client_class: type[LandTransportSg] = LandTransportSg
+    """Blocking client whose methods are made available as coroutines."""
+
+    @typechecked
+    def __init__(
+        self,
+        account_key: str,
+        cache_backend: str | BaseCache='sqlite',
+        max_concurrency: int | None=None,
+        transport: httpx.AsyncBaseTransport | None=None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor method"""
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                'Argument "max_concurrency" cannot be less than 1.'
+            )
+
+        self.client = self.client_class(
+            account_key,
+            cache_backend=cache_backend,
+            **kwargs,
+        )
+
+        if max_concurrency is None:
+            max_concurrency = max(
+                ASYNC_MAX_CONCURRENCY,
+                self.client.connection.pool_maxsize,
+            )
+        self.max_concurrency = max_concurrency
+
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+            follow_redirects=True,
+        )
+
+        self.__single_flight = AsyncSingleFlight()
+        self.__revalidations: dict[str, asyncio.Task] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Make the methods of the subclass's blocking client available as \
+        coroutine methods."""
+        super().__init_subclass__(**kwargs)
+        _add_async_methods(cls)
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__} ({self.client!r})'
+
+    async def __aenter__(self) -> 'AsyncLandTransportSg':
+        """Enter the asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the asynchronous context manager and close the client."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Cancel the refreshes of stale responses that are in flight, then \
+        close the connections and the blocking client's session."""
+        revalidations = list(self.__revalidations.values())
+        for revalidation in revalidations:
+            _ = revalidation.cancel()
+        _ = await asyncio.gather(*revalidations, return_exceptions=True)
+
+        await self.http_client.aclose()
+        self.client.session.close()
+
+    @typechecked
+    async def warm_up(self, connections: int=1) -> None:
+        """Open connections to the LTA DataMall server ahead of the first \
+        request, so that the first requests do not wait for the TCP and TLS \
+        handshakes. The connections are kept alive in the client's \
+        connection pool.
+
+        :param connections: Number of connections to open at the same time. \
+            Defaults to 1.
+        :type connections: int
+
+        :raises ValueError: connections is less than 1.
+        :raises RequestException: Error occurred while connecting.
+        """
+        if connections < 1:
+            raise ValueError('Argument "connections" cannot be less than 1.')
+
+        async def open_connection() -> None:
+            try:
+                _ = await self.http_client.head(
+                    BASE_API_DOMAIN,
+                    timeout=self.__timeout(),
+                )
+            except httpx.TransportError as e:
+                raise _request_exception(e) from e
+
+        _ = await asyncio.gather(
+            *[open_connection() for _ in range(connections)],
+        )
+
+    @asynccontextmanager
+    async def force_refresh(self) -> AsyncIterator[list[int]]:
+        """Send the requests that are made in this context to the endpoints, \
+        even if their responses are cached, and cache the new responses.
+
+        Only requests that are made from the current task, and from tasks \
+        that it creates in this context, are affected. The cache duration \
+        of each request is added to the yielded list.
+
+        Example usage:
+
+        .. code-block:: python
+
+            async with client.force_refresh() as cache_durations:
+                _ = await client.bus_stops()
+
+        :return: List of the cache durations of the requests that are made.
+        :rtype: AsyncIterator[list[int]]
+        """
+        cache_durations: list[int] = []
+        token = _refresh_cache_durations.set(
+            _refresh_cache_durations.get() | {id(self): cache_durations},
+        )
+        try:
+            yield cache_durations
+        finally:
+            _refresh_cache_durations.reset(token)
+
+    @typechecked
+    async def send_request(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Send a request to an endpoint and return its response.
+
+        This is the same as ``LandTransportSg.send_request()``, except that \
+        an identical request that is already being sent by another task is \
+        not sent again, and that the deadline is only set by ``deadline`` \
+        or the client's ``resilience.deadline``, because a ``with \
+        Deadline(...)`` block applies to a thread, not to a task.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Parameter names **must** match the names required by the \
+            endpoints, particularly with typecase (e.g. camelCase). Defaults \
+            to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :param hedge: If True, then hedge the request with the client's \
+            ``resilience.hedger``. Defaults to False.
+        :type hedge: bool
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched. The error's ``data`` contains the records from those \
+            pages, and its ``cursor`` can be used to resume the request.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        cursor = PaginationCursor(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+        )
+        request_deadline = self.__start_deadline(deadline)
+
+        collect_pages = partial(
+            self.__collect_pages,
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=request_deadline,
+            hedge=hedge,
+        )
+
+        is_refreshing = id(self) in _refresh_cache_durations.get()
+
+        if not self.client.caching.coalesce_requests or cache_duration <= 0 \
+            or is_refreshing:
+            return await collect_pages()
+
+        request_key = (
+            url,
+            canonical_params(params),
+            sanitise,
+            tuple(sanitise_ignore_keys or []),
+            record_type,
+        )
+        async def collect_coalesced_pages() -> dict:
+            # the identical requests must not use a fallback for a deadline
+            # that is not their own
+            return {
+                'data': await collect_pages(),
+                'is_deadline_missed': request_deadline is not None \
+                    and request_deadline.is_missed,
+            }
+
+        try:
+            result = await self.__single_flight.do(
+                request_key,
+                collect_coalesced_pages,
+                wait_timeout=None if request_deadline is None \
+                    else request_deadline.remaining,
+            )
+        except TimeoutError:
+            # the identical request did not finish before this request's
+            # deadline, so fall back to the cache, or raise
+            return await collect_pages()
+        except DeadlineExceededError:
+            if request_deadline is not None and request_deadline.is_missed:
+                raise
+            # the identical request missed its own deadline, which can be
+            # earlier than this request's
+            return await collect_pages()
+
+        if result['is_deadline_missed'] and (
+            request_deadline is None or not request_deadline.is_missed
+        ):
+            # the result is the identical request's fallback
+            return await collect_pages()
+
+        return result['data']
+
+    @typechecked
+    async def resume_request(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> list:
+        """Resume a request that failed after some of its pages were fetched, \
+        and return the records from the remaining pages.
+
+        :param cursor: Position of the request when it failed, i.e. the \
+            ``cursor`` of the raised ``PaginationError``.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Records from the remaining pages.
+        :rtype: list
+        """
+        data = await self.__collect_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=self.__start_deadline(deadline),
+        )
+
+        if data is None:
+            data = []
+
+        return data
+
+    async def iter_request(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> AsyncIterator[Any]:
+        """Send a request to an endpoint and yield its response one page at a \
+        time, as soon as each page is received.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Defaults to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from each page of the response.
+        :rtype: AsyncIterator[Any]
+        """
+        cursor = PaginationCursor(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+        )
+
+        async for page in self.__iter_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=self.__start_deadline(deadline),
+        ):
+            yield page
+
+    async def iter_records(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> AsyncIterator[Any]:
+        """Send a request to an endpoint and yield its response one record at \
+        a time.
+
+        Records are taken from each page returned by ``iter_request()``. If \
+        the response is not a list of records, then the response itself is \
+        yielded as the only record.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Defaults to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Records from the response.
+        :rtype: AsyncIterator[Any]
+        """
+        async for page in self.iter_request(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=deadline,
+        ):
+            if isinstance(page, list):
+                for record in page:
+                    yield record
+            else:
+                yield page
+
+# private
+
+    @typechecked
+    def __start_deadline(self, seconds: float | None=None) -> Deadline | None:
+        """Start the deadline of a request.
+
+        :param seconds: Number of seconds that the request may take, instead \
+            of the client's ``resilience.deadline``. Defaults to None.
+        :type seconds: float or None
+
+        :raises ValueError: seconds is not more than 0.
+
+        :return: The deadline, or None if there is no deadline.
+        :rtype: Deadline or None
+        """
+        if seconds is not None and seconds <= 0:
+            raise ValueError('Argument "deadline" must be more than 0.')
+
+        if seconds is None:
+            seconds = self.client.resilience.deadline
+
+        return None if seconds is None else Deadline(seconds)
+
+    async def __collect_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        record_type: type | None=None,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Collect the pages from the cursor's position into one response \
+        value.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched. The records from those pages are attached as ``data``.
+
+        :return: Results from the response, or None if there are no more \
+            pages to fetch.
+        :rtype: Any
+        """
+        data: Any = None
+
+        try:
+            async for page in self.__iter_pages(
+                cursor,
+                sanitise=sanitise,
+                sanitise_ignore_keys=sanitise_ignore_keys,
+                record_type=record_type,
+                deadline=deadline,
+                hedge=hedge,
+            ):
+                # only a full list of records is followed by more pages
+                if data is None:
+                    data = page
+                else:
+                    data += page
+        except PaginationError as e:
+            e.data = data
+            raise
+
+        return data
+
+    async def __iter_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        record_type: type | None=None,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> AsyncIterator[Any]:
+        """Yield the response value from an endpoint one page at a time, \
+        starting from the cursor's position, until a page that is not a \
+        full list of records is fetched.
+
+        The cursor is moved past each page as it is yielded. If the blocking \
+        client's ``pagination_workers`` is more than 1, then the pages after \
+        the first page are fetched that many at a time.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred before any page was fetched.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline, and ``deadline_fallback`` did not return a cached page.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from each page of the response.
+        :rtype: AsyncIterator[Any]
+        """
+        refresh_cache_durations = _refresh_cache_durations.get().get(id(self))
+        if refresh_cache_durations is not None:
+            refresh_cache_durations.append(cursor.cache_duration)
+
+        fetch_page = partial(
+            self.__fetch_page,
+            cursor.url,
+            cache_duration=cursor.cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            force_refresh=refresh_cache_durations is not None,
+            deadline=deadline,
+            hedge=hedge,
+        )
+        pagination_workers = self.client.pagination_workers
+
+        try:
+            while not cursor.is_complete:
+                if pagination_workers == 1 or cursor.pages == 0:
+                    page = await fetch_page(cursor.page_params())
+                    cursor.advance(page)
+                    yield page
+                    continue
+
+                # pages are fetched in batches, but yielded in $skip order
+                tasks = [
+                    asyncio.ensure_future(fetch_page(
+                        cursor.params \
+                            | {'$skip': cursor.skip + (i * PAGE_SIZE)},
+                    )) for i in range(pagination_workers)
+                ]
+                try:
+                    for task in tasks:
+                        page = await task
+                        cursor.advance(page)
+                        yield page
+                        if cursor.is_complete:
+                            break
+                finally:
+                    _cancel_tasks(tasks)
+        except DeadlineExceededError:
+            # the deadline of the whole request has passed, so resuming it
+            # would fail too
+            raise
+        except (APIError, RequestException) as e:
+            if cursor.pages == 0:
+                raise
+
+            raise PaginationError(
+                f'Request failed after {cursor.pages} page(s) were fetched.',
+                cursor=cursor,
+                errors=[str(e)],
+            ) from e
+
+    async def __fetch_page(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        sanitise: bool=False,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Fetch one page of the response value from an endpoint.
+
+        The page is taken from the blocking client's in-memory cache if it \
+        is there. Otherwise, the request is sent, and its response is \
+        decoded by the blocking client.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised. \
+            Defaults to False.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising. Defaults to None.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached, and the page is cached again. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True and the client has a hedger, then the request \
+            is sent again if it is slower than usual. Defaults to False.
+        :type hedge: bool
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: Error occurred during the request process.
+        :raises CircuitOpenError: The endpoint's circuit is open, and the \
+            page cannot be taken from the cache.
+        :raises DeadlineExceededError: The page was not fetched before the \
+            deadline, and it cannot be taken from the cache.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        if not force_refresh:
+            try:
+                return self.client.get_memory_cached_page(
+                    url,
+                    params,
+                    cache_duration,
+                    sanitise=sanitise,
+                    sanitise_ignore_keys=sanitise_ignore_keys,
+                    record_type=record_type,
+                )
+            except KeyError:
+                pass
+
+        response = await self.__send_page_request(
+            url,
+            params,
+            cache_duration,
+            force_refresh=force_refresh,
+            deadline=deadline,
+            hedge=hedge,
+        )
+
+        return self.client.decode_page(
+            response,
+            url,
+            params,
+            cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+        )
+
+    async def __send_page_request(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Send the request for one page, or take its response from the \
+        cache.
+
+        If the page is not fetched before the deadline and the client's \
+        ``resilience.deadline_fallback`` is True, or if the endpoint's \
+        circuit is open and ``resilience.circuit_breaker_fallback`` is True, \
+        then its cached response is used even if it has expired.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True and the client has a hedger, then the request \
+            is sent again if it is slower than usual. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises CircuitOpenError: The endpoint's circuit is open, and the \
+            page cannot be taken from the cache.
+        :raises DeadlineExceededError: The page was not fetched before the \
+            deadline, and it cannot be taken from the cache.
+
+        :return: The response.
+        :rtype: Response or CachedResponse
+        """
+        get_response = partial(
+            self.__get_response,
+            url,
+            params,
+            cache_duration,
+            force_refresh=force_refresh,
+            deadline=deadline,
+        )
+        hedger = self.client.resilience.hedger if hedge else None
+
+        if deadline is not None and deadline.is_expired:
+            return await self.__get_deadline_fallback(url, params, deadline)
+
+        try:
+            if hedger is None:
+                return await get_response()
+
+            # cached responses would make the hedging delay too short
+            return await hedger.run_async(
+                url,
+                get_response,
+                is_sample=lambda r: not getattr(r, 'from_cache', False),
+                discard=lambda r: r.close(),
+            )
+        except CircuitOpenError as e:
+            if not self.client.resilience.circuit_breaker_fallback:
+                raise
+            return await self.__get_expired_response(url, params, e)
+        except DeadlineExceededError:
+            # the rate limiter allows no request before the deadline
+            return await self.__get_deadline_fallback(url, params, deadline)
+        except RequestException:
+            if deadline is None or not deadline.is_expired:
+                raise
+            return await self.__get_deadline_fallback(url, params, deadline)
+
+    async def __get_response(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+    ) -> Any:
+        """Take the response of a request from the blocking client's cache \
+        backend, or send the request and save its response there.
+
+        A response that has expired less than the endpoint's \
+        ``caching.max_staleness()`` ago is used, and it is refreshed in a \
+        task in the background.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :return: The response.
+        :rtype: Response or CachedResponse
+        """
+        session = self.client.session
+        # the session adds the account key and user-agent headers, and its
+        # cache creates the same key as for the blocking client's requests
+        request = session.prepare_request(Request('GET', url, params=params))
+
+        if cache_duration <= 0:
+            return await self.__send(request, deadline=deadline)
+
+        cache_key = session.cache.create_key(request)
+
+        if not force_refresh:
+            response = await self.__call_cache_backend(
+                session.cache.get_response,
+                cache_key,
+            )
+            if response is not None:
+                response.cache_key = cache_key
+                if not response.is_expired:
+                    return response
+                if self.__is_servable_when_stale(url, response):
+                    self.__revalidate(request, cache_key, cache_duration)
+                    return response
+
+        response = await self.__send(request, deadline=deadline)
+        await self.__save_response(response, cache_key, cache_duration)
+
+        return response
+
+    @typechecked
+    def __is_servable_when_stale(self, url: Url, response: Any) -> bool:
+        """Check if an expired cached response can still be used while it is \
+        refreshed, i.e. if it expired less than the endpoint's \
+        ``caching.max_staleness()`` ago.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param response: The expired cached response.
+        :type response: CachedResponse
+
+        :return: True if the response can be used.
+        :rtype: bool
+        """
+        max_staleness = self.client.caching.max_staleness(url)
+        if max_staleness <= 0 or response.expires is None:
+            return False
+
+        return datetime.now(timezone.utc) \
+            < response.expires + timedelta(seconds=max_staleness)
+
+    @typechecked
+    def __revalidate(
+        self,
+        request: PreparedRequest,
+        cache_key: str,
+        cache_duration: int,
+    ) -> None:
+        """Refresh a stale cached response in a task in the background, \
+        unless it is being refreshed already.
+
+        :param request: The request of the response.
+        :type request: PreparedRequest
+
+        :param cache_key: Cache key of the response.
+        :type cache_key: str
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+        """
+        if cache_key in self.__revalidations:
+            return
+
+        async def refresh() -> None:
+            try:
+                response = await self.__send(request)
+            except (APIError, RequestException):
+                # the stale response is used until it can be refreshed
+                return
+            await self.__save_response(response, cache_key, cache_duration)
+
+        task = asyncio.ensure_future(refresh())
+        self.__revalidations[cache_key] = task
+        task.add_done_callback(
+            lambda _: self.__revalidations.pop(cache_key, None),
+        )
+
+    @typechecked
+    async def __save_response(
+        self,
+        response: Response,
+        cache_key: str,
+        cache_duration: int,
+    ) -> None:
+        """Save a response in the blocking client's cache backend, if the \
+        cache backend allows its status code.
+
+        :param response: The response.
+        :type response: Response
+
+        :param cache_key: Cache key of the response.
+        :type cache_key: str
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+        """
+        session = self.client.session
+        if response.status_code not in session.settings.allowable_codes:
+            return
+
+        await self.__call_cache_backend(
+            session.cache.save_response,
+            response,
+            cache_key=cache_key,
+            expires=datetime.now(timezone.utc) \
+                + timedelta(seconds=cache_duration),
+        )
+
+    async def __call_cache_backend(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Call a method of the blocking client's cache backend in a thread, \
+        so that its disk I/O and locks do not block the event loop, unless \
+        the backend keeps its responses in memory.
+
+        :param func: Method of the cache backend, or a method of the blocking \
+            client that reads the cache backend.
+        :type func: Callable[..., Any]
+
+        :param args: Positional arguments of the method.
+        :type args: Any
+
+        :param kwargs: Keyword arguments of the method.
+        :type kwargs: Any
+
+        :return: Result of the method.
+        :rtype: Any
+        """
+        if type(self.client.session.cache) is BaseCache:
+            return func(*args, **kwargs)
+
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def __send(
+        self,
+        request: PreparedRequest,
+        deadline: Deadline | None=None,
+    ) -> Response:
+        """Check the circuit breaker and wait for the rate limiter, then send \
+        the request, like the blocking client's ``RateLimitedHTTPAdapter``.
+
+        :param request: The request to send.
+        :type request: PreparedRequest
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :raises CircuitOpenError: The circuit of the request's endpoint is \
+            open.
+        :raises DeadlineExceededError: The rate limiter allows no request \
+            before the deadline.
+        :raises RequestException: Error occurred while sending the request, \
+            after its retries.
+
+        :return: The response.
+        :rtype: Response
+        """
+        circuit_breaker = self.client.circuit_breaker
+
+        if circuit_breaker is None:
+            _ = await self.client.rate_limiter.acquire_async(deadline=deadline)
+            return await self.__send_with_retries(request, deadline=deadline)
+
+        circuit_breaker.before_request(request.url)
+
+        try:
+            _ = await self.client.rate_limiter.acquire_async(deadline=deadline)
+        except BaseException:
+            # the request is not sent, so it says nothing about the endpoint
+            circuit_breaker.cancel_request(request.url)
+            raise
+
+        try:
+            response = await self.__send_with_retries(
+                request,
+                deadline=deadline,
+            )
+        except asyncio.CancelledError:
+            circuit_breaker.cancel_request(request.url)
+            raise
+        except Exception:
+            circuit_breaker.record_failure(request.url)
+            raise
+
+        circuit_breaker.record_response(request.url, response)
+
+        return response
+
+    async def __send_with_retries(
+        self,
+        request: PreparedRequest,
+        deadline: Deadline | None=None,
+    ) -> Response:
+        """Send a request, and retry it with the same backoff, status codes \
+        and ``Retry-After`` handling as the blocking client, but without \
+        blocking the event loop while it waits.
+
+        :param request: The request to send.
+        :type request: PreparedRequest
+
+        :param deadline: Deadline of the request. Every attempt times out at \
+            it, and no attempt is retried after it. Defaults to None.
+        :type deadline: Deadline or None
+
+        :raises RequestException: Error occurred while sending the request, \
+            and it cannot be retried.
+
+        :return: The last response. Its status code may be an error.
+        :rtype: Response
+        """
+        retries = DeadlineRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            raise_on_status=False,
+        )
+
+        while True:
+            try:
+                async with asyncio.timeout(
+                    None if deadline is None \
+                        else max(deadline.remaining, MIN_TIMEOUT),
+                ):
+                    response = await self.__send_attempt(request)
+            except (httpx.TransportError, TimeoutError) as e:
+                error = _request_exception(e, request)
+                # the deadline is entered only while the retry is counted, so
+                # that it does not apply to other tasks
+                with nullcontext() if deadline is None else deadline:
+                    try:
+                        retries = retries.increment(
+                            'GET',
+                            request.url,
+                            error=error,
+                        )
+                    except MaxRetryError:
+                        raise error from e
+                    wait = retries.get_backoff_time()
+            else:
+                if not retries.is_retry(
+                    'GET',
+                    response.status_code,
+                    has_retry_after='Retry-After' in response.headers,
+                ):
+                    return response
+
+                with nullcontext() if deadline is None else deadline:
+                    try:
+                        retries = retries.increment(
+                            'GET',
+                            request.url,
+                            response=response.raw,
+                        )
+                    except MaxRetryError:
+                        # the last failed response is returned instead of
+                        # raised, so that its status code is recorded
+                        return response
+                    wait = retries.get_retry_after(response.raw)
+                    if wait is None:
+                        wait = retries.get_backoff_time()
+
+                response.close()
+
+            await asyncio.sleep(wait)
+
+    async def __send_attempt(self, request: PreparedRequest) -> Response:
+        """Send one attempt of a request, and read its response body.
+
+        :param request: The request to send.
+        :type request: PreparedRequest
+
+        :raises httpx.TransportError: Error occurred while sending the \
+            request.
+
+        :return: The response, as if it was received by the blocking \
+            client's session.
+        :rtype: Response
+        """
+        start = perf_counter()
+        http_response = await self.http_client.send(
+            self.http_client.build_request(
+                'GET',
+                request.url,
+                headers=dict(request.headers),
+                timeout=self.__timeout(),
+            ),
+            stream=True,
+        )
+        # like requests, the time until the headers are received
+        elapsed = timedelta(seconds=perf_counter() - start)
+        headers = http_response.headers.multi_items()
+        try:
+            if http_response.is_stream_consumed:
+                # the transport, e.g. httpx.MockTransport, has read and
+                # decoded the body already
+                body = http_response.content
+                headers = [
+                    (k, v) for k, v in headers
+                    if k.lower() != 'content-encoding'
+                ]
+            else:
+                # the body is kept encoded, so that it is decoded in the same
+                # way as a response of the blocking client
+                body = b''.join([
+                    chunk async for chunk in http_response.aiter_raw()
+                ])
+        finally:
+            await http_response.aclose()
+
+        response = self.client.session.get_adapter(request.url).build_response(
+            request,
+            HTTPResponse(
+                body=BytesIO(body),
+                headers=headers,
+                status=http_response.status_code,
+                reason=http_response.reason_phrase,
+                preload_content=False,
+                request_url=request.url,
+            ),
+        )
+        response.elapsed = elapsed
+
+        return response
+
+    @typechecked
+    def __timeout(self) -> httpx.Timeout:
+        """Return the timeout of the blocking client's ``connection`` as an \
+        ``httpx`` timeout, which waits for a connection for as long as it \
+        takes.
+
+        :return: The timeout.
+        :rtype: httpx.Timeout
+        """
+        timeout = self.client.connection.timeout
+        connect, read = timeout if isinstance(timeout, tuple) \
+            else (timeout, timeout)
+
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=None)
+
+    @typechecked
+    async def __get_deadline_fallback(
+        self,
+        url: Url,
+        params: dict,
+        deadline: Deadline | None,
+    ) -> Any:
+        """Get the cached response of a request that did not finish before \
+        its deadline, even if it has expired, if ``deadline_fallback`` is \
+        True. The deadline is marked as missed either way.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request.
+        :type params: dict
+
+        :param deadline: The deadline that was missed.
+        :type deadline: Deadline or None
+
+        :raises DeadlineExceededError: ``deadline_fallback`` is False, or the \
+            response is not cached.
+
+        :return: The cached response.
+        :rtype: CachedResponse
+        """
+        if deadline is not None:
+            deadline.is_missed = True
+
+        error = DeadlineExceededError(
+            'Request did not finish before its deadline.',
+            errors=[url],
+        )
+        if not self.client.resilience.deadline_fallback:
+            raise error
+
+        return await self.__get_expired_response(url, params, error)
+
+    @typechecked
+    async def __get_expired_response(
+        self,
+        url: Url,
+        params: dict,
+        error: APIError,
+    ) -> Any:
+        """Get the cached response of a request that cannot be sent, even if \
+        the response has expired.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request.
+        :type params: dict
+
+        :param error: Error to raise if the response is not cached.
+        :type error: APIError
+
+        :raises APIError: The response is not cached.
+
+        :return: The cached response.
+        :rtype: CachedResponse
+        """
+        response = await self.__call_cache_backend(
+            self.client.get_cached_response,
+            url,
+            params=params,
+        )
+
+        if response is None:
+            raise error
+
+        return response
+
+_refresh_cache_durations: ContextVar[dict[int, list[int]]] = ContextVar(
+    '_refresh_cache_durations',
+    default={},
+)
+"""Cache durations of the requests that are made in ``force_refresh()``, by \
+the ID of the asyncio client."""
+
+class _Request(BaseException):
+    """Request that a method of a blocking client is about to send, which is \
+    raised by ``_RecordingClient`` instead of sending it.
+
+    It is not an ``Exception``, so that the method cannot catch it.
+
+    :param name: Name of the method that sends the request, e.g. \
+        ``send_request``.
+    :type name: str
+
+    :param args: Positional arguments of the method.
+    :type args: tuple
+
+    :param kwargs: Keyword arguments of the method.
+    :type kwargs: dict
+    """
+
+    def __init__(self, name: str, args: tuple, kwargs: dict) -> None:
+        """Constructor method"""
+        super().__init__(name)
+        self.name = name
+        self.request_args = args
+        self.request_kwargs = kwargs
+
+class _RecordingClient:
+    """Stand-in for a blocking client, which a blocking client's method is \
+    called on to check its arguments and build its requests without sending \
+    them.
+
+    The first request that is not in ``responses`` is raised as a \
+    ``_Request``. The other attributes are the blocking client's.
+
+    :param client: The blocking client.
+    :type client: LandTransportSg
+
+    :param responses: Results of the requests that the method sent before, \
+        in order.
+    :type responses: list
+    """
+
+    def __init__(self, client: LandTransportSg, responses: list) -> None:
+        """Constructor method"""
+        self.__client = client
+        self.__responses = iter(responses)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the blocking client."""
+        return getattr(self.__client, name)
+
+    def send_request(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the result of the request, or raise it if it has not been \
+        sent."""
+        return self.__replay('send_request', args, kwargs)
+
+    def send_download_request(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the download link of the request, or raise the request if \
+        it has not been sent."""
+        return self.__replay('send_download_request', args, kwargs)
+
+    def iter_request(self, *args: Any, **kwargs: Any) -> Any:
+        """Raise the request."""
+        raise _Request('iter_request', args, kwargs)
+
+    def iter_records(self, *args: Any, **kwargs: Any) -> Any:
+        """Raise the request."""
+        raise _Request('iter_records', args, kwargs)
+
+# private
+
+    def __replay(self, name: str, args: tuple, kwargs: dict) -> Any:
+        """Return the result of the next request that was sent before, or \
+        raise the request if it has not been sent.
+
+        :param name: Name of the method that sends the request.
+        :type name: str
+
+        :param args: Positional arguments of the method.
+        :type args: tuple
+
+        :param kwargs: Keyword arguments of the method.
+        :type kwargs: dict
+
+        :raises _Request: The request has not been sent.
+
+        :return: Result of the request.
+        :rtype: Any
+        """
+        try:
+            return next(self.__responses)
+        except StopIteration:
+            raise _Request(name, args, kwargs) from None
+
+def _request_exception(
+    error: Exception,
+    request: PreparedRequest | None=None,
+) -> RequestException:
+    """Convert an error of ``httpx``, or an attempt that timed out at its \
+    deadline, to the error that the blocking client would raise.
+
+    :param error: The error.
+    :type error: Exception
+
+    :param request: The request that failed. Defaults to None.
+    :type request: PreparedRequest or None
+
+    :return: The converted error.
+    :rtype: RequestException
+    """
+    message = str(error) or 'Request timed out.'
+
+    if isinstance(error, httpx.ConnectTimeout):
+        return ConnectTimeout(message, request=request)
+    if isinstance(error, (httpx.TimeoutException, TimeoutError)):
+        return ReadTimeout(message, request=request)
+
+    return RequestsConnectionError(message, request=request)
+
+def _cancel_tasks(tasks: list[asyncio.Task]) -> None:
+    """Cancel the tasks that have not finished, and retrieve the exceptions \
+    of those that have, so that they are not reported as unhandled.
+
+    :param tasks: The tasks.
+    :type tasks: list[asyncio.Task]
+    """
+    for task in tasks:
+        if not task.done():
+            _ = task.cancel()
+        elif not task.cancelled():
+            _ = task.exception()
+
+def _async_method(method: Callable) -> Callable:
+    """Create a coroutine method that runs a blocking client's method on a \
+    ``_RecordingClient``, and sends the requests that it raises with the \
+    asyncio client.
+
+    The blocking method is run again with the result of each request, until \
+    it returns, so that it can send several requests and use their results.
+
+    :param method: The blocking client's method.
+    :type method: Callable
+
+    :return: The coroutine method, or asynchronous generator method if the \
+        blocking method is a generator.
+    :rtype: Callable
+    """
+    if isgeneratorfunction(method):
+        @wraps(method)
+        async def async_generator_method(
+            self: AsyncLandTransportSg,
+            *args: Any,
+            **kwargs: Any,
+        ) -> AsyncIterator[Any]:
+            iterator = method(
+                _RecordingClient(self.client, []),
+                *args,
+                **kwargs,
+            )
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            except _Request as request:
+                async for item in getattr(self, request.name)(
+                    *request.request_args,
+                    **request.request_kwargs,
+                ):
+                    yield item
+                return
+
+            # the iterator does not send requests
+            yield item
+            for item in iterator:
+                yield item
+
+        return async_generator_method
+
+    @wraps(method)
+    async def async_method(
+        self: AsyncLandTransportSg,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        responses: list = []
+        while True:
+            try:
+                return method(
+                    _RecordingClient(self.client, responses),
+                    *args,
+                    **kwargs,
+                )
+            except _Request as request:
+                responses.append(await getattr(self, request.name)(
+                    *request.request_args,
+                    **request.request_kwargs,
+                ))
+
+    return async_method
+
+def _add_async_methods(cls: type[AsyncLandTransportSg]) -> None:
+    """Add a coroutine method to an asyncio client for every public method \
+    of its blocking client, unless the asyncio client or its base classes \
+    have it already, e.g. ``send_request()``.
+
+    :param cls: The asyncio client.
+    :type cls: type[AsyncLandTransportSg]
+    """
+    for name in dir(cls.client_class):
+        if name.startswith('_') or hasattr(cls, name):
+            continue
+
+        method = getattr(cls.client_class, name)
+        if callable(method):
+            setattr(cls, name, _async_method(method))
+
+_add_async_methods(AsyncLandTransportSg)
+
+class AsyncActiveMobility(AsyncLandTransportSg):
+    """Asyncio counterpart of ``ActiveMobility``."""
+
+    client_class = ActiveMobility
+
+class AsyncElectricVehicle(AsyncLandTransportSg):
+    """Asyncio counterpart of ``ElectricVehicle``."""
+
+    client_class = ElectricVehicle
+
+class AsyncGeospatial(AsyncLandTransportSg):
+    """Asyncio counterpart of ``Geospatial``."""
+
+    client_class = Geospatial
+
+class AsyncPublicTransport(AsyncLandTransportSg):
+    """Asyncio counterpart of ``PublicTransport``."""
+
+    client_class = PublicTransport
+
+    @typechecked
+    async def bus_arrivals(
+        self,
+        bus_stop_codes: list[str],
+        service_number: str | None=None,
+        max_workers: int=BUS_ARRIVALS_MAX_WORKERS,
+        deadline: float | None=None,
+    ) -> dict[str, BusArrivalDict | Exception]:
+        """Get real-time Bus Arrival information at several Bus Stops at \
+        once.
+
+        The bus stops are requested concurrently with ``bus_arrival()`` in \
+            the event loop. A bus stop whose request fails does not stop the \
+            others, and its exception is returned in place of its bus \
+            arrival information.
+
+        :param bus_stop_codes: Bus stop reference codes. Duplicate codes are \
+            requested once.
+        :type bus_stop_codes: list[str]
+
+        :param service_number: Bus service number to get at every bus stop. \
+            Defaults to None, i.e. all bus services.
+        :type service_number: str or None
+
+        :param max_workers: Maximum number of bus stops to request at the \
+            same time. Defaults to 8.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each bus stop \
+            may take, instead of the client's ``resilience.deadline``. \
+            Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: A bus stop code is not exactly 5 characters long.
+        :raises ValueError: A bus stop code is not a number-like string.
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Information about bus arrival, or the exception that was \
+            raised while getting it, by bus stop code in the order of \
+            ``bus_stop_codes``.
+        :rtype: dict[str, BusArrivalDict | Exception]
+        """
+        kwargs: dict[str, str] = {}
+        if service_number is not None:
+            kwargs['service_number'] = service_number
+
+        # every bus stop code is checked before any bus stop is requested
+        for bus_stop_code in bus_stop_codes:
+            try:
+                _ = PublicTransport.bus_arrival(
+                    _RecordingClient(self.client, []),
+                    bus_stop_code=bus_stop_code,
+                    **kwargs,
+                )
+            except _Request:
+                pass
+
+        bus_arrivals: dict[str, BusArrivalDict | Exception]
+
+        bus_arrivals = await map_concurrently_async(
+            lambda bus_stop_code: self.bus_arrival(
+                deadline=deadline,
+                bus_stop_code=bus_stop_code,
+                **kwargs,
+            ),
+            bus_stop_codes,
+            max_workers=max_workers,
+        )
+
+        return bus_arrivals
+
+    @typechecked
+    async def station_crowd_density_real_time_all(
+        self,
+        max_workers: int=len(TRAIN_LINES),
+        deadline: float | None=None,
+    ) -> StationCrowdDensityRealTimeAllDict:
+        """Get real-time MRT/LRT station crowdedness level of every train \
+        network line.
+
+        The train network lines are requested concurrently in the event \
+            loop. A train network line that fails does not stop the others, \
+            and its exception is returned in ``errors``.
+
+        :param max_workers: Maximum number of train network lines to request \
+            at the same time. Defaults to the number of train network lines.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each train \
+            network line may take, instead of the client's \
+            ``resilience.deadline``. Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Station crowdedness level by station code, and the error of \
+            each train network line that failed.
+        :rtype: StationCrowdDensityRealTimeAllDict
+        """
+        results = await map_concurrently_async(
+            lambda train_line: self.station_crowd_density_real_time(
+                deadline=deadline,
+                train_line=train_line,
+            ),
+            TRAIN_LINES,
+            max_workers=max_workers,
+        )
+
+        return merge_station_crowd_density_real_time(results)
+
+    @typechecked
+    async def station_crowd_density_forecast_all(
+        self,
+        max_workers: int=len(TRAIN_LINES),
+        deadline: float | None=None,
+    ) -> StationCrowdDensityForecastAllDict:
+        """Get forecasted MRT/LRT station crowdedness level of every train \
+        network line at 30 minutes interval.
+
+        The train network lines are requested concurrently in the event \
+            loop. A train network line that fails does not stop the others, \
+            and its exception is returned in ``errors``. Every forecasted \
+            date of a station is kept, in the order that it was received.
+
+        :param max_workers: Maximum number of train network lines to request \
+            at the same time. Defaults to the number of train network lines.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each train \
+            network line may take, instead of the client's \
+            ``resilience.deadline``. Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Forecasted station crowdedness level of each date by station \
+            code, and the error of each train network line that failed.
+        :rtype: StationCrowdDensityForecastAllDict
+        """
+        results = await map_concurrently_async(
+            lambda train_line: self.station_crowd_density_forecast(
+                deadline=deadline,
+                train_line=train_line,
+            ),
+            TRAIN_LINES,
+            max_workers=max_workers,
+        )
+
+        return merge_station_crowd_density_forecast(results)
+
+class AsyncTraffic(AsyncLandTransportSg):
+    """Asyncio counterpart of ``Traffic``."""
+
+    client_class = Traffic
+
+__all__ = [
+    'AsyncLandTransportSg',
+    'AsyncActiveMobility',
+    'AsyncElectricVehicle',
+    'AsyncGeospatial',
+    'AsyncPublicTransport',
+    'AsyncTraffic',
+]
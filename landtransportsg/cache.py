@@ -0,0 +1,515 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process caches that sit in front of the requests cache."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime
+from sqlite3 import OperationalError
+from threading import Lock
+from time import monotonic, time
+from typing import Any
+
+from requests import Response
+from requests_cache import CachedResponse
+# imported from its own module, as requests_cache.SQLiteCache falls back to a
+# placeholder class that pylint cannot see the members of
+from requests_cache.backends.sqlite import SQLiteCache
+from typeguard import typechecked
+
+from .constants import (
+    CACHE_MAINTENANCE_INTERVAL,
+    CACHE_MAX_ENTRIES,
+    CACHE_NAME,
+)
+from .types import CacheInfoDict
+
+class ResponseMemo:
+    """Bounded memo of sanitised response values, so that a response that \
+    is served from the requests cache is not decoded and sanitised again.
+
+    Values are keyed by the identity of the cached response, i.e. its cache \
+        key and creation time, so a memoised value is never used after the \
+        cached response is refreshed. When the memo is full, the least \
+        recently used value is discarded.
+
+    Values are copied when they are stored and when they are returned, so \
+        callers are free to modify them.
+
+    :param maxsize: Maximum number of values to keep. Defaults to 128.
+    :type maxsize: int
+
+    :raises ValueError: maxsize is less than 1.
+    """
+
+    @typechecked
+    def __init__(self, maxsize: int=128) -> None:
+        """Constructor method"""
+        if maxsize < 1:
+            raise ValueError('Argument "maxsize" cannot be less than 1.')
+
+        self.maxsize = maxsize
+
+        self.__values: OrderedDict[Hashable, Any] = OrderedDict()
+        self.__lock = Lock()
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(maxsize={self.maxsize}, ' \
+            f'size={len(self)})'
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of values in the memo."""
+        return len(self.__values)
+
+    @typechecked
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of a memoised value.
+
+        :param key: Key of the value.
+        :type key: Hashable
+
+        :raises KeyError: The value is not in the memo.
+
+        :return: Copy of the value.
+        :rtype: Any
+        """
+        with self.__lock:
+            value = self.__values[key]
+            self.__values.move_to_end(key)
+
+        return copy_value(value)
+
+    @typechecked
+    def set(self, key: Hashable, value: Any) -> None:
+        """Memoise a copy of a value.
+
+        :param key: Key of the value.
+        :type key: Hashable
+
+        :param value: The value.
+        :type value: Any
+        """
+        value = copy_value(value)
+
+        with self.__lock:
+            self.__values[key] = value
+            self.__values.move_to_end(key)
+            while len(self.__values) > self.maxsize:
+                _ = self.__values.popitem(last=False)
+
+    @typechecked
+    def clear(self) -> None:
+        """Remove all values from the memo."""
+        with self.__lock:
+            self.__values.clear()
+
+class MemoryCache:
+    """Bounded in-memory cache of sanitised response values, which sits in \
+    front of the requests cache.
+
+    A value that is found here is returned without reading the requests \
+        cache's backend, e.g. SQLite, or deserialising the cached response. \
+        Each value expires after its own time-to-live, which is the cache \
+        duration of the request that fetched it. When the cache is full, the \
+        least recently used value is discarded.
+
+    Values are copied when they are stored and when they are returned, so \
+        callers are free to modify them.
+
+    :param maxsize: Maximum number of values to keep. Defaults to 256.
+    :type maxsize: int
+
+    :raises ValueError: maxsize is less than 1.
+    """
+
+    @typechecked
+    def __init__(self, maxsize: int=256) -> None:
+        """Constructor method"""
+        if maxsize < 1:
+            raise ValueError('Argument "maxsize" cannot be less than 1.')
+
+        self.maxsize = maxsize
+
+        self.hits: int = 0
+        """Number of lookups that found a value."""
+        self.misses: int = 0
+        """Number of lookups that did not find a value, or found an \
+        expired value."""
+
+        self.__values: OrderedDict[Hashable, tuple[float, Any]] = \
+            OrderedDict()
+        self.__lock = Lock()
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(maxsize={self.maxsize}, ' \
+            f'size={len(self)}, hits={self.hits}, misses={self.misses})'
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of values in the cache, including expired values that \
+        have not been discarded yet."""
+        return len(self.__values)
+
+    @typechecked
+    def get(self, key: Hashable) -> Any:
+        """Return a copy of a cached value that has not expired.
+
+        :param key: Key of the value.
+        :type key: Hashable
+
+        :raises KeyError: The value is not in the cache, or it has expired.
+
+        :return: Copy of the value.
+        :rtype: Any
+        """
+        with self.__lock:
+            expires_at, value = self.__values.get(key, (0.0, None))
+            if expires_at <= monotonic():
+                self.misses += 1
+                _ = self.__values.pop(key, None)
+                raise KeyError(key)
+
+            self.hits += 1
+            self.__values.move_to_end(key)
+
+        return copy_value(value)
+
+    @typechecked
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Cache a copy of a value.
+
+        :param key: Key of the value.
+        :type key: Hashable
+
+        :param value: The value.
+        :type value: Any
+
+        :param ttl: Number of seconds before the value expires. If it is 0 \
+            or less, then the value is not cached.
+        :type ttl: float
+        """
+        if ttl <= 0:
+            return
+
+        value = copy_value(value)
+
+        with self.__lock:
+            self.__values[key] = (monotonic() + ttl, value)
+            self.__values.move_to_end(key)
+            while len(self.__values) > self.maxsize:
+                _ = self.__values.popitem(last=False)
+
+    @typechecked
+    def clear(self) -> None:
+        """Remove all values from the cache, and reset the statistics."""
+        with self.__lock:
+            self.__values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @typechecked
+    def cache_info(self) -> CacheInfoDict:
+        """Return the statistics of the cache.
+
+        :return: Number of hits and misses, and the current and maximum \
+            number of values.
+        :rtype: CacheInfoDict
+        """
+        with self.__lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.__values),
+                'maxsize': self.maxsize,
+            }
+
+class BoundedSQLiteCache(SQLiteCache):
+    """SQLite cache backend that keeps its size in check.
+
+    Every ``maintenance_interval`` responses that are saved, the cache is \
+        maintained:
+
+    - Expired responses are deleted, after ``keep_expired`` seconds.
+    - If there are more than ``max_entries`` responses, or if they take up \
+        more than ``max_bytes`` bytes, then the least recently used \
+        responses are deleted until they fit.
+
+    Write-ahead logging (WAL) is used by default, so that reading from the \
+        cache is not blocked by writing to it.
+
+    Pass ``cache_backend='bounded_sqlite'`` to a client to use this backend \
+        with the package's cache name and default limits, or pass an \
+        instance of it to change the limits.
+
+    :param db_path: Path of the database file. Defaults to the package's \
+        cache name.
+    :type db_path: str
+
+    :param max_entries: Maximum number of responses to keep. Defaults to \
+        10000. Set to None for no limit.
+    :type max_entries: int or None
+
+    :param max_bytes: Maximum total size of the responses to keep, in \
+        bytes. Defaults to None, i.e. no limit.
+    :type max_bytes: int or None
+
+    :param keep_expired: Number of seconds to keep responses after they \
+        expire, e.g. to serve them with ``stale_while_revalidate``. Defaults \
+        to 0.
+    :type keep_expired: int
+
+    :param maintenance_interval: Number of responses to save between each \
+        maintenance. Defaults to 100.
+    :type maintenance_interval: int
+
+    :param kwargs: Other arguments of ``requests_cache.SQLiteCache``.
+    :type kwargs: Any
+
+    :raises ValueError: max_entries or max_bytes is less than 1.
+    :raises ValueError: keep_expired is less than 0.
+    :raises ValueError: maintenance_interval is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        db_path: str=CACHE_NAME,
+        max_entries: int | None=CACHE_MAX_ENTRIES,
+        max_bytes: int | None=None,
+        keep_expired: int=0,
+        maintenance_interval: int=CACHE_MAINTENANCE_INTERVAL,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor method"""
+        if max_entries is not None and max_entries < 1:
+            raise ValueError('Argument "max_entries" cannot be less than 1.')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('Argument "max_bytes" cannot be less than 1.')
+        if keep_expired < 0:
+            raise ValueError('Argument "keep_expired" cannot be less than 0.')
+        if maintenance_interval < 1:
+            raise ValueError(
+                'Argument "maintenance_interval" cannot be less than 1.'
+            )
+
+        kwargs.setdefault('wal', True)
+        super().__init__(db_path, **kwargs)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.keep_expired = keep_expired
+        self.maintenance_interval = maintenance_interval
+
+        self.__accessed: dict[str, float] = {}
+        self.__saves = 0
+        self.__lock = Lock()
+
+        self.__init_accessed_column()
+
+    @typechecked
+    def get_response(
+        self,
+        key: str,
+        default: Any=None,
+    ) -> CachedResponse | Any:
+        """Retrieve a response from the cache, and record when it was used.
+
+        :param key: Cache key of the response.
+        :type key: str
+
+        :param default: Value to return if the response is not in the \
+            cache. Defaults to None.
+        :type default: Any
+
+        :return: The cached response, or the default value.
+        :rtype: CachedResponse or Any
+        """
+        response = super().get_response(key, default=default)
+
+        if response is not default:
+            # written to the database during the next maintenance, so that
+            # reading from the cache does not need a write
+            with self.__lock:
+                self.__accessed[key] = time()
+
+        return response
+
+    @typechecked
+    def save_response(
+        self,
+        response: Response,
+        cache_key: str | None=None,
+        expires: datetime | None=None,
+    ) -> None:
+        """Save a response to the cache, and maintain the cache if it is due.
+
+        :param response: The response to save.
+        :type response: Response
+
+        :param cache_key: Cache key of the response. Defaults to None, i.e. \
+            create it from the response's request.
+        :type cache_key: str or None
+
+        :param expires: When the response expires. Defaults to None.
+        :type expires: datetime or None
+        """
+        cache_key = cache_key or self.create_key(response.request)
+        super().save_response(response, cache_key=cache_key, expires=expires)
+
+        with self.__lock:
+            self.__accessed[cache_key] = time()
+            self.__saves += 1
+            is_due = self.__saves % self.maintenance_interval == 0
+
+        if is_due:
+            _ = self.maintain()
+
+    @typechecked
+    def maintain(self) -> int:
+        """Delete the expired responses, and then the least recently used \
+        responses until the cache is within its limits.
+
+        :return: Number of responses that were deleted.
+        :rtype: int
+        """
+        with self.__lock:
+            accessed = self.__accessed
+            self.__accessed = {}
+
+        table_name = self.responses.table_name
+
+        with self.responses.connection(commit=True) as con:
+            con.executemany(
+                f'UPDATE {table_name} SET accessed = ? WHERE key = ?',
+                [(v, k) for k, v in accessed.items()],
+            )
+
+            deleted = con.execute(
+                f'DELETE FROM {table_name} WHERE expires <= ?',
+                (round(time()) - self.keep_expired,),
+            ).rowcount
+
+            lru_keys = []
+            if self.max_entries is not None or self.max_bytes is not None:
+                count, size = con.execute(
+                    'SELECT COUNT(key), COALESCE(SUM(LENGTH(value)), 0) '
+                    f'FROM {table_name}',
+                ).fetchone()
+                # one pass from the least recently used response, which stops
+                # as soon as the responses that are left fit both limits
+                for key, value_size in con.execute(
+                    f'SELECT key, LENGTH(value) FROM {table_name} '
+                    'ORDER BY COALESCE(accessed, 0) ASC',
+                ):
+                    if (self.max_entries is None \
+                        or count <= self.max_entries) \
+                        and (self.max_bytes is None or size <= self.max_bytes):
+                        break
+                    lru_keys.append(key)
+                    count -= 1
+                    size -= value_size or 0
+
+        self.responses.bulk_delete(lru_keys)
+        deleted += len(lru_keys)
+
+        self._prune_redirects()
+
+        return deleted
+
+    @typechecked
+    def clear(self) -> None:
+        """Delete all responses from the cache."""
+        super().clear()
+
+        with self.__lock:
+            self.__accessed = {}
+
+        self.__init_accessed_column()
+
+# private
+
+    @typechecked
+    def __init_accessed_column(self) -> None:
+        """Add the column for when each response was last used, if the \
+        responses table does not have it yet."""
+        table_name = self.responses.table_name
+
+        with self.responses.connection(commit=True) as con:
+            try:
+                con.execute(
+                    f'ALTER TABLE {table_name} ADD COLUMN accessed REAL',
+                )
+            except OperationalError:
+                pass
+
+            con.execute(
+                'CREATE INDEX IF NOT EXISTS accessed_idx ' \
+                    f'ON {table_name}(accessed)',
+            )
+
+@typechecked
+def canonical_params(params: dict | None) -> tuple:
+    """Return the parameters of a request in a hashable form that does not \
+    depend on their order.
+
+    :param params: List of parameters to be passed to the endpoint URL.
+    :type params: dict or None
+
+    :return: The parameters as sorted ``(name, value)`` pairs.
+    :rtype: tuple
+    """
+    if params is None:
+        return ()
+
+    return tuple(sorted(
+        (str(k), tuple(v) if isinstance(v, list) else v) \
+            for k, v in params.items()
+    ))
+
+@typechecked
+def copy_value(value: Any) -> Any:
+    """Copy the lists and dicts in a sanitised value.
+
+    Sanitised values only contain lists, dicts and immutable objects, e.g. \
+        strings, numbers, tuples and dates, so this is a much cheaper \
+        alternative to ``copy.deepcopy()``.
+
+    :param value: The value to copy.
+    :type value: Any
+
+    :return: The copied value.
+    :rtype: Any
+    """
+    if isinstance(value, list):
+        return [copy_value(v) for v in value]
+
+    if isinstance(value, dict):
+        return {k: copy_value(v) for k, v in value.items()}
+
+    return value
+
+__all__ = [
+    'BoundedSQLiteCache',
+    'MemoryCache',
+    'ResponseMemo',
+
+    'canonical_params',
+    'copy_value',
+]
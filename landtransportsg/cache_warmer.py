@@ -0,0 +1,329 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keep the cache of client methods warm by refreshing it before it expires."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from math import inf
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Any
+
+from typeguard import typechecked
+
+from .constants import NAME
+from .landtransportsg import LandTransportSg
+
+class CacheWarmerJob:
+    """Client method that is refreshed by a ``CacheWarmer``.
+
+    :param method: Method of a client, e.g. ``client.bus_stops``.
+    :type method: Callable[..., Any]
+
+    :param args: Positional arguments of the method.
+    :type args: tuple
+
+    :param kwargs: Keyword arguments of the method.
+    :type kwargs: dict
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        """Constructor method"""
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+
+        self.cache_duration: int | None = None
+        """Shortest cache duration of the requests that the method sends, \
+        or None if the method has not been refreshed yet."""
+        self.next_refresh: float = 0.0
+        """Time, as returned by ``time.monotonic()``, when the method is \
+        refreshed next."""
+        self.refreshes: int = 0
+        """Number of times that the method has been refreshed."""
+        self.last_error: Exception | None = None
+        """Error that was raised by the last refresh, if any."""
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({self.method.__qualname__}, ' \
+            f'cache_duration={self.cache_duration}, ' \
+            f'refreshes={self.refreshes})'
+
+class CacheWarmer:
+    """Scheduler that refreshes the cache of client methods shortly before \
+    it expires, so that other calls of those methods are served from a warm \
+    cache.
+
+    Each method is called once to find the cache duration of the requests \
+        that it sends, e.g. ``CACHE_ONE_MINUTE`` for \
+        ``PublicTransport.taxi_availability()``. It is then called again \
+        ``lead_time`` seconds before every expiry.
+
+    The warmer can run in a background thread with ``start()``, or block \
+        the current thread with ``run_forever()``, e.g. in a separate worker \
+        process that shares the cache backend.
+
+    Example usage:
+
+    .. code-block:: python
+
+        client = PublicTransport(account_key)
+
+        warmer = CacheWarmer()
+        warmer.add(client.taxi_availability)
+        warmer.add(client.bus_arrival, bus_stop_code='83139')
+
+        with warmer:
+            ...  # the cache is refreshed in the background
+
+    :param lead_time: Number of seconds before a cache expires to refresh \
+        it. Defaults to 5. If it is not shorter than a cache duration, then \
+        that cache is refreshed halfway through its duration.
+    :type lead_time: float
+
+    :param retry_interval: Number of seconds to wait before refreshing a \
+        method again after it fails. Defaults to 30.
+    :type retry_interval: float
+
+    :param max_workers: Maximum number of methods to refresh at the same \
+        time. Defaults to 4.
+    :type max_workers: int
+
+    :raises ValueError: lead_time is less than 0.
+    :raises ValueError: retry_interval is not more than 0.
+    :raises ValueError: max_workers is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        lead_time: float=5,
+        retry_interval: float=30,
+        max_workers: int=4,
+    ) -> None:
+        """Constructor method"""
+        if lead_time < 0:
+            raise ValueError('Argument "lead_time" cannot be less than 0.')
+        if retry_interval <= 0:
+            raise ValueError(
+                'Argument "retry_interval" must be more than 0.'
+            )
+        if max_workers < 1:
+            raise ValueError('Argument "max_workers" cannot be less than 1.')
+
+        self.lead_time = lead_time
+        self.retry_interval = retry_interval
+        self.max_workers = max_workers
+
+        self.jobs: list[CacheWarmerJob] = []
+        """Methods that are refreshed."""
+
+        self.__lock = Lock()
+        self.__wakeup = Event()
+        self.__stop = Event()
+        self.__thread: Thread | None = None
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(jobs={len(self.jobs)}, ' \
+            f'is_running={self.is_running})'
+
+    @typechecked
+    def __enter__(self) -> 'CacheWarmer':
+        """Start refreshing in a background thread."""
+        self.start()
+        return self
+
+    @typechecked
+    def __exit__(self, *args: Any) -> None:
+        """Stop refreshing."""
+        self.stop()
+
+    @property
+    @typechecked
+    def is_running(self) -> bool:
+        """True if the warmer is running in a background thread."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @typechecked
+    def add(
+        self,
+        method: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> CacheWarmerJob:
+        """Add a client method to refresh. It is first refreshed the next \
+        time that the warmer runs.
+
+        :param method: Method of a client, e.g. ``client.bus_stops``.
+        :type method: Callable[..., Any]
+
+        :param args: Positional arguments of the method.
+        :type args: Any
+
+        :param kwargs: Keyword arguments of the method.
+        :type kwargs: Any
+
+        :raises ValueError: method is not a method of a client.
+
+        :return: The job that refreshes the method.
+        :rtype: CacheWarmerJob
+        """
+        if not isinstance(getattr(method, '__self__', None), LandTransportSg):
+            raise ValueError(
+                'Argument "method" must be a method of a client.'
+            )
+
+        job = CacheWarmerJob(method, args, kwargs)
+
+        with self.__lock:
+            self.jobs.append(job)
+
+        self.__wakeup.set()
+
+        return job
+
+    @typechecked
+    def run_pending(self) -> int:
+        """Refresh the methods that are due to be refreshed.
+
+        :return: Number of methods that were refreshed successfully.
+        :rtype: int
+        """
+        now = monotonic()
+        with self.__lock:
+            due_jobs = [j for j in self.jobs if j.next_refresh <= now]
+
+        if len(due_jobs) == 0:
+            return 0
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(due_jobs)),
+            thread_name_prefix=NAME,
+        ) as executor:
+            results = list(executor.map(self.__refresh, due_jobs))
+
+        return sum(results)
+
+    @typechecked
+    def run_forever(self) -> None:
+        """Refresh the methods when they are due, until ``stop()`` is called \
+        from another thread."""
+        self.__stop.clear()
+
+        while not self.__stop.is_set():
+            self.__wakeup.clear()
+            _ = self.run_pending()
+
+            with self.__lock:
+                next_refresh = min(
+                    (j.next_refresh for j in self.jobs),
+                    default=inf,
+                )
+
+            timeout = max(next_refresh - monotonic(), 0)
+            _ = self.__wakeup.wait(
+                timeout=None if timeout == inf else timeout,
+            )
+
+    @typechecked
+    def start(self) -> None:
+        """Run the warmer in a background thread.
+
+        :raises RuntimeError: The warmer is already running.
+        """
+        if self.is_running:
+            raise RuntimeError('Cache warmer is already running.')
+
+        self.__stop.clear()
+        self.__thread = Thread(
+            target=self.run_forever,
+            name=f'{NAME}_cache_warmer',
+            daemon=True,
+        )
+        self.__thread.start()
+
+    @typechecked
+    def stop(self, timeout: float | None=None) -> None:
+        """Stop the warmer after the methods that are being refreshed are \
+        done.
+
+        :param timeout: Number of seconds to wait for the background thread \
+            to stop. Defaults to None, i.e. wait until it stops.
+        :type timeout: float or None
+        """
+        self.__stop.set()
+        self.__wakeup.set()
+
+        if self.__thread is not None:
+            self.__thread.join(timeout=timeout)
+            self.__thread = None
+
+# private
+
+    @typechecked
+    def __refresh(self, job: CacheWarmerJob) -> bool:
+        """Call a job's method with cached responses ignored, and schedule \
+        its next refresh.
+
+        :param job: The job to refresh.
+        :type job: CacheWarmerJob
+
+        :return: True if the method was refreshed successfully.
+        :rtype: bool
+        """
+        client = job.method.__self__
+
+        try:
+            # pylint: disable=broad-exception-caught
+            with client.force_refresh() as cache_durations:
+                _ = job.method(*job.args, **job.kwargs)
+        except Exception as e:
+            job.last_error = e
+            job.next_refresh = monotonic() + self.retry_interval
+            return False
+
+        cache_durations = [d for d in cache_durations if d > 0]
+        if len(cache_durations) == 0:
+            # nothing is cached, so there is nothing to keep warm
+            job.last_error = ValueError(
+                f'{job.method.__qualname__} does not cache its responses.'
+            )
+            job.next_refresh = inf
+            return False
+
+        job.cache_duration = min(cache_durations)
+        job.refreshes += 1
+        job.last_error = None
+        job.next_refresh = monotonic() + max(
+            job.cache_duration - self.lead_time,
+            job.cache_duration / 2,
+        )
+
+        return True
+
+__all__ = [
+    'CacheWarmer',
+    'CacheWarmerJob',
+]
@@ -0,0 +1,328 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Stop sending requests to endpoints that are failing, until they recover."""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic
+from typing import Any
+from urllib.parse import urlsplit
+
+from typeguard import typechecked
+
+from .constants import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_TIMEOUT
+from .exceptions import CircuitOpenError
+
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+
+FAILURE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+class Circuit:
+    """State of the circuit of one endpoint."""
+
+    @typechecked
+    def __init__(self) -> None:
+        """Constructor method"""
+        self.state: str = CIRCUIT_CLOSED
+        """One of "closed", "open" or "half_open"."""
+        self.failures: int = 0
+        """Number of requests that have failed in a row."""
+        self.open_until: float = 0.0
+        """Time, as returned by ``time.monotonic()``, when an open circuit \
+        lets a request through to probe the endpoint."""
+        self.probes: int = 0
+        """Number of probe requests that are in flight."""
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(state={self.state}, ' \
+            f'failures={self.failures})'
+
+class CircuitBreaker:
+    """Circuit breaker that fails requests to an endpoint fast while the \
+    endpoint is failing.
+
+    Each endpoint, i.e. URL without its query, has its own circuit:
+
+    - A closed circuit sends requests. After ``failure_threshold`` requests \
+        fail in a row, the circuit opens. A failed response with a \
+        ``Retry-After`` header opens it at once, for as long as the header \
+        asks for.
+    - An open circuit raises ``CircuitOpenError`` instead of sending \
+        requests, for ``recovery_timeout`` seconds or for as long as the \
+        last failed response's ``Retry-After`` header asked for, whichever \
+        is longer.
+    - Then the circuit is half-open: up to ``half_open_max_calls`` requests \
+        are sent to probe the endpoint. If a probe succeeds, then the \
+        circuit closes; if it fails, then the circuit opens again.
+
+    A request fails if it raises an error, e.g. it times out, or if its \
+        response has a 429 or 5xx status code. A circuit breaker is \
+        thread-safe, so it can be shared by several clients and threads.
+
+    :param failure_threshold: Number of requests that must fail in a row to \
+        open a circuit. Defaults to 5.
+    :type failure_threshold: int
+
+    :param recovery_timeout: Number of seconds that a circuit stays open \
+        before it is probed. Defaults to 30.
+    :type recovery_timeout: float
+
+    :param half_open_max_calls: Number of probe requests that can be in \
+        flight at the same time. Defaults to 1.
+    :type half_open_max_calls: int
+
+    :raises ValueError: failure_threshold or half_open_max_calls is less \
+        than 1.
+    :raises ValueError: recovery_timeout is not more than 0.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        failure_threshold: int=CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float=CIRCUIT_RECOVERY_TIMEOUT,
+        half_open_max_calls: int=1,
+    ) -> None:
+        """Constructor method"""
+        if failure_threshold < 1:
+            raise ValueError(
+                'Argument "failure_threshold" cannot be less than 1.'
+            )
+        if recovery_timeout <= 0:
+            raise ValueError(
+                'Argument "recovery_timeout" must be more than 0.'
+            )
+        if half_open_max_calls < 1:
+            raise ValueError(
+                'Argument "half_open_max_calls" cannot be less than 1.'
+            )
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.__circuits: dict[str, Circuit] = {}
+        self.__lock = Lock()
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(' \
+            f'failure_threshold={self.failure_threshold}, ' \
+            f'recovery_timeout={self.recovery_timeout})'
+
+    @typechecked
+    def state(self, url: str) -> str:
+        """Return the state of an endpoint's circuit.
+
+        :param url: URL of the endpoint, with or without its query.
+        :type url: str
+
+        :return: One of "closed", "open" or "half_open".
+        :rtype: str
+        """
+        with self.__lock:
+            circuit = self.__circuits.get(endpoint_of(url))
+
+            if circuit is None:
+                return CIRCUIT_CLOSED
+            if circuit.state == CIRCUIT_OPEN \
+                and monotonic() >= circuit.open_until:
+                return CIRCUIT_HALF_OPEN
+
+            return circuit.state
+
+    @typechecked
+    def before_request(self, url: str) -> None:
+        """Check that a request can be sent to an endpoint. Call either \
+        ``record_success()`` or ``record_failure()`` after the request is \
+        sent, or ``cancel_request()`` if it is not sent.
+
+        :param url: URL of the request.
+        :type url: str
+
+        :raises CircuitOpenError: The endpoint's circuit is open, or it is \
+            half-open and enough probes are in flight.
+        """
+        endpoint = endpoint_of(url)
+
+        with self.__lock:
+            circuit = self.__circuits.get(endpoint)
+            if circuit is None or circuit.state == CIRCUIT_CLOSED:
+                return
+
+            now = monotonic()
+            if circuit.state == CIRCUIT_OPEN:
+                if now < circuit.open_until:
+                    raise CircuitOpenError(
+                        f'Circuit of endpoint {endpoint} is open.',
+                        endpoint=endpoint,
+                        retry_in=circuit.open_until - now,
+                    )
+                circuit.state = CIRCUIT_HALF_OPEN
+                circuit.probes = 0
+
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenError(
+                    f'Circuit of endpoint {endpoint} is being probed.',
+                    endpoint=endpoint,
+                    retry_in=0.0,
+                )
+            circuit.probes += 1
+
+    @typechecked
+    def cancel_request(self, url: str) -> None:
+        """Record that a request that was checked with \
+        ``before_request()`` was not sent after all, so that it is not \
+        counted as a probe that is in flight.
+
+        :param url: URL of the request.
+        :type url: str
+        """
+        with self.__lock:
+            circuit = self.__circuits.get(endpoint_of(url))
+            if circuit is not None and circuit.state == CIRCUIT_HALF_OPEN:
+                circuit.probes = max(circuit.probes - 1, 0)
+
+    @typechecked
+    def record_success(self, url: str) -> None:
+        """Record that a request to an endpoint succeeded, closing its \
+        circuit.
+
+        :param url: URL of the request.
+        :type url: str
+        """
+        with self.__lock:
+            # a closed circuit without failures needs no state
+            _ = self.__circuits.pop(endpoint_of(url), None)
+
+    @typechecked
+    def record_failure(
+        self,
+        url: str,
+        retry_after: float | None=None,
+    ) -> None:
+        """Record that a request to an endpoint failed, opening its circuit \
+        if it fails too often.
+
+        :param url: URL of the request.
+        :type url: str
+
+        :param retry_after: Number of seconds that the server asked to wait \
+            before sending another request. If set, then the circuit opens \
+            for at least that long, even below ``failure_threshold``. \
+            Defaults to None.
+        :type retry_after: float or None
+        """
+        endpoint = endpoint_of(url)
+
+        with self.__lock:
+            circuit = self.__circuits.setdefault(endpoint, Circuit())
+            circuit.failures += 1
+
+            if circuit.state == CIRCUIT_HALF_OPEN \
+                or circuit.failures >= self.failure_threshold:
+                circuit.state = CIRCUIT_OPEN
+                circuit.open_until = monotonic() + max(
+                    self.recovery_timeout,
+                    retry_after or 0,
+                )
+                circuit.probes = 0
+            elif retry_after:
+                # the server asked not to send requests for a while
+                circuit.state = CIRCUIT_OPEN
+                circuit.open_until = monotonic() + retry_after
+                circuit.probes = 0
+
+    @typechecked
+    def record_response(self, url: str, response: Any) -> None:
+        """Record whether a request to an endpoint succeeded from its \
+        response's status code.
+
+        :param url: URL of the request.
+        :type url: str
+
+        :param response: The response.
+        :type response: Any
+        """
+        if response.status_code in FAILURE_STATUS_CODES:
+            self.record_failure(
+                url,
+                retry_after=parse_retry_after(
+                    response.headers.get('Retry-After'),
+                ),
+            )
+        else:
+            self.record_success(url)
+
+    @typechecked
+    def reset(self) -> None:
+        """Close the circuits of all endpoints."""
+        with self.__lock:
+            self.__circuits.clear()
+
+@typechecked
+def endpoint_of(url: str) -> str:
+    """Return the endpoint of a URL, i.e. the URL without its query.
+
+    :param url: The URL.
+    :type url: str
+
+    :return: The endpoint.
+    :rtype: str
+    """
+    return urlsplit(url)._replace(query='', fragment='').geturl()
+
+@typechecked
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the number of seconds to wait from a ``Retry-After`` header.
+
+    :param value: Value of the header, as a number of seconds or an HTTP \
+        date.
+    :type value: str or None
+
+    :return: Number of seconds to wait, or None if the value is missing or \
+        invalid.
+    :rtype: float or None
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+__all__ = [
+    'CIRCUIT_CLOSED',
+    'CIRCUIT_HALF_OPEN',
+    'CIRCUIT_OPEN',
+    'Circuit',
+    'CircuitBreaker',
+    'endpoint_of',
+    'parse_retry_after',
+]
@@ -0,0 +1,378 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coordinate requests that are sent from several threads or tasks."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from threading import Lock
+from typing import Any
+
+from typeguard import typechecked
+
+from .cache import copy_value
+from .constants import NAME
+from .deadline import current_deadline
+
+class SingleFlight:
+    """Coalesce identical calls that are in flight at the same time.
+
+    The first caller of a key runs the function. Callers of the same key \
+        that arrive while it is running wait for it to finish, and then get \
+        a copy of its result, or a copy of its exception. The result is \
+        copied only if other callers waited for it. A single flight is \
+        thread-safe, so it can be shared by several clients and threads.
+
+    Example usage:
+
+    .. code-block:: python
+
+        single_flight = SingleFlight()
+        data = single_flight.do(url, requests.get, url)
+    """
+
+    @typechecked
+    def __init__(self) -> None:
+        """Constructor method"""
+        self.__calls: dict[Hashable, Future] = {}
+        self.__waiters: dict[Hashable, int] = {}
+        self.__lock = Lock()
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(in_flight={len(self)})'
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of calls that are in flight."""
+        return len(self.__calls)
+
+    @typechecked
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Any],
+        *args: Any,
+        wait_timeout: float | None=None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call a function, unless a call with the same key is in flight, in \
+        which case wait for that call's result instead.
+
+        :param key: Key that identifies identical calls.
+        :type key: Hashable
+
+        :param func: Function to call.
+        :type func: Callable[..., Any]
+
+        :param args: Positional arguments of the function.
+        :type args: Any
+
+        :param wait_timeout: Number of seconds to wait for a call that is in \
+            flight. Defaults to None, i.e. wait until it finishes.
+        :type wait_timeout: float or None
+
+        :param kwargs: Keyword arguments of the function.
+        :type kwargs: Any
+
+        :raises TimeoutError: The call that is in flight did not finish \
+            within ``wait_timeout``.
+        :raises Exception: The function raised an exception. Callers that \
+            waited get a copy of the exception.
+
+        :return: Result of the function. Callers that waited get a copy of \
+            the result.
+        :rtype: Any
+        """
+        with self.__lock:
+            future = self.__calls.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.__calls[key] = future
+                self.__waiters[key] = 0
+            else:
+                self.__waiters[key] += 1
+
+        if not is_leader:
+            error = future.exception(timeout=wait_timeout)
+            if error is not None:
+                # each thread raises its own copy, so that they do not share
+                # and change the same traceback
+                raise _copy_exception(error)
+            return copy_value(future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+                has_waiters = self.__waiters.pop(key) > 0
+
+        if has_waiters:
+            # the waiters copy the result, so the caller must not modify it
+            # while they are copying it
+            return copy_value(result)
+
+        return result
+
+class AsyncSingleFlight:
+    """Same as ``SingleFlight``, but for coroutine functions, whose calls \
+    are run as tasks in the running event loop.
+
+    An asyncio single flight is not thread-safe, and its calls are bound to \
+    the event loop that runs them, so it must only be used from one event \
+    loop.
+
+    Example usage:
+
+    .. code-block:: python
+
+        single_flight = AsyncSingleFlight()
+        data = await single_flight.do(url, client.send_request, url)
+    """
+
+    @typechecked
+    def __init__(self) -> None:
+        """Constructor method"""
+        self.__calls: dict[Hashable, asyncio.Task] = {}
+        self.__waiters: dict[Hashable, int] = {}
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(in_flight={len(self)})'
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of calls that are in flight."""
+        return len(self.__calls)
+
+    @typechecked
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        wait_timeout: float | None=None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call a coroutine function, unless a call with the same key is in \
+        flight, in which case wait for that call's result instead.
+
+        A caller that is cancelled does not cancel the call, so that the \
+        callers that wait for it still get its result.
+
+        :param key: Key that identifies identical calls.
+        :type key: Hashable
+
+        :param func: Coroutine function to call.
+        :type func: Callable[..., Awaitable[Any]]
+
+        :param args: Positional arguments of the function.
+        :type args: Any
+
+        :param wait_timeout: Number of seconds to wait for a call that is in \
+            flight. Defaults to None, i.e. wait until it finishes.
+        :type wait_timeout: float or None
+
+        :param kwargs: Keyword arguments of the function.
+        :type kwargs: Any
+
+        :raises TimeoutError: The call that is in flight did not finish \
+            within ``wait_timeout``.
+        :raises Exception: The function raised an exception. Callers that \
+            waited get a copy of the exception.
+
+        :return: Result of the function. Callers that waited get a copy of \
+            the result.
+        :rtype: Any
+        """
+        task = self.__calls.get(key)
+
+        if task is not None:
+            self.__waiters[key] += 1
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(task),
+                    timeout=wait_timeout,
+                )
+            except Exception:
+                if not task.done() or task.exception() is None:
+                    raise
+                error = task.exception()
+            else:
+                return copy_value(result)
+            # each task raises its own copy, so that they do not share and
+            # change the same traceback
+            raise _copy_exception(error)
+
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        self.__calls[key] = task
+        self.__waiters[key] = 0
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            del self.__calls[key]
+            has_waiters = self.__waiters.pop(key) > 0
+
+        if has_waiters:
+            # the waiters copy the result after this caller has resumed, so
+            # this caller must not modify it
+            return copy_value(result)
+
+        return result
+
+DEFAULT_SINGLE_FLIGHT = SingleFlight()
+"""Single flight that is shared by every client."""
+
+@typechecked
+def map_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Hashable],
+    max_workers: int,
+) -> dict[Hashable, Any]:
+    """Call a function with each item in threads, and collect the result or \
+    exception of each call instead of raising it.
+
+    The current thread's deadline, if any, also applies to the calls.
+
+    :param func: Function to call with each item.
+    :type func: Callable[[Any], Any]
+
+    :param items: Items to call the function with. Duplicate items are \
+        called once.
+    :type items: Iterable[Hashable]
+
+    :param max_workers: Maximum number of calls to run at the same time.
+    :type max_workers: int
+
+    :raises ValueError: max_workers is less than 1.
+
+    :return: Result of each call, or the exception that it raised, by item \
+        in the order of the items.
+    :rtype: dict[Hashable, Any]
+    """
+    if max_workers < 1:
+        raise ValueError('Argument "max_workers" cannot be less than 1.')
+
+    items = list(dict.fromkeys(items))
+    if len(items) == 0:
+        return {}
+
+    # deadlines are kept by thread, so the current one is entered again in
+    # the threads that call the function
+    deadline = current_deadline()
+
+    def call(item: Hashable) -> Any:
+        with deadline or nullcontext():
+            return func(item)
+
+    results: dict[Hashable, Any] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=NAME,
+    ) as executor:
+        futures = {item: executor.submit(call, item) for item in items}
+
+        for item, future in futures.items():
+            error = future.exception()
+            results[item] = future.result() if error is None else error
+
+    return results
+
+@typechecked
+async def map_concurrently_async(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Hashable],
+    max_workers: int,
+) -> dict[Hashable, Any]:
+    """Same as ``map_concurrently()``, but for a coroutine function, whose \
+    calls are run as tasks in the running event loop instead of in threads.
+
+    :param func: Coroutine function to call with each item.
+    :type func: Callable[[Any], Awaitable[Any]]
+
+    :param items: Items to call the function with. Duplicate items are \
+        called once.
+    :type items: Iterable[Hashable]
+
+    :param max_workers: Maximum number of calls to run at the same time.
+    :type max_workers: int
+
+    :raises ValueError: max_workers is less than 1.
+
+    :return: Result of each call, or the exception that it raised, by item \
+        in the order of the items.
+    :rtype: dict[Hashable, Any]
+    """
+    if max_workers < 1:
+        raise ValueError('Argument "max_workers" cannot be less than 1.')
+
+    items = list(dict.fromkeys(items))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def call(item: Hashable) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    results = await asyncio.gather(
+        *[call(item) for item in items],
+        return_exceptions=True,
+    )
+
+    return dict(zip(items, results))
+
+def _copy_exception(error: BaseException) -> BaseException:
+    """Copy an exception with its attributes, cause and traceback so far.
+
+    The copy is created without calling the exception's constructor, whose \
+    arguments may not be its ``args``.
+
+    :param error: The exception to copy.
+    :type error: BaseException
+
+    :return: The copy, or the exception itself if it cannot be copied.
+    :rtype: BaseException
+    """
+    try:
+        error_copy = error.__class__.__new__(error.__class__, *error.args)
+    except Exception: # pylint: disable=broad-exception-caught
+        return error
+
+    error_copy.__dict__.update(error.__dict__)
+    if hasattr(error, '__notes__'):
+        error_copy.__notes__ = list(error.__notes__)
+    error_copy.__cause__ = error.__cause__
+    error_copy.__context__ = error.__context__
+    error_copy.__suppress_context__ = error.__suppress_context__
+
+    return error_copy.with_traceback(error.__traceback__)
+
+__all__ = [
+    'DEFAULT_SINGLE_FLIGHT',
+    'AsyncSingleFlight',
+    'SingleFlight',
+    'map_concurrently',
+    'map_concurrently_async',
+]
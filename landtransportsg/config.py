@@ -0,0 +1,269 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Options of the clients, grouped by what they configure."""
+
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from typeguard import typechecked
+
+from .circuit_breaker import CircuitBreaker
+from .constants import REQUEST_TIMEOUT
+from .hedging import Hedger
+from .rate_limiter import DEFAULT_RATE_LIMITER, RateLimiter
+from .types import Url
+
+class ConnectionConfig:
+    """How a client connects to the API endpoints.
+
+    Example usage:
+
+    .. code-block:: python
+
+        client = PublicTransport(
+            API_KEY,
+            connection=ConnectionConfig(pool_maxsize=32, timeout=10.0),
+        )
+
+    :param pool_connections: Number of connection pools to cache, i.e. one \
+        per host. Defaults to 10.
+    :type pool_connections: int
+
+    :param pool_maxsize: Maximum number of connections to keep alive in each \
+        pool. Set this to at least the number of threads that send requests \
+        at the same time. Defaults to 10.
+    :type pool_maxsize: int
+
+    :param pool_block: If True, then a request waits for a connection to be \
+        returned to a full pool, instead of opening a connection that is \
+        discarded after use. Defaults to False.
+    :type pool_block: bool
+
+    :param timeout: Number of seconds to wait for the server to send data, \
+        or a ``(connect timeout, read timeout)`` tuple, or None to wait \
+        forever. Defaults to ``(5.0, 30.0)``.
+    :type timeout: float or tuple[float, float] or None
+
+    :param rate_limiter: Rate limiter to take a token from before sending \
+        every request to an endpoint. Defaults to None, i.e. use \
+        ``DEFAULT_RATE_LIMITER``, which is shared by all clients.
+    :type rate_limiter: RateLimiter or None
+
+    :raises ValueError: pool_connections or pool_maxsize is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        pool_connections: int=DEFAULT_POOLSIZE,
+        pool_maxsize: int=DEFAULT_POOLSIZE,
+        pool_block: bool=DEFAULT_POOLBLOCK,
+        timeout: float | tuple[float, float] | None=REQUEST_TIMEOUT,
+        rate_limiter: RateLimiter | None=None,
+    ) -> None:
+        """Constructor method"""
+        if pool_connections < 1:
+            raise ValueError(
+                'Argument "pool_connections" cannot be less than 1.'
+            )
+        if pool_maxsize < 1:
+            raise ValueError(
+                'Argument "pool_maxsize" cannot be less than 1.'
+            )
+
+        if rate_limiter is None:
+            rate_limiter = DEFAULT_RATE_LIMITER
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(pool_maxsize={self.pool_maxsize}, ' \
+            f'timeout={self.timeout})'
+
+class CacheConfig:
+    """How a client reuses responses, in addition to its cache backend.
+
+    Example usage:
+
+    .. code-block:: python
+
+        client = PublicTransport(
+            API_KEY,
+            caching=CacheConfig(memory_cache_size=256),
+        )
+
+    :param memo_size: Maximum number of sanitised pages of cached responses \
+        to keep in memory, so that repeated requests that are served from \
+        the cache are not decoded and sanitised again. Set to 0 to disable. \
+        Defaults to 128.
+    :type memo_size: int
+
+    :param memory_cache_size: Maximum number of sanitised pages to keep in \
+        an in-memory cache in front of the cache backend. A page that is \
+        found here is returned without reading the cache backend, until the \
+        cache duration of its request ends. Defaults to 0, i.e. no \
+        in-memory cache.
+    :type memory_cache_size: int
+
+    :param coalesce_requests: If True, then identical requests with a cache \
+        duration that are sent at the same time, e.g. from several threads \
+        just after their cache expires, are sent only once, and every caller \
+        gets the same response. Defaults to True.
+    :type coalesce_requests: bool
+
+    :param stale_while_revalidate: Number of seconds after a cached response \
+        expires during which it is still returned immediately, while a \
+        background thread refreshes it for the next request. Use a dict to \
+        set the number of seconds by endpoint URL, e.g. \
+        ``{BUS_ROUTES_API_ENDPOINT: CACHE_ONE_HOUR}``; endpoints that are not \
+        in the dict are not served stale. Defaults to 0, i.e. wait for the \
+        refreshed response.
+    :type stale_while_revalidate: int or dict[Url, int]
+
+    :raises ValueError: memo_size or memory_cache_size is less than 0.
+    :raises ValueError: stale_while_revalidate is less than 0.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        memo_size: int=128,
+        memory_cache_size: int=0,
+        coalesce_requests: bool=True,
+        stale_while_revalidate: int | dict[Url, int]=0,
+    ) -> None:
+        """Constructor method"""
+        if memo_size < 0:
+            raise ValueError(
+                'Argument "memo_size" cannot be less than 0.'
+            )
+        if memory_cache_size < 0:
+            raise ValueError(
+                'Argument "memory_cache_size" cannot be less than 0.'
+            )
+        max_stalenesses = stale_while_revalidate.values() \
+            if isinstance(stale_while_revalidate, dict) \
+            else [stale_while_revalidate]
+        if any(v < 0 for v in max_stalenesses):
+            raise ValueError(
+                'Argument "stale_while_revalidate" cannot be less than 0.'
+            )
+
+        self.memo_size = memo_size
+        self.memory_cache_size = memory_cache_size
+        self.coalesce_requests = coalesce_requests
+        self.stale_while_revalidate = stale_while_revalidate
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(memo_size={self.memo_size}, ' \
+            f'memory_cache_size={self.memory_cache_size})'
+
+    @typechecked
+    def max_staleness(self, url: Url) -> int:
+        """Return the number of seconds after a cached response of an \
+        endpoint expires during which it is still returned immediately.
+
+        :param url: The endpoint URL.
+        :type url: Url
+
+        :return: The number of seconds, or 0 if it is not served stale.
+        :rtype: int
+        """
+        if isinstance(self.stale_while_revalidate, dict):
+            return self.stale_while_revalidate.get(url, 0)
+
+        return self.stale_while_revalidate
+
+class ResilienceConfig:
+    """How a client bounds the time that requests take, and copes with \
+    endpoints that are slow or failing.
+
+    Example usage:
+
+    .. code-block:: python
+
+        client = PublicTransport(
+            API_KEY,
+            resilience=ResilienceConfig(deadline=10.0, deadline_fallback=True),
+        )
+
+    :param deadline: Number of seconds that each request may take, across \
+        all of its pages and retries. Use ``send_request(deadline=...)`` or \
+        ``with Deadline(...)`` to set a deadline for some requests only. \
+        Defaults to None, i.e. no deadline.
+    :type deadline: float or None
+
+    :param deadline_fallback: If True, then a page that is not fetched \
+        before the deadline is taken from the cache instead, even if its \
+        cached response has expired. Otherwise, or if the page is not \
+        cached, ``DeadlineExceededError`` is raised. Defaults to False.
+    :type deadline_fallback: bool
+
+    :param circuit_breaker: Circuit breaker that fails requests to an \
+        endpoint fast after it has been failing, until it recovers. Pass the \
+        same circuit breaker to several clients to share the state of the \
+        endpoints' circuits. Defaults to None, i.e. no circuit breaker.
+    :type circuit_breaker: CircuitBreaker or None
+
+    :param circuit_breaker_fallback: If True, then a page whose endpoint's \
+        circuit is open is taken from the cache instead, even if its cached \
+        response has expired. Otherwise, or if the page is not cached, \
+        ``CircuitOpenError`` is raised. Defaults to False.
+    :type circuit_breaker_fallback: bool
+
+    :param hedger: Hedger to send a second identical request when a request \
+        with ``hedge=True``, e.g. ``PublicTransport.bus_arrival()``, is \
+        slower than usual. Defaults to None, i.e. do not hedge requests.
+    :type hedger: Hedger or None
+
+    :raises ValueError: deadline is not more than 0.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        deadline: float | None=None,
+        deadline_fallback: bool=False,
+        circuit_breaker: CircuitBreaker | None=None,
+        circuit_breaker_fallback: bool=False,
+        hedger: Hedger | None=None,
+    ) -> None:
+        """Constructor method"""
+        if deadline is not None and deadline <= 0:
+            raise ValueError('Argument "deadline" must be more than 0.')
+
+        self.deadline = deadline
+        self.deadline_fallback = deadline_fallback
+        self.circuit_breaker = circuit_breaker
+        self.circuit_breaker_fallback = circuit_breaker_fallback
+        self.hedger = hedger
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(deadline={self.deadline}, ' \
+            f'circuit_breaker={self.circuit_breaker!r})'
+
+__all__ = [
+    'CacheConfig',
+    'ConnectionConfig',
+    'ResilienceConfig',
+]
@@ -33,11 +33,47 @@ CACHE_ONE_HOUR = CACHE_ONE_MINUTE * 60
 CACHE_TWELVE_HOURS = CACHE_ONE_HOUR * 12
 CACHE_ONE_DAY = CACHE_ONE_HOUR * 24
 
+CACHE_MAX_ENTRIES = 10000
+CACHE_MAINTENANCE_INTERVAL = 100
+
+PAGE_SIZE = 500
+
+ASYNC_MAX_CONCURRENCY = 100
+
+REQUEST_TIMEOUT = (5.0, 30.0)
+
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.1
+RETRY_BACKOFF_MAX = 10
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 30
+
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+DATETIME_CACHE_SIZE = 4096
+
+RATE_LIMIT_REQUESTS_PER_SECOND = 20
+RATE_LIMIT_BURST = 20
+
+SNAPSHOT_ENDPOINTS = (
+    'taxi_availability',
+    'traffic_incidents',
+    'traffic_speed_bands',
+    'carpark_availability',
+    'vms',
+    'faulty_traffic_lights',
+    'flood_alerts',
+    'train_service_alerts',
+)
+
 USER_AGENT = f'LTA.gov.sg Python package/{VERSION} https://pypi.org/project/{NAME}'
 
 __all__ = [
     'NAME',
 
+    'BASE_API_DOMAIN',
     'BASE_API_ENDPOINT',
 
     'CACHE_NAME',
@@ -52,5 +88,31 @@ __all__ = [
     'CACHE_TWELVE_HOURS',
     'CACHE_ONE_DAY',
 
+    'CACHE_MAX_ENTRIES',
+    'CACHE_MAINTENANCE_INTERVAL',
+
+    'PAGE_SIZE',
+
+    'ASYNC_MAX_CONCURRENCY',
+
+    'REQUEST_TIMEOUT',
+
+    'RETRY_TOTAL',
+    'RETRY_BACKOFF_FACTOR',
+    'RETRY_BACKOFF_MAX',
+    'RETRY_STATUS_FORCELIST',
+
+    'CIRCUIT_FAILURE_THRESHOLD',
+    'CIRCUIT_RECOVERY_TIMEOUT',
+
+    'JSON_STREAM_CHUNK_SIZE',
+
+    'DATETIME_CACHE_SIZE',
+
+    'RATE_LIMIT_REQUESTS_PER_SECOND',
+    'RATE_LIMIT_BURST',
+
+    'SNAPSHOT_ENDPOINTS',
+
     'USER_AGENT',
 ]
@@ -0,0 +1,231 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single entry point for interacting with all of the API endpoints."""
+
+from collections.abc import Callable
+from datetime import datetime
+from inspect import signature
+from time import monotonic
+from typing import Any
+
+from requests_cache import BaseCache
+from typeguard import typechecked
+
+from .active_mobility import Client as ActiveMobility
+from .concurrency import map_concurrently
+from .constants import SNAPSHOT_ENDPOINTS, USER_AGENT
+from .electric_vehicle import Client as ElectricVehicle
+from .geospatial import Client as Geospatial
+from .public_transport import Client as PublicTransport
+from .traffic import Client as Traffic
+from .landtransportsg import LandTransportSg
+from .timezone import SGT_TIMEZONE
+from .types import SnapshotDict
+
+class DataMall:
+    """Interact with all of the endpoints through one session.
+
+    The five clients are available as attributes. They share one session, \
+        so they also share one connection pool, one retry adapter and one \
+        handle on the cache, instead of each creating its own.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from landtransportsg import DataMall
+        datamall = DataMall(API_KEY)
+        bus_stops = datamall.public_transport.bus_stops()
+        carpark_availability = datamall.traffic.carpark_availability()
+
+        snapshot = datamall.snapshot(['taxi_availability', 'vms'])
+
+    :param account_key: The LTA DataMall-assigned Account key.
+    :type account_key: str
+
+    :param cache_backend: Cache backend name or instance to use. Defaults \
+        to "sqlite".
+    :type cache_backend: str | BaseCache
+
+    :param kwargs: Other arguments to pass to the clients' constructors.
+    :type kwargs: Any
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        account_key: str,
+        cache_backend: str | BaseCache='sqlite',
+        **kwargs: Any,
+    ) -> None:
+        """Constructor method"""
+        self.public_transport = PublicTransport(
+            account_key,
+            cache_backend=cache_backend,
+            **kwargs,
+        )
+        """Client for the public transport-related endpoints."""
+
+        self.session = self.public_transport.session
+        """Session that is shared by all of the clients."""
+
+        self.active_mobility = ActiveMobility(
+            account_key,
+            session=self.session,
+            **kwargs,
+        )
+        """Client for the active mobility-related endpoints."""
+        self.electric_vehicle = ElectricVehicle(
+            account_key,
+            session=self.session,
+            **kwargs,
+        )
+        """Client for the electric vehicle-related endpoints."""
+        self.geospatial = Geospatial(
+            account_key,
+            session=self.session,
+            **kwargs,
+        )
+        """Client for the geospatial-related endpoints."""
+        self.traffic = Traffic(
+            account_key,
+            session=self.session,
+            **kwargs,
+        )
+        """Client for the traffic-related endpoints."""
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__} ({USER_AGENT})'
+
+    def __enter__(self) -> 'DataMall':
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context manager and close the session."""
+        self.close()
+
+    @typechecked
+    def close(self) -> None:
+        """Close the shared session."""
+        self.session.close()
+
+    @typechecked
+    def snapshot(
+        self,
+        endpoints: list[str] | tuple[str, ...]=SNAPSHOT_ENDPOINTS,
+        max_workers: int=8,
+    ) -> SnapshotDict:
+        """Fetch several endpoints concurrently, so that they are captured at \
+        about the same time.
+
+        Each endpoint is named by the client method that fetches it, e.g. \
+            ``"taxi_availability"`` or ``"traffic_incidents"``, and must not \
+            need any arguments. Since the endpoints are fetched concurrently, \
+            a snapshot takes about as long as the slowest endpoint instead of \
+            all of the endpoints. An endpoint that fails does not stop the \
+            others, and its exception is returned in ``errors``.
+
+        :param endpoints: Names of the endpoints to fetch. Defaults to the \
+            real-time endpoints in ``SNAPSHOT_ENDPOINTS``.
+        :type endpoints: list[str] or tuple[str, ...]
+
+        :param max_workers: Maximum number of endpoints to fetch at the same \
+            time. Defaults to 8.
+        :type max_workers: int
+
+        :raises ValueError: An endpoint is not a client method that can be \
+            called without arguments.
+        :raises ValueError: max_workers is less than 1.
+
+        :return: The responses of the endpoints, with the capture time and \
+            the latency of each endpoint.
+        :rtype: SnapshotDict
+        """
+        methods = {name: self.__endpoint_method(name) for name in endpoints}
+
+        captured_at = datetime.now(SGT_TIMEZONE)
+        latencies: dict[str, float] = {}
+
+        def fetch(name: str) -> Any:
+            started_at = monotonic()
+            try:
+                return methods[name]()
+            finally:
+                latencies[name] = monotonic() - started_at
+
+        results = map_concurrently(fetch, methods, max_workers=max_workers)
+
+        snapshot: SnapshotDict = {
+            'captured_at': captured_at,
+            'data': {},
+            'latencies': {name: latencies[name] for name in results},
+            'errors': {},
+        }
+
+        for name, result in results.items():
+            if isinstance(result, Exception):
+                snapshot['errors'][name] = result
+            else:
+                snapshot['data'][name] = result
+
+        return snapshot
+
+# private
+
+    @typechecked
+    def __endpoint_method(self, name: str) -> Callable[[], Any]:
+        """Find the client method that fetches an endpoint.
+
+        :param name: Name of the client method, e.g. "taxi_availability".
+        :type name: str
+
+        :raises ValueError: name is not a client method that can be called \
+            without arguments.
+
+        :return: The client method.
+        :rtype: Callable[[], Any]
+        """
+        clients = (
+            self.public_transport,
+            self.traffic,
+            self.active_mobility,
+            self.electric_vehicle,
+            self.geospatial,
+        )
+
+        for client in clients:
+            method = getattr(client, name, None)
+            if name.startswith(('_', 'iter_')) \
+                or hasattr(LandTransportSg, name) or not callable(method):
+                continue
+
+            # keyword arguments, e.g. bus_arrival()'s, have no default either
+            parameters = signature(method).parameters.values()
+            if any(p.default is p.empty for p in parameters):
+                break
+
+            return method
+
+        raise ValueError(
+            f'Argument "endpoints" has an invalid endpoint "{name}". It must ' \
+                'be a client method that can be called without arguments.'
+        )
+
+__all__ = [
+    'DataMall',
+]
@@ -0,0 +1,221 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bound the time taken by a call across all of its pages and retries."""
+
+from threading import local
+from time import monotonic
+from typing import Any
+
+from typeguard import typechecked
+from urllib3 import Timeout
+
+from .retry import JitteredRetry
+
+MIN_TIMEOUT = 0.001
+
+class Deadline:
+    """Point in time by which a call must finish.
+
+    While a deadline is entered with a ``with`` statement, the clients' \
+        requests that are sent from the current thread finish by the \
+        deadline, across all of their pages and retries. Requests that are \
+        sent by an adapter with ``DeadlineRetry`` are not retried after the \
+        deadline, and their backoff is cut short at the deadline.
+
+    Example usage:
+
+    .. code-block:: python
+
+        deadline = Deadline(2.0)
+        with deadline:
+            response = session.get(url, timeout=DeadlineTimeout(deadline, 10))
+
+    :param seconds: Number of seconds from now until the deadline.
+    :type seconds: float
+
+    :raises ValueError: seconds is not more than 0.
+    """
+
+    @typechecked
+    def __init__(self, seconds: float) -> None:
+        """Constructor method"""
+        if seconds <= 0:
+            raise ValueError('Argument "seconds" must be more than 0.')
+
+        self.seconds = seconds
+        self.expires_at = monotonic() + seconds
+        """Time, as returned by ``time.monotonic()``, of the deadline."""
+        self.is_missed: bool = False
+        """True if a client gave up on a request because of the deadline, \
+        i.e. raised ``DeadlineExceededError`` or returned a cached response \
+        instead."""
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(seconds={self.seconds}, ' \
+            f'remaining={self.remaining:.3f})'
+
+    @typechecked
+    def __enter__(self) -> 'Deadline':
+        """Apply the deadline to the requests that are sent from the current \
+        thread."""
+        _active_deadlines.stack = current_deadlines() + [self]
+        return self
+
+    @typechecked
+    def __exit__(self, *args: Any) -> None:
+        """Stop applying the deadline to the current thread."""
+        _active_deadlines.stack = current_deadlines()[:-1]
+
+    @property
+    @typechecked
+    def remaining(self) -> float:
+        """Number of seconds until the deadline, or 0 if it has passed."""
+        return max(self.expires_at - monotonic(), 0.0)
+
+    @property
+    @typechecked
+    def is_expired(self) -> bool:
+        """True if the deadline has passed."""
+        return self.remaining == 0
+
+    @classmethod
+    @typechecked
+    def earliest(cls, *deadlines: 'Deadline | None') -> 'Deadline | None':
+        """Return the deadline that passes first.
+
+        :param deadlines: Deadlines to compare. None means no deadline.
+        :type deadlines: Deadline or None
+
+        :return: The earliest deadline, or None if there are no deadlines.
+        :rtype: Deadline or None
+        """
+        return min(
+            (d for d in deadlines if d is not None),
+            key=lambda d: d.expires_at,
+            default=None,
+        )
+
+class DeadlineTimeout(Timeout):
+    """Request timeout that is shortened to the time left until a deadline \
+    at the start of every attempt of a request, including its retries.
+
+    :param deadline: The deadline.
+    :type deadline: Deadline
+
+    :param timeout: Number of seconds to wait for the server to send data, \
+        or a ``(connect timeout, read timeout)`` tuple. Defaults to None, \
+        i.e. wait until the deadline.
+    :type timeout: float or tuple[float, float] or None
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        deadline: Deadline,
+        timeout: float | tuple[float, float] | None=None,
+    ) -> None:
+        """Constructor method"""
+        connect, read = timeout if isinstance(timeout, tuple) \
+            else (timeout, timeout)
+
+        self.deadline = deadline
+        self.request_timeout = timeout
+
+        super().__init__(
+            connect=connect,
+            read=read,
+            total=max(deadline.remaining, MIN_TIMEOUT),
+        )
+
+    @typechecked
+    def clone(self) -> 'DeadlineTimeout':
+        """Create a copy of the timeout for the next attempt of a request, \
+        with the time left until the deadline as its total timeout.
+
+        :return: The copy of the timeout.
+        :rtype: DeadlineTimeout
+        """
+        return DeadlineTimeout(self.deadline, self.request_timeout)
+
+class DeadlineRetry(JitteredRetry):
+    """Retry configuration that stops retrying at the current thread's \
+    deadline.
+
+    A retry is not attempted after the deadline, and its backoff is cut \
+    short at the deadline. A response whose ``Retry-After`` wait ends after \
+    the deadline is not retried at all. Without a deadline, it behaves \
+    exactly like ``JitteredRetry``.
+    """
+
+    def is_exhausted(self) -> bool:
+        """True if there are no retries left, or if the deadline has \
+        passed."""
+        deadline = current_deadline()
+        if deadline is not None and deadline.is_expired:
+            return True
+
+        return super().is_exhausted()
+
+    def get_backoff_time(self) -> float:
+        """Number of seconds to wait before the next retry, but not past the \
+        deadline."""
+        backoff = super().get_backoff_time()
+
+        deadline = current_deadline()
+        if deadline is not None:
+            backoff = min(backoff, deadline.remaining)
+
+        return backoff
+
+    def get_retry_after_max(self) -> float:
+        """Longest ``Retry-After`` wait, in seconds, before a retry is given \
+        up instead, which ends at the deadline at the latest."""
+        retry_after_max = super().get_retry_after_max()
+
+        deadline = current_deadline()
+        if deadline is not None:
+            retry_after_max = min(retry_after_max, deadline.remaining)
+
+        return retry_after_max
+
+@typechecked
+def current_deadlines() -> list[Deadline]:
+    """Return the deadlines that are entered in the current thread.
+
+    :return: The deadlines, from the first entered to the last entered.
+    :rtype: list[Deadline]
+    """
+    return getattr(_active_deadlines, 'stack', [])
+
+@typechecked
+def current_deadline() -> Deadline | None:
+    """Return the earliest deadline that is entered in the current thread.
+
+    :return: The deadline, or None if no deadline is entered.
+    :rtype: Deadline or None
+    """
+    return Deadline.earliest(*current_deadlines())
+
+_active_deadlines = local()
+
+__all__ = [
+    'Deadline',
+    'DeadlineRetry',
+    'DeadlineTimeout',
+    'current_deadline',
+    'current_deadlines',
+]
@@ -0,0 +1,633 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode response values according to the TypedDicts of their records."""
+
+from collections.abc import Callable, Sequence
+from datetime import date, datetime, time
+from functools import cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    NotRequired,
+    Required,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from typeguard import typechecked
+
+from .sanitise import LIST_ITEMS, KeyPathTrie, compile_ignore_keys
+from .timezone import datetime_or_none_from_string
+
+Decoder = Callable[[Any], Any]
+"""Function that converts a value from a decoded JSON response."""
+
+PageDecoder = Callable[[list], list]
+"""Function that converts the records of a page from a decoded JSON \
+response."""
+
+_ColumnDecoder = Callable[[Sequence], Sequence]
+
+@cache
+@typechecked
+def compile_decoder(
+    record_type: Any,
+    ignore_keys: tuple[str, ...]=(),
+    key_path: str='',
+) -> Decoder:
+    """Compile a decoder that converts the values of a record to the types \
+    that are annotated in its TypedDict.
+
+    Each field is converted directly to its annotated type, e.g. a ``str`` \
+        field is left as a string even if it looks like a number, and a \
+        ``time`` field is parsed as a time. A ``float`` field is converted \
+        to an ``int`` if it is an integer string, e.g. "22", like \
+        ``sanitise_string()`` does. Blank strings are converted to None in \
+        optional fields, e.g. ``str | None``, and in number and datetime \
+        fields. Fields that are not in the TypedDict, fields at the key \
+        paths to ignore, and values that cannot be converted, are left as \
+        they are.
+
+    The decoder is compiled once for each type and key paths, and then \
+        reused.
+
+    Example usage:
+
+    .. code-block:: python
+
+        decode = compile_decoder(BusStopsDict)
+        bus_stop = decode({'BusStopCode': '01012', 'Latitude': '1.29685'})
+
+    :param record_type: TypedDict of the record, or the type of a field, \
+        e.g. ``list[BusRoutesDict]`` or ``float | None``.
+    :type record_type: Any
+
+    :param ignore_keys: Key paths of the fields to leave as they are, like \
+        the ``ignore_keys`` of ``compile_ignore_keys()``. Defaults to \
+        ``()``.
+    :type ignore_keys: tuple[str, ...]
+
+    :param key_path: Key path of the record in the key paths to ignore, \
+        e.g. ``'[]'`` for the records of a list. Defaults to blank string.
+    :type key_path: str
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    if ignore_keys or key_path:
+        ignore_trie = compile_ignore_keys(list(ignore_keys), key_path)
+        if ignore_trie is None:
+            return compile_decoder(record_type)
+        return _compile_ignoring_decoder(record_type, ignore_trie)
+
+    if is_typeddict(record_type):
+        return _compile_typeddict_decoder(record_type)
+
+    origin = get_origin(record_type)
+    args = get_args(record_type)
+
+    if origin in (NotRequired, Required):
+        return compile_decoder(args[0])
+
+    if origin in (Union, UnionType):
+        # only optional types, e.g. "str | None", are decoded
+        types = [t for t in args if t is not NoneType]
+        if len(types) != 1:
+            return _decode_as_is
+
+        return _compile_optional_decoder(compile_decoder(types[0]))
+
+    if origin is list and len(args) == 1:
+        return _compile_list_decoder(compile_decoder(args[0]))
+
+    if origin is tuple and len(args) > 0 and Ellipsis not in args:
+        return _compile_tuple_decoder(
+            tuple(compile_decoder(t) for t in args),
+        )
+
+    return _SCALAR_DECODERS.get(record_type, _decode_as_is)
+
+@cache
+@typechecked
+def compile_page_decoder(
+    record_type: Any,
+    ignore_keys: tuple[str, ...]=(),
+) -> PageDecoder:
+    """Compile a decoder that converts the records of a page to the types \
+    that are annotated in their TypedDict, like ``compile_decoder()``, but \
+    column by column.
+
+    If the records are dicts with the same keys, e.g. the records of \
+    ``traffic_speed_bands()``, then they are transposed into a column for \
+        each key, and each column is converted in bulk, e.g. a column of \
+        number strings is converted in one pass, and each unique datetime \
+        string in a column is parsed once. Other pages are converted one \
+        record at a time.
+
+    Example usage:
+
+    .. code-block:: python
+
+        decode = compile_page_decoder(BusStopsDict)
+        bus_stops = decode([{'BusStopCode': '01012', 'Latitude': '1.29685'}])
+
+    :param record_type: TypedDict of the records.
+    :type record_type: Any
+
+    :param ignore_keys: Key paths of the fields to leave as they are, from \
+        the page, e.g. ``'[].BusStopCode'``. Defaults to ``()``.
+    :type ignore_keys: tuple[str, ...]
+
+    :return: The decoder.
+    :rtype: PageDecoder
+    """
+    decode_record = compile_decoder(
+        record_type,
+        ignore_keys=ignore_keys,
+        key_path=LIST_ITEMS,
+    )
+
+    if not is_typeddict(record_type):
+        return _compile_records_decoder(decode_record)
+
+    ignore_trie = compile_ignore_keys(list(ignore_keys), LIST_ITEMS) or {}
+
+    # columns of e.g. strings are left as they are, so they are not decoded
+    column_decoders = [
+        (key, decode_column) for key, decode_column in (
+            (key, _compile_column_decoder(field_type, ignore_trie, key)) \
+                for key, field_type in get_type_hints(record_type).items()
+        ) if decode_column is not _decode_column_as_is
+    ]
+
+    def decode(page: list) -> list:
+        if len(page) == 0 or set(map(type, page)) != {dict}:
+            return [decode_record(v) for v in page]
+
+        # copying the records is faster than building them again, so only
+        # the values that are converted are set in the copies
+        records = list(map(dict.copy, page))
+        for key, decode_column in column_decoders:
+            try:
+                column = [record[key] for record in page]
+            except KeyError:
+                if any(key in record for record in page):
+                    # the records do not have the same keys
+                    return [decode_record(v) for v in page]
+                continue
+
+            decoded_column = decode_column(column)
+            if decoded_column is column:
+                continue
+
+            for record, value in zip(records, decoded_column):
+                record[key] = value
+
+        return records
+
+    return decode
+
+def _compile_ignoring_decoder(
+    field_type: Any,
+    ignore_keys: KeyPathTrie,
+) -> Decoder:
+    """Compile the decoder of a type whose values at some key paths are left \
+    as they are.
+
+    :param field_type: The type.
+    :type field_type: Any
+
+    :param ignore_keys: Trie of the key paths to ignore below the type.
+    :type ignore_keys: KeyPathTrie
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    if is_typeddict(field_type):
+        return _compile_typeddict_decoder(field_type, ignore_keys)
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    if origin in (NotRequired, Required):
+        return _compile_ignoring_decoder(args[0], ignore_keys)
+
+    if origin in (Union, UnionType):
+        types = [t for t in args if t is not NoneType]
+        if len(types) == 1:
+            return _compile_optional_decoder(
+                _compile_ignoring_decoder(types[0], ignore_keys),
+            )
+
+    if origin is list and len(args) == 1:
+        item_ignore_keys = ignore_keys.get(LIST_ITEMS)
+        return _compile_list_decoder(
+            compile_decoder(args[0]) if item_ignore_keys is None \
+                else _compile_ignoring_decoder(args[0], item_ignore_keys),
+        )
+
+    return compile_decoder(field_type)
+
+def _compile_field_decoder(
+    field_type: Any,
+    ignore_keys: KeyPathTrie | None,
+    key: str,
+) -> Decoder:
+    """Compile the decoder of a field of a TypedDict.
+
+    :param field_type: The type of the field.
+    :type field_type: Any
+
+    :param ignore_keys: Trie of the key paths to ignore below the TypedDict.
+    :type ignore_keys: KeyPathTrie or None
+
+    :param key: Key of the field.
+    :type key: str
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    if ignore_keys is None or key not in ignore_keys:
+        return compile_decoder(field_type)
+
+    if ignore_keys[key] is None:
+        return _decode_as_is
+
+    return _compile_ignoring_decoder(field_type, ignore_keys[key])
+
+def _compile_typeddict_decoder(
+    record_type: Any,
+    ignore_keys: KeyPathTrie | None=None,
+) -> Decoder:
+    """Compile the decoder of a TypedDict.
+
+    :param record_type: The TypedDict.
+    :type record_type: Any
+
+    :param ignore_keys: Trie of the key paths to ignore below the TypedDict. \
+        Defaults to None.
+    :type ignore_keys: KeyPathTrie or None
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    field_decoders = {
+        key: _compile_field_decoder(field_type, ignore_keys, key) \
+            for key, field_type in get_type_hints(record_type).items()
+    }
+    get_field_decoder = field_decoders.get
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+
+        return {
+            k: get_field_decoder(k, _decode_as_is)(v) \
+                for k, v in value.items()
+        }
+
+    return decode
+
+def _compile_list_decoder(decode_item: Decoder) -> Decoder:
+    """Compile the decoder of a list.
+
+    :param decode_item: The decoder of the list's items.
+    :type decode_item: Decoder
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    def decode(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+
+        return [decode_item(v) for v in value]
+
+    return decode
+
+def _compile_tuple_decoder(decode_items: tuple[Decoder, ...]) -> Decoder:
+    """Compile the decoder of a tuple, which the endpoints send as a string \
+    of comma-separated values.
+
+    :param decode_items: The decoders of the tuple's items.
+    :type decode_items: tuple[Decoder, ...]
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    def decode(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if value == '':
+            return None
+
+        items = value.split(',')
+        if len(items) != len(decode_items):
+            return value
+
+        decoded = tuple(
+            decode_item(item.strip()) for decode_item, item \
+                in zip(decode_items, items)
+        )
+        if any(isinstance(item, str) for item in decoded):
+            return value
+
+        return decoded
+
+    return decode
+
+def _compile_optional_decoder(decode_value: Decoder) -> Decoder:
+    """Compile the decoder of an optional type, which converts a blank \
+    string to None.
+
+    :param decode_value: The decoder of the type that is not None.
+    :type decode_value: Decoder
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    def decode(value: Any) -> Any:
+        return None if value == '' else decode_value(value)
+
+    return decode
+
+def _compile_records_decoder(decode_record: Decoder) -> PageDecoder:
+    """Compile the decoder of a page that converts one record at a time.
+
+    :param decode_record: The decoder of the records.
+    :type decode_record: Decoder
+
+    :return: The decoder.
+    :rtype: PageDecoder
+    """
+    def decode(page: list) -> list:
+        return [decode_record(v) for v in page]
+
+    return decode
+
+def _compile_column_decoder(
+    field_type: Any,
+    ignore_keys: KeyPathTrie | None=None,
+    key: str='',
+) -> _ColumnDecoder:
+    """Compile the decoder of a column of values of a field.
+
+    :param field_type: The type of the field.
+    :type field_type: Any
+
+    :param ignore_keys: Trie of the key paths to ignore below the records. \
+        Defaults to None.
+    :type ignore_keys: KeyPathTrie or None
+
+    :param key: Key of the field. Defaults to blank string.
+    :type key: str
+
+    :return: The decoder.
+    :rtype: _ColumnDecoder
+    """
+    if ignore_keys and key in ignore_keys:
+        decode_value = _compile_field_decoder(field_type, ignore_keys, key)
+        if decode_value is _decode_as_is:
+            return _decode_column_as_is
+
+        def decode_ignoring(column: Sequence) -> Sequence:
+            return list(map(decode_value, column))
+
+        return decode_ignoring
+
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    if origin in (NotRequired, Required):
+        return _compile_column_decoder(args[0])
+
+    if origin in (Union, UnionType):
+        types = [t for t in args if t is not NoneType]
+        if len(types) == 1:
+            return _compile_optional_column_decoder(
+                _compile_column_decoder(types[0]),
+            )
+
+    column_decoder = _SCALAR_COLUMN_DECODERS.get(field_type)
+    if column_decoder is not None:
+        return column_decoder
+
+    decode_value = compile_decoder(field_type)
+    if decode_value is _decode_as_is:
+        return _decode_column_as_is
+
+    def decode(column: Sequence) -> Sequence:
+        return list(map(decode_value, column))
+
+    return decode
+
+def _compile_optional_column_decoder(
+    decode_column: _ColumnDecoder,
+) -> _ColumnDecoder:
+    """Compile the decoder of a column of an optional type, which converts \
+    blank strings to None.
+
+    :param decode_column: The decoder of the column of the type that is not \
+        None.
+    :type decode_column: _ColumnDecoder
+
+    :return: The decoder.
+    :rtype: _ColumnDecoder
+    """
+    def decode(column: Sequence) -> Sequence:
+        # the column decoders leave None as it is
+        return decode_column([None if v == '' else v for v in column])
+
+    return decode
+
+def _decode_as_is(value: Any) -> Any:
+    """Leave a value as it is.
+
+    :param value: The value.
+    :type value: Any
+
+    :return: The value.
+    :rtype: Any
+    """
+    return value
+
+def _decode_number(number_type: type) -> Decoder:
+    """Create the decoder of a number type.
+
+    :param number_type: ``int`` or ``float``.
+    :type number_type: type
+
+    :return: The decoder.
+    :rtype: Decoder
+    """
+    convert = _float_or_int if number_type is float else number_type
+
+    def decode(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        if value == '':
+            return None
+
+        try:
+            return convert(value)
+        except ValueError:
+            return value
+
+    return decode
+
+def _float_or_int(value: str) -> float | int:
+    """Convert a number string to a ``float``, or to an ``int`` if it is an \
+    integer string, e.g. "22", like ``sanitise_string()`` does.
+
+    :param value: The number string.
+    :type value: str
+
+    :raises ValueError: The value is not a number string.
+
+    :return: The number.
+    :rtype: float or int
+    """
+    number = float(value)
+    if number.is_integer() and _is_integer_string(value):
+        return int(value)
+
+    return number
+
+def _is_integer_string(value: str) -> bool:
+    """True if a string that ``float()`` accepts is also accepted by \
+    ``int()``, i.e. it has no decimal point or exponent.
+
+    :param value: The number string.
+    :type value: str
+
+    :return: True if it is an integer string.
+    :rtype: bool
+    """
+    return '.' not in value and 'e' not in value and 'E' not in value
+
+def _decode_datetime(value: Any) -> Any:
+    """Convert a string to a ``datetime``, ``date`` or ``time``.
+
+    :param value: The value.
+    :type value: Any
+
+    :return: The converted value.
+    :rtype: Any
+    """
+    if not isinstance(value, str):
+        return value
+    if value == '':
+        return None
+
+    dt = datetime_or_none_from_string(value)
+
+    return value if dt is None else dt
+
+_SCALAR_DECODERS: dict[Any, Decoder] = {
+    str: _decode_as_is,
+    int: _decode_number(int),
+    float: _decode_number(float),
+    datetime: _decode_datetime,
+    date: _decode_datetime,
+    time: _decode_datetime,
+}
+
+def _decode_column_as_is(column: Sequence) -> Sequence:
+    """Leave a column as it is.
+
+    :param column: The values.
+    :type column: Sequence
+
+    :return: The values.
+    :rtype: Sequence
+    """
+    return column
+
+def _decode_number_column(number_type: type) -> _ColumnDecoder:
+    """Create the decoder of a column of a number type.
+
+    :param number_type: ``int`` or ``float``.
+    :type number_type: type
+
+    :return: The decoder.
+    :rtype: _ColumnDecoder
+    """
+    decode_value = _SCALAR_DECODERS[number_type]
+
+    def decode(column: Sequence) -> Sequence:
+        value_types = set(map(type, column))
+
+        if value_types == {str}:
+            # e.g. a column of "42"; blank and other strings are left to
+            # the decoder of each value
+            try:
+                numbers = list(map(number_type, column))
+            except ValueError:
+                pass
+            else:
+                if number_type is not float \
+                    or not any(map(float.is_integer, numbers)):
+                    return numbers
+                # e.g. a column of "22" and "7.4"
+                return [
+                    int(v) if n.is_integer() and _is_integer_string(v) \
+                        else n for n, v in zip(numbers, column)
+                ]
+        elif not any(issubclass(t, str) for t in value_types):
+            # e.g. a column of numbers
+            return column
+
+        return list(map(decode_value, column))
+
+    return decode
+
+def _decode_datetime_column(column: Sequence) -> Sequence:
+    """Convert a column of strings to ``datetime``, ``date`` or ``time``, \
+    parsing each unique string once.
+
+    :param column: The values.
+    :type column: Sequence
+
+    :return: The converted values.
+    :rtype: Sequence
+    """
+    try:
+        parsed = {
+            v: _decode_datetime(v) for v in set(column) if isinstance(v, str)
+        }
+    except TypeError:
+        # some values are unhashable, e.g. lists
+        return list(map(_decode_datetime, column))
+
+    return list(map(parsed.get, column, column))
+
+_SCALAR_COLUMN_DECODERS: dict[Any, _ColumnDecoder] = {
+    str: _decode_column_as_is,
+    int: _decode_number_column(int),
+    float: _decode_number_column(float),
+    datetime: _decode_datetime_column,
+    date: _decode_datetime_column,
+    time: _decode_datetime_column,
+}
+
+__all__ = [
+    'Decoder',
+    'PageDecoder',
+    'compile_decoder',
+    'compile_page_decoder',
+]
@@ -44,6 +44,7 @@ class Client(LandTransportSg):
     @typechecked
     def ev_charging_points(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[EVChargingPointsArgsDict],
     ) -> EVChargingPointsDict:
         """Returns electric vehicle charging points in Singapore and their \
@@ -53,6 +54,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: EVChargingPointsArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: postal_code is not a 6-digit string.
 
         :return: Available EV charging points at the specified location.
@@ -76,15 +82,25 @@ class Client(LandTransportSg):
             params=params,
             cache_duration=CACHE_FIVE_MINUTES,
             sanitise_ignore_keys=EV_CHARGING_POINTS_SANITISE_IGNORE_KEYS,
+            record_type=EVChargingPointsDict,
+            deadline=deadline,
         )
 
         return ev_charging_points
 
     @typechecked
-    def ev_charging_points_batch(self) -> Url:
+    def ev_charging_points_batch(
+        self,
+        deadline: float | None=None,
+    ) -> Url:
         """Get all electric vehicle charging points in Singapore and their \
             availabilities in a single file.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Link for downloading the requested file.
         :rtype: Url
         """
@@ -93,6 +109,7 @@ class Client(LandTransportSg):
         ev_charging_points_batch_link = self.send_download_request(
             EV_CHARGING_POINTS_BATCH_API_ENDPOINT,
             cache_duration=CACHE_FIVE_MINUTES,
+            deadline=deadline,
         )
 
         return ev_charging_points_batch_link
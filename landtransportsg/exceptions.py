@@ -18,6 +18,8 @@ from typing import Any
 
 from typeguard import typechecked
 
+from .pagination import PaginationCursor
+
 @typechecked
 class APIError(Exception):
     """Error when the API returns an error.
@@ -48,6 +50,95 @@ class APIError(Exception):
         if errors:
             self.errors = errors
 
+@typechecked
+class PaginationError(APIError):
+    """Error when a request fails after some of its pages have been fetched.
+
+    :param message: The general error message to display when the error is \
+        raised.
+    :type message: str
+
+    :param cursor: Position of the request when it failed. Pass this to \
+        ``LandTransportSg.resume_request()`` to fetch the remaining pages.
+    :type cursor: PaginationCursor
+
+    :param data: Records from the pages that were fetched before the \
+        request failed. Defaults to None.
+    :type data: Any or None
+
+    :param errors: Other messages that were part of the raised error. \
+        Defaults to None.
+    :type errors: Any or None
+    """
+    def __init__(
+        self,
+        message: str,
+        cursor: PaginationCursor,
+        data: Any | None=None,
+        errors: Any | None=None,
+    ) -> None:
+        """Constructor method"""
+        super().__init__(message, data=data, errors=errors)
+        self.cursor = cursor
+
+@typechecked
+class CircuitOpenError(APIError):
+    """Error when a request is not sent because its endpoint's circuit is \
+    open, i.e. the endpoint has been failing.
+
+    :param message: The general error message to display when the error is \
+        raised.
+    :type message: str
+
+    :param endpoint: The endpoint whose circuit is open.
+    :type endpoint: str
+
+    :param retry_in: Number of seconds until the circuit lets a request \
+        through to probe the endpoint.
+    :type retry_in: float
+
+    :param data: Data response obtained by the calling method. Defaults to \
+        None.
+    :type data: Any or None
+
+    :param errors: Other messages that were part of the raised error. \
+        Defaults to None.
+    :type errors: Any or None
+    """
+    def __init__(
+        self,
+        message: str,
+        endpoint: str,
+        retry_in: float,
+        data: Any | None=None,
+        errors: Any | None=None,
+    ) -> None:
+        """Constructor method"""
+        super().__init__(message, data=data, errors=errors)
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+@typechecked
+class DeadlineExceededError(APIError):
+    """Error when a request does not finish before its deadline, and no \
+    cached response can be returned instead.
+
+    :param message: The general error message to display when the error is \
+        raised.
+    :type message: str
+
+    :param data: Data response obtained by the calling method. Defaults to \
+        None.
+    :type data: Any or None
+
+    :param errors: Other messages that were part of the raised error. \
+        Defaults to None.
+    :type errors: Any or None
+    """
+
 __all__ = [
     'APIError',
+    'CircuitOpenError',
+    'DeadlineExceededError',
+    'PaginationError',
 ]
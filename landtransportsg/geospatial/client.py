@@ -53,6 +53,7 @@ class Client(LandTransportSg):
     @typechecked
     def geospatial_whole_island(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[GeospatiaWholeIslandArgsDict],
     ) -> Url:
         """Get the SHP files of the requested geospatial layer.
@@ -61,6 +62,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: GeospatiaWholeIslandArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: geospatial_layer_id is not a valid ID.
 
         :return: Link for downloading the requested SHP file.
@@ -84,6 +90,7 @@ class Client(LandTransportSg):
             GEOSPATIAL_WHOLE_ISLAND_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_FIVE_MINUTES,
+            deadline=deadline,
         )
 
         return geospatial_whole_island_link
@@ -0,0 +1,412 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Send a second request when the first one is slower than usual."""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from typeguard import typechecked
+
+from .constants import NAME
+
+class Hedger:
+    """Hedge calls that are slower than usual with a second identical call, \
+    and return the result of whichever call finishes first.
+
+    The delay before hedging a call is the ``percentile`` of the latencies of \
+        the latest calls with the same key, e.g. the 95th percentile means \
+        that about 5% of the calls are hedged. Until there are enough \
+        latencies, ``initial_delay`` is used instead. The number of hedged \
+        calls is capped at ``budget`` of all calls, so that hedging cannot \
+        add more than that much load, e.g. during an outage when every call \
+        is slow.
+
+    The slower call is cancelled if it has not started. Otherwise, it runs \
+        to the end in the background, and its result is passed to \
+        ``discard``, e.g. to close its response. A hedger is thread-safe, so \
+        it can be shared by several clients and threads. Coroutines are \
+        hedged with ``run_async()`` instead, in the running event loop.
+
+    Example usage:
+
+    .. code-block:: python
+
+        hedger = Hedger(percentile=95, budget=0.05)
+        response = hedger.run(url, partial(requests.get, url))
+
+    :param percentile: Percentile of the latest latencies to wait for before \
+        hedging a call. Defaults to 95.
+    :type percentile: float
+
+    :param budget: Maximum fraction of calls that are hedged. Defaults to \
+        0.05, i.e. 5%.
+    :type budget: float
+
+    :param initial_delay: Number of seconds to wait before hedging a call \
+        while there are fewer than ``min_samples`` latencies. Defaults to 1.
+    :type initial_delay: float
+
+    :param min_delay: Minimum number of seconds to wait before hedging a \
+        call. Defaults to 0.01.
+    :type min_delay: float
+
+    :param window: Number of the latest latencies to keep for each key. \
+        Defaults to 100.
+    :type window: int
+
+    :param min_samples: Number of latencies that are needed to use the \
+        percentile. Defaults to 10.
+    :type min_samples: int
+
+    :param max_workers: Maximum number of calls that can run at the same \
+        time. Defaults to 32.
+    :type max_workers: int
+
+    :raises ValueError: percentile is not more than 0 or is more than 100.
+    :raises ValueError: budget is less than 0 or more than 1.
+    :raises ValueError: initial_delay or min_delay is less than 0.
+    :raises ValueError: window, min_samples or max_workers is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        percentile: float=95,
+        budget: float=0.05,
+        initial_delay: float=1,
+        min_delay: float=0.01,
+        window: int=100,
+        min_samples: int=10,
+        max_workers: int=32,
+    ) -> None:
+        """Constructor method"""
+        if not 0 < percentile <= 100:
+            raise ValueError(
+                'Argument "percentile" must be more than 0 and not more ' \
+                    'than 100.'
+            )
+        if not 0 <= budget <= 1:
+            raise ValueError(
+                'Argument "budget" must be between 0 and 1.'
+            )
+        if initial_delay < 0:
+            raise ValueError(
+                'Argument "initial_delay" cannot be less than 0.'
+            )
+        if min_delay < 0:
+            raise ValueError('Argument "min_delay" cannot be less than 0.')
+        if window < 1:
+            raise ValueError('Argument "window" cannot be less than 1.')
+        if min_samples < 1:
+            raise ValueError('Argument "min_samples" cannot be less than 1.')
+        if max_workers < 1:
+            raise ValueError('Argument "max_workers" cannot be less than 1.')
+
+        self.percentile = percentile
+        self.budget = budget
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min_samples
+
+        self.calls: int = 0
+        """Number of calls that have been run."""
+        self.hedges: int = 0
+        """Number of calls that have been hedged."""
+
+        self.__latencies: dict[Hashable, deque[float]] = {}
+        self.__lock = Lock()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f'{NAME}_hedger',
+        )
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(percentile={self.percentile}, ' \
+            f'budget={self.budget}, calls={self.calls}, ' \
+            f'hedges={self.hedges})'
+
+    @typechecked
+    def delay(self, key: Hashable) -> float:
+        """Return the number of seconds to wait before hedging a call.
+
+        :param key: Key of the call, e.g. its endpoint.
+        :type key: Hashable
+
+        :return: The delay.
+        :rtype: float
+        """
+        with self.__lock:
+            latencies = sorted(self.__latencies.get(key, ()))
+
+        if len(latencies) < self.min_samples:
+            return max(self.initial_delay, self.min_delay)
+
+        index = ceil(len(latencies) * self.percentile / 100) - 1
+
+        return max(latencies[index], self.min_delay)
+
+    @typechecked
+    def record(self, key: Hashable, latency: float) -> None:
+        """Record the latency of a call.
+
+        :param key: Key of the call, e.g. its endpoint.
+        :type key: Hashable
+
+        :param latency: Number of seconds that the call took.
+        :type latency: float
+        """
+        with self.__lock:
+            latencies = self.__latencies.setdefault(
+                key,
+                deque(maxlen=self.window),
+            )
+            latencies.append(latency)
+
+    @typechecked
+    def run(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        is_sample: Callable[[Any], bool] | None=None,
+        discard: Callable[[Any], None] | None=None,
+    ) -> Any:
+        """Call a function, and call it again if the first call is slower \
+        than usual and the budget allows it.
+
+        :param key: Key of the call, e.g. its endpoint. Latencies are kept \
+            by key.
+        :type key: Hashable
+
+        :param func: Function to call, without arguments.
+        :type func: Callable[[], Any]
+
+        :param is_sample: Function that returns False if the latency of a \
+            result is not to be recorded, e.g. because it was served from a \
+            cache. Defaults to None, i.e. record every latency.
+        :type is_sample: Callable[[Any], bool] or None
+
+        :param discard: Function to call with the result of the slower call. \
+            Defaults to None.
+        :type discard: Callable[[Any], None] or None
+
+        :raises Exception: Every call raised an exception. The exception of \
+            the first call to fail is raised.
+
+        :return: Result of the call that finished first without an exception.
+        :rtype: Any
+        """
+        delay = self.delay(key)
+        started_at = monotonic()
+
+        def record_latency(future: Future) -> None:
+            if future.exception() is None \
+                and (is_sample is None or is_sample(future.result())):
+                self.record(key, monotonic() - started_at)
+
+        # only the first call's latency is recorded, because a hedged call's
+        # latency does not include the delay before it was sent
+        first_call = self.__executor.submit(func)
+        first_call.add_done_callback(record_latency)
+        futures = [first_call]
+
+        with self.__lock:
+            self.calls += 1
+
+        done, _ = wait(futures, timeout=delay)
+        if len(done) == 0 and self.__take_hedge():
+            futures.append(self.__executor.submit(func))
+
+        winner = self.__wait_for_winner(futures)
+
+        for future in futures:
+            if future is not winner and not future.cancel() \
+                and discard is not None:
+                future.add_done_callback(
+                    lambda f: discard(f.result()) \
+                        if f.exception() is None else None,
+                )
+
+        return winner.result()
+
+    @typechecked
+    async def run_async(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        is_sample: Callable[[Any], bool] | None=None,
+        discard: Callable[[Any], None] | None=None,
+    ) -> Any:
+        """Same as ``run()``, but for a coroutine function, whose calls are \
+        run as tasks in the running event loop instead of in threads. The \
+        slower call is cancelled, unless it has finished already, in which \
+        case its result is passed to ``discard``.
+
+        :param key: Key of the call, e.g. its endpoint. Latencies are kept \
+            by key.
+        :type key: Hashable
+
+        :param func: Coroutine function to call, without arguments.
+        :type func: Callable[[], Awaitable[Any]]
+
+        :param is_sample: Function that returns False if the latency of a \
+            result is not to be recorded, e.g. because it was served from a \
+            cache. Defaults to None, i.e. record every latency.
+        :type is_sample: Callable[[Any], bool] or None
+
+        :param discard: Function to call with the result of the slower call. \
+            Defaults to None.
+        :type discard: Callable[[Any], None] or None
+
+        :raises Exception: Every call raised an exception. The exception of \
+            the first call to fail is raised.
+
+        :return: Result of the call that finished first without an exception.
+        :rtype: Any
+        """
+        delay = self.delay(key)
+        started_at = monotonic()
+
+        def record_latency(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is None \
+                and (is_sample is None or is_sample(task.result())):
+                self.record(key, monotonic() - started_at)
+
+        first_call = asyncio.ensure_future(func())
+        first_call.add_done_callback(record_latency)
+        tasks = [first_call]
+
+        with self.__lock:
+            self.calls += 1
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if len(done) == 0 and self.__take_hedge():
+                tasks.append(asyncio.ensure_future(func()))
+
+            winner = await self.__wait_for_winner_async(tasks)
+        except BaseException:
+            for task in tasks:
+                _ = task.cancel()
+            raise
+
+        for task in tasks:
+            if task is winner:
+                continue
+            if not task.done():
+                _ = task.cancel()
+            elif not task.cancelled() and task.exception() is None \
+                and discard is not None:
+                discard(task.result())
+
+        return winner.result()
+
+    @typechecked
+    def shutdown(self) -> None:
+        """Wait for the calls that are running to finish, then release the \
+        threads."""
+        self.__executor.shutdown(wait=True)
+
+# private
+
+    @typechecked
+    def __take_hedge(self) -> bool:
+        """Count a hedged call if the budget allows it.
+
+        :return: True if the call can be hedged.
+        :rtype: bool
+        """
+        with self.__lock:
+            if self.hedges + 1 > self.budget * self.calls:
+                return False
+
+            self.hedges += 1
+            return True
+
+    @typechecked
+    def __wait_for_winner(self, futures: list[Future]) -> Future:
+        """Wait for the first call that finishes without an exception.
+
+        :param futures: The calls.
+        :type futures: list[Future]
+
+        :raises Exception: Every call raised an exception.
+
+        :return: The call that finished first without an exception.
+        :rtype: Future
+        """
+        pending = set(futures)
+        first_error: BaseException | None = None
+
+        while len(pending) > 0:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in sorted(done, key=futures.index):
+                error = future.exception()
+                if error is None:
+                    return future
+                if first_error is None:
+                    first_error = error
+
+        raise first_error
+
+    async def __wait_for_winner_async(
+        self,
+        tasks: list[asyncio.Task],
+    ) -> asyncio.Task:
+        """Wait for the first task that finishes without an exception.
+
+        :param tasks: The calls.
+        :type tasks: list[asyncio.Task]
+
+        :raises Exception: Every call raised an exception.
+
+        :return: The call that finished first without an exception.
+        :rtype: asyncio.Task
+        """
+        pending = set(tasks)
+        first_error: BaseException | None = None
+
+        while len(pending) > 0:
+            done, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            for task in sorted(done, key=tasks.index):
+                error = task.exception()
+                if error is None:
+                    return task
+                if first_error is None:
+                    first_error = error
+
+        raise first_error
+
+__all__ = [
+    'Hedger',
+]
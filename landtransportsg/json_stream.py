@@ -0,0 +1,256 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode the ``value`` array of a response body one item at a time."""
+
+from codecs import getincrementaldecoder
+from collections.abc import Iterable, Iterator
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, NoReturn
+
+from typeguard import typechecked
+
+NUMBER_CHARS = '0123456789+-.eE'
+WHITESPACE = ' \t\n\r'
+
+class JSONValueStream:
+    """Decoder of a JSON document that is read in chunks.
+
+    If the document is an object with a ``value`` array, which is how LTA \
+        DataMall returns its records, then iterating over the stream yields \
+        the array's items one at a time, without decoding the whole document \
+        first. The other members of the object are collected in \
+        ``document``.
+
+    Otherwise, the whole document is decoded into ``document`` and iterating \
+        over the stream yields nothing.
+
+    Example usage:
+
+    .. code-block:: python
+
+        stream = JSONValueStream(response.iter_content(chunk_size=65536))
+        for record in stream:
+            ...
+
+        if not stream.is_streamed:
+            value = stream.document
+
+    :param chunks: Chunks of the document, as bytes encoded in UTF-8 or as \
+        strings.
+    :type chunks: Iterable[bytes | str]
+    """
+
+    @typechecked
+    def __init__(self, chunks: Iterable[bytes | str]) -> None:
+        """Constructor method"""
+        self.document: Any = None
+        """Members of the object other than ``value``, or the whole \
+        document if it is not an object with a ``value`` array."""
+        self.is_streamed: bool = False
+        """True if the document has a ``value`` array."""
+
+        self.__chunks = iter(chunks)
+        self.__text_decoder = getincrementaldecoder('utf-8-sig')()
+        self.__json_decoder = JSONDecoder()
+        self.__buffer = ''
+        self.__pos = 0
+        self.__is_exhausted = False
+
+    @typechecked
+    def __iter__(self) -> Iterator[Any]:
+        """Decode the document, yielding the items of its ``value`` array.
+
+        :raises JSONDecodeError: The document is not valid JSON.
+
+        :return: Items of the ``value`` array.
+        :rtype: Iterator[Any]
+        """
+        if self.__peek() != '{':
+            self.document = self.__decode()
+            self.__expect_end()
+            return
+
+        self.document = {}
+        self.__pos += 1
+
+        if self.__peek() == '}':
+            self.__pos += 1
+            self.__expect_end()
+            return
+
+        while True:
+            key = self.__decode()
+            if not isinstance(key, str):
+                self.__raise(
+                    'Expecting property name enclosed in double quotes',
+                )
+            self.__expect(':')
+
+            if key == 'value' and self.__peek() == '[':
+                self.is_streamed = True
+                yield from self.__iter_array()
+            else:
+                self.document[key] = self.__decode()
+
+            if self.__peek() == '}':
+                self.__pos += 1
+                break
+            self.__expect(',')
+
+        self.__expect_end()
+
+# private
+
+    @typechecked
+    def __iter_array(self) -> Iterator[Any]:
+        """Yield the items of the array at the current position.
+
+        :raises JSONDecodeError: The array is not valid JSON.
+
+        :return: Items of the array.
+        :rtype: Iterator[Any]
+        """
+        self.__pos += 1
+
+        if self.__peek() == ']':
+            self.__pos += 1
+            return
+
+        while True:
+            yield self.__decode()
+
+            if self.__peek() == ']':
+                self.__pos += 1
+                return
+            self.__expect(',')
+
+    @typechecked
+    def __read_chunk(self) -> bool:
+        """Append the next chunk of the document to the buffer, discarding \
+        the part of the buffer that has been decoded.
+
+        :return: True if a chunk was read, or False if there are no more \
+            chunks.
+        :rtype: bool
+        """
+        if self.__is_exhausted:
+            return False
+
+        chunk = next(self.__chunks, None)
+        if chunk is None:
+            self.__is_exhausted = True
+            text = self.__text_decoder.decode(b'', final=True)
+        elif isinstance(chunk, bytes):
+            text = self.__text_decoder.decode(chunk)
+        else:
+            text = chunk
+
+        self.__buffer = self.__buffer[self.__pos:] + text
+        self.__pos = 0
+
+        return True
+
+    @typechecked
+    def __peek(self) -> str:
+        """Skip whitespace and return the next character of the document.
+
+        :return: The next character, or a blank string at the end of the \
+            document.
+        :rtype: str
+        """
+        while True:
+            while self.__pos < len(self.__buffer) \
+                and self.__buffer[self.__pos] in WHITESPACE:
+                self.__pos += 1
+
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+
+            if not self.__read_chunk():
+                return ''
+
+    @typechecked
+    def __decode(self) -> Any:
+        """Decode the JSON value at the current position.
+
+        A number that ends near the end of the buffer is decoded again after \
+        the next chunk is read, because it may continue into that chunk.
+
+        :raises JSONDecodeError: The value is not valid JSON.
+
+        :return: The decoded value.
+        :rtype: Any
+        """
+        _ = self.__peek()
+
+        while True:
+            try:
+                value, end = self.__json_decoder.raw_decode(
+                    self.__buffer,
+                    self.__pos,
+                )
+            except JSONDecodeError:
+                if self.__read_chunk():
+                    continue
+                raise
+
+            # a number that runs to the end of the buffer may continue into
+            # the next chunk, e.g. "4444." and "5" for 4444.5
+            if isinstance(value, (int, float)) \
+                and not isinstance(value, bool) \
+                and self.__buffer[end:].strip(NUMBER_CHARS) == '' \
+                and self.__read_chunk():
+                continue
+
+            self.__pos = end
+            return value
+
+    @typechecked
+    def __expect(self, char: str) -> None:
+        """Move past the expected character at the current position.
+
+        :param char: The expected character.
+        :type char: str
+
+        :raises JSONDecodeError: The character is not found.
+        """
+        if self.__peek() != char:
+            self.__raise(f"Expecting '{char}' delimiter")
+
+        self.__pos += 1
+
+    @typechecked
+    def __expect_end(self) -> None:
+        """Check that there is nothing after the decoded document.
+
+        :raises JSONDecodeError: There is extra data after the document.
+        """
+        if self.__peek() != '':
+            self.__raise('Extra data')
+
+    @typechecked
+    def __raise(self, message: str) -> NoReturn:
+        """Raise an error at the current position of the buffer.
+
+        :param message: Description of the error.
+        :type message: str
+
+        :raises JSONDecodeError: Always.
+        """
+        raise JSONDecodeError(message, self.__buffer, self.__pos)
+
+__all__ = [
+    'JSONValueStream',
+]
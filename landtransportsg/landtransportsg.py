@@ -14,18 +14,61 @@
 
 """Client mixin for interacting with all of the API endpoints."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from json import JSONDecodeError
+from collections.abc import Callable, Iterator
 from datetime import date, datetime
+from threading import local
 from typing import Any
 
 from requests import codes as requests_codes
-from requests.adapters import HTTPAdapter, Retry
-from requests_cache import BaseCache, CachedSession
+from requests import Request, RequestException, Session
+from requests_cache import DO_NOT_CACHE, BaseCache, CachedSession
 from typeguard import check_type, typechecked
 
-from .constants import CACHE_NAME, USER_AGENT
-from .exceptions import APIError
-from .timezone import datetime_from_string
+from .cache import (
+    BoundedSQLiteCache,
+    MemoryCache,
+    ResponseMemo,
+    canonical_params,
+)
+from .concurrency import DEFAULT_SINGLE_FLIGHT
+from .config import CacheConfig, ConnectionConfig, ResilienceConfig
+from .constants import (
+    BASE_API_DOMAIN,
+    CACHE_NAME,
+    JSON_STREAM_CHUNK_SIZE,
+    PAGE_SIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+    USER_AGENT,
+)
+from .deadline import (
+    Deadline,
+    DeadlineRetry,
+    DeadlineTimeout,
+    current_deadline,
+)
+from .decoders import compile_decoder, compile_page_decoder
+from .exceptions import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    PaginationError,
+)
+from .json_stream import JSONValueStream
+from .pagination import PaginationCursor
+from .rate_limiter import RateLimitedHTTPAdapter
+from .sanitise import (
+    LIST_ITEMS,
+    compile_ignore_keys,
+    sanitise_string,
+    sanitise_value,
+)
 from .types import Url
 
 class LandTransportSg:
@@ -38,7 +81,12 @@ class LandTransportSg:
 
     - Connection retries using exponential backoff. \
         (Reference: https://stackoverflow.com/a/35504626.)
+    - Connection pool size and request timeouts.
+    - Rate limit, which is shared by all clients unless a client is given \
+        its own rate limiter.
     - Cache (cache duration/expiry is set in ``send_request()``).
+    - Session, which can be shared with other clients so that they use the \
+        same connection pool and cache.
     - Account key. An account key is required to use the LTA DataMall API. \
         Request for one from \
         https://www.mytransport.sg/content/mytransport/home/dataMall/request-for-api.html.
@@ -46,11 +94,57 @@ class LandTransportSg:
 
     :param cache_backend: Cache backend name or instance to use. Refer to \
         https://requests-cache.readthedocs.io/en/stable/user_guide/backends.html \
-        for more information and allowed values. Defaults to "sqlite".
+        for more information and allowed values. "bounded_sqlite" uses a \
+        ``BoundedSQLiteCache`` with its default limits. Defaults to "sqlite".
     :type cache_backend: str | BaseCache
 
     :param account_key: The LTA DataMall-assigned Account key.
     :type account_key: str
+
+    :param pagination_workers: Number of pages to fetch concurrently when an \
+        endpoint returns more than one page of records. Defaults to 1, i.e. \
+        fetch pages one after another.
+    :type pagination_workers: int
+
+    :param session: Session to send requests with, e.g. the ``session`` of \
+        another client. If it is given, then the account key and user-agent \
+        headers are added to it, but ``cache_backend``, and the rate \
+        limiter, circuit breaker and ``pool_*`` options of ``connection`` \
+        and ``resilience``, are not used. Defaults to None, i.e. create a \
+        new session.
+    :type session: CachedSession or None
+
+    :param stream_json: If True, then each page's response body is read in \
+        chunks, and the records in its ``value`` array are decoded and \
+        sanitised one at a time, instead of decoding the whole body before \
+        sanitising it, so the unsanitised records of a page are never all \
+        held in memory, and neither is the response body. The cache backend \
+        reads the whole body of a response that it stores, so a response \
+        that is not cached, or has expired, is not stored in the cache \
+        backend. Its sanitised page is kept in the in-memory cache instead, \
+        which is created with the default size if ``memory_cache_size`` is \
+        0, until the cache duration of its request ends. A response that \
+        is still in the cache backend, e.g. one stored by a client without \
+        ``stream_json``, is served from there. Streamed responses are not \
+        served stale, and the deadline and circuit breaker fallbacks cannot \
+        use them. The asyncio clients always read the whole body of a \
+        response before decoding it. Defaults to False.
+    :type stream_json: bool
+
+    :param connection: Connection pool, timeout and rate limiter options. \
+        Defaults to None, i.e. ``ConnectionConfig()``.
+    :type connection: ConnectionConfig or None
+
+    :param caching: Options to reuse responses in memory, coalesce \
+        identical requests and serve stale responses. Defaults to None, \
+        i.e. ``CacheConfig()``.
+    :type caching: CacheConfig or None
+
+    :param resilience: Deadline, circuit breaker and hedging options. \
+        Defaults to None, i.e. ``ResilienceConfig()``.
+    :type resilience: ResilienceConfig or None
+
+    :raises ValueError: pagination_workers is less than 1.
     """
 
     @typechecked
@@ -58,26 +152,55 @@ class LandTransportSg:
         self,
         account_key: str,
         cache_backend: str | BaseCache='sqlite',
+        pagination_workers: int=1,
+        session: CachedSession | None=None,
+        stream_json: bool=False,
+        connection: ConnectionConfig | None=None,
+        caching: CacheConfig | None=None,
+        resilience: ResilienceConfig | None=None,
     ) -> None:
         """Constructor method"""
+        if pagination_workers < 1:
+            raise ValueError(
+                'Argument "pagination_workers" cannot be less than 1.'
+            )
+
+        self.pagination_workers = pagination_workers
+        self.stream_json = stream_json
+        self.connection = ConnectionConfig() if connection is None \
+            else connection
+        self.caching = CacheConfig() if caching is None else caching
+        self.resilience = ResilienceConfig() if resilience is None \
+            else resilience
+
+        self.response_memo = ResponseMemo(self.caching.memo_size) \
+            if self.caching.memo_size > 0 else None
+        # streamed pages are not stored in the cache backend, so they are
+        # kept in an in-memory cache instead
+        self.memory_cache = MemoryCache(self.caching.memory_cache_size) \
+            if self.caching.memory_cache_size > 0 \
+            else MemoryCache() if stream_json else None
+
+        self.__local = local()
+
         headers = {
             'AccountKey': account_key,
             'Accept': 'application/json',
             'User-Agent': USER_AGENT,
         }
 
-        retries = Retry(
-            total=5,
-            backoff_factor=0.1,
-            status_forcelist=[500, 502, 503, 504]
-        )
+        if session is None:
+            session = self.__create_session(cache_backend)
 
-        self.session = CachedSession(
-            CACHE_NAME,
-            backend=cache_backend,
-            stale_if_error=False,
-        )
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        adapter = session.get_adapter(BASE_API_DOMAIN)
+        if isinstance(adapter, RateLimitedHTTPAdapter):
+            self.rate_limiter = adapter.rate_limiter
+            self.circuit_breaker = adapter.circuit_breaker
+        else:
+            self.rate_limiter = self.connection.rate_limiter
+            self.circuit_breaker = self.resilience.circuit_breaker
+
+        self.session = session
         self.session.headers.update(headers)
 
     @typechecked
@@ -85,6 +208,67 @@ class LandTransportSg:
         """String representation"""
         return f'{self.__class__} ({USER_AGENT})'
 
+    @typechecked
+    def warm_up(self, connections: int=1) -> None:
+        """Open connections to the LTA DataMall server ahead of the first \
+        request, so that the first requests do not wait for the TCP and TLS \
+        handshakes. The connections are kept alive in the session's \
+        connection pool.
+
+        :param connections: Number of connections to open at the same time. \
+            Defaults to 1.
+        :type connections: int
+
+        :raises ValueError: connections is less than 1.
+        :raises RequestException: Error occurred while connecting.
+        """
+        if connections < 1:
+            raise ValueError('Argument "connections" cannot be less than 1.')
+
+        def open_connection(_: int) -> None:
+            response = self.session.head(
+                BASE_API_DOMAIN,
+                expire_after=DO_NOT_CACHE,
+                timeout=self.connection.timeout,
+            )
+            response.close()
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            _ = list(executor.map(open_connection, range(connections)))
+
+    @contextmanager
+    @typechecked
+    def force_refresh(self) -> Iterator[list[int]]:
+        """Send the requests that are made in this context to the endpoints, \
+        even if their responses are cached, and cache the new responses.
+
+        Only requests that are made from the current thread are affected. \
+        The cache duration of each request is added to the yielded list, so \
+        that callers can tell when the refreshed responses expire.
+
+        Example usage:
+
+        .. code-block:: python
+
+            with client.force_refresh() as cache_durations:
+                _ = client.bus_stops()
+
+        :return: List of the cache durations of the requests that are made.
+        :rtype: Iterator[list[int]]
+        """
+        cache_durations: list[int] = []
+        previous_cache_durations = getattr(
+            self.__local,
+            'refresh_cache_durations',
+            None,
+        )
+
+        self.__local.refresh_cache_durations = cache_durations
+        try:
+            yield cache_durations
+        finally:
+            self.__local.refresh_cache_durations = previous_cache_durations
+
     @typechecked
     def build_params(
         self,
@@ -180,7 +364,8 @@ class LandTransportSg:
         :type iterate: bool
 
         :param ignore_keys: List of dict keys to ignore when sanitising, if \
-            value is a ``dict``. Defaults to None.
+            value is a ``dict``. They are compiled once into a trie with \
+            ``compile_ignore_keys()``. Defaults to None.
         :type ignore_keys: list[str] or None
 
         :param key_path: Current path of key in the dict. Defaults to blank \
@@ -190,79 +375,16 @@ class LandTransportSg:
         :return: The sanitised value.
         :rtype: Any
         """
-        if ignore_keys is None:
-            ignore_keys = []
-
         if iterate:
-            if isinstance(value, list):
-                return [
-                    self.sanitise_data(
-                        v,
-                        iterate=iterate,
-                        ignore_keys=ignore_keys,
-                        key_path=f'{key_path}[]'
-                    ) for v in value
-                ]
-
-            if isinstance(value, dict):
-                sanitised_dict = {}
-                for k, v in value.items():
-                    current_key_path = '.'.join([key_path, k]) \
-                        if key_path else k
-                    if current_key_path in ignore_keys:
-                        sanitised_dict[k] = v
-                    elif isinstance(v, str) and v == '':
-                        sanitised_dict[k] = self.sanitise_data(v)
-                    else:
-                        sanitised_dict[k] = self.sanitise_data(
-                            v,
-                            iterate=iterate,
-                            ignore_keys=ignore_keys,
-                            key_path=current_key_path,
-                        )
-                return sanitised_dict
+            return sanitise_value(
+                value,
+                ignore_keys=compile_ignore_keys(ignore_keys, key_path),
+            )
 
         if not isinstance(value, str):
             return value
 
-        if value == '':
-            return None
-
-        if ',' in value:
-            # Convert to tuple with numbers.
-            split_value = value.split(',')
-            tuple_value = tuple(
-                self.sanitise_data(
-                    v.strip(),
-                    iterate=False,
-                ) for v in split_value
-            )
-            values_are_int = all(
-                isinstance(v, int) for v in tuple_value
-            )
-            values_are_float = all(
-                isinstance(v, float) for v in tuple_value
-            )
-            if (values_are_int or values_are_float):
-                return tuple_value
-
-        try:
-            # pylint: disable=broad-exception-caught
-
-            # Convert to a date/datetime.
-            return datetime_from_string(value)
-        except Exception:
-            try:
-                # Convert to an integer
-                return int(value)
-            except Exception:
-                try:
-                    # Convert to a float
-                    return float(value)
-                except Exception:
-                    pass
-
-        return value
+        return sanitise_string(value)
 
     @typechecked
     def send_request(
@@ -272,6 +394,9 @@ class LandTransportSg:
         cache_duration: int=0,
         sanitise: bool=True,
         sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+        hedge: bool=False,
     ) -> Any:
         """Send a request to an endpoint and return its response.
 
@@ -280,6 +405,20 @@ class LandTransportSg:
             package has not yet been updated to support that change, then \
             applications may use this method to call the changed endpoints.
 
+        If the client's ``caching.coalesce_requests`` is True and \
+            ``cache_duration`` is more than 0, then an identical request \
+            that is already being sent by another thread is not sent again. \
+            Its response is shared instead.
+
+        If there is a deadline, i.e. ``deadline`` or the client's \
+            ``resilience.deadline`` is set, or the request is sent in a ``with \
+            Deadline(...)`` block, then the request must finish by the \
+            earliest deadline, across all of its pages and retries.
+
+        If ``hedge`` is True and the client has a ``resilience.hedger``, \
+            then a page that is slower than usual is requested again, and \
+            the response that arrives first is used.
+
         :param url: The endpoint URL to send the request to.
         :type url: Url
 
@@ -302,35 +441,330 @@ class LandTransportSg:
             Defaults to [].
         :type sanitise_options: list[str]
 
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. If set, then the \
+            values are converted to their annotated types by a decoder that \
+            is compiled from the TypedDict, instead of being sanitised by \
+            ``sanitise_data()``. Values at the ``sanitise_ignore_keys`` are \
+            still left as they are. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :param hedge: If True, then hedge the request with the client's \
+            ``resilience.hedger``. Defaults to False.
+        :type hedge: bool
+
+        :raises ValueError: deadline is not more than 0.
         :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched. The error's ``data`` contains the records from those \
+            pages, and its ``cursor`` can be used to resume the request.
 
         :return: Results from the response.
         :rtype: Any
         """
         data: Any
 
-        if params is None:
-            params = {}
+        cursor = PaginationCursor(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+        )
+        request_deadline = self.__start_deadline(deadline)
+
+        is_refreshing = getattr(
+            self.__local,
+            'refresh_cache_durations',
+            None,
+        ) is not None
+
+        if self.caching.coalesce_requests and cache_duration > 0 \
+            and not is_refreshing:
+            # the session identifies the account key that is used
+            request_key = (
+                id(self.session),
+                url,
+                canonical_params(params),
+                sanitise,
+                tuple(sanitise_ignore_keys or []),
+                record_type,
+            )
+            try:
+                result = DEFAULT_SINGLE_FLIGHT.do(
+                    request_key,
+                    self.__collect_coalesced_pages,
+                    cursor,
+                    sanitise=sanitise,
+                    sanitise_ignore_keys=sanitise_ignore_keys,
+                    record_type=record_type,
+                    deadline=request_deadline,
+                    hedge=hedge,
+                    wait_timeout=None if request_deadline is None \
+                        else request_deadline.remaining,
+                )
+            except TimeoutError:
+                # the identical request did not finish before this request's
+                # deadline, so fall back to the cache, or raise
+                result = None
+            except DeadlineExceededError:
+                if request_deadline is not None and request_deadline.is_missed:
+                    raise
+                # the identical request missed its own deadline, which can be
+                # earlier than this request's
+                result = None
+            else:
+                if result['is_deadline_missed'] and (
+                    request_deadline is None or not request_deadline.is_missed
+                ):
+                    # the result is the identical request's fallback
+                    result = None
+
+            if result is not None:
+                return result['data']
+
+        data = self.__collect_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=request_deadline,
+            hedge=hedge,
+        )
+
+        return data
+
+    @typechecked
+    def resume_request(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> list:
+        """Resume a request that failed after some of its pages were fetched, \
+        and return the records from the remaining pages.
+
+        Example usage:
 
-        if sanitise_ignore_keys is None:
-            sanitise_ignore_keys = []
+        .. code-block:: python
 
-        response_val = self.__collect_response_value(
+            try:
+                records = client.send_request(url)
+            except PaginationError as e:
+                records = e.data + client.resume_request(e.cursor)
+
+        :param cursor: Position of the request when it failed, i.e. the \
+            ``cursor`` of the raised ``PaginationError``.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type iterate: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_options: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. If set, then the \
+            values are converted to their annotated types by a decoder that \
+            is compiled from the TypedDict, instead of being sanitised by \
+            ``sanitise_data()``. Values at the ``sanitise_ignore_keys`` are \
+            still left as they are. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Records from the remaining pages.
+        :rtype: list
+        """
+        data: Any
+
+        data = self.__collect_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=self.__start_deadline(deadline),
+        )
+
+        if data is None:
+            data = []
+
+        return data
+
+    @typechecked
+    def iter_request(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> Iterator[Any]:
+        """Send a request to an endpoint and yield its response one page at a \
+        time.
+
+        This is the same as ``send_request()``, except that each page is \
+        sanitised and yielded as soon as it is received, instead of being \
+        joined with the other pages first. Use this to process large \
+        responses in bounded memory.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Parameter names **must** match the names required by the \
+            endpoints, particularly with typecase (e.g. camelCase). Defaults \
+            to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type iterate: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_options: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. If set, then the \
+            values are converted to their annotated types by a decoder that \
+            is compiled from the TypedDict, instead of being sanitised by \
+            ``sanitise_data()``. Values at the ``sanitise_ignore_keys`` are \
+            still left as they are. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from each page of the response.
+        :rtype: Iterator[Any]
+        """
+        cursor = PaginationCursor(
             url,
             params=params,
             cache_duration=cache_duration,
         )
 
-        if isinstance(response_val, dict) and 'odata.metadata' in response_val:
-            # this isn't documented in LTA Datamall's API guide
-            del response_val['odata.metadata']
+        yield from self.__iter_sanitised_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=self.__start_deadline(deadline),
+        )
+
+    @typechecked
+    def iter_records(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        deadline: float | None=None,
+    ) -> Iterator[Any]:
+        """Send a request to an endpoint and yield its response one record at \
+        a time.
 
-        data = self.sanitise_data(
-            response_val,
-            ignore_keys=sanitise_ignore_keys,
-        ) if sanitise else response_val
+        Records are taken from each page returned by ``iter_request()``. If \
+        the response is not a list of records, then the response itself is \
+        yielded as the only record.
 
-        return data
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Parameter names **must** match the names required by the \
+            endpoints, particularly with typecase (e.g. camelCase). Defaults \
+            to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type iterate: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_options: list[str]
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. If set, then the \
+            values are converted to their annotated types by a decoder that \
+            is compiled from the TypedDict, instead of being sanitised by \
+            ``sanitise_data()``. Values at the ``sanitise_ignore_keys`` are \
+            still left as they are. Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Records from the response.
+        :rtype: Iterator[Any]
+        """
+        for page in self.iter_request(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=deadline,
+        ):
+            if isinstance(page, list):
+                yield from page
+            else:
+                yield page
 
     @typechecked
     def send_download_request(
@@ -338,6 +772,7 @@ class LandTransportSg:
         url: Url,
         params: dict | None=None,
         cache_duration: int=0,
+        deadline: float | None=None,
     ) -> Url:
         """Send a request to an endpoint that expects a response with a \
         download link.
@@ -360,7 +795,15 @@ class LandTransportSg:
             Defaults to 0, i.e. do not cache.
         :type cache_duration: int
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :raises ValueError: deadline is not more than 0.
         :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
 
         :return: Link for downloading the requested file.
         :rtype: Url
@@ -371,6 +814,7 @@ class LandTransportSg:
             url,
             params=params,
             cache_duration=cache_duration,
+            deadline=deadline,
         )
 
         if len(download) == 0:
@@ -383,90 +827,1305 @@ class LandTransportSg:
 
         return download_link
 
-# private
+    @typechecked
+    def get_memory_cached_page(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+    ) -> Any:
+        """Get a page of a request from the in-memory cache, without sending \
+        the request.
+
+        Normally, this method does not need to be called directly. The \
+            asyncio clients use it, together with ``decode_page()``, to share \
+            the in-memory cache and the memo with this client.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request, including \
+            ``$skip``. Defaults to None.
+        :type params: dict or None
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the page was sanitised. Defaults to \
+            True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys that were ignored during \
+            sanitising. Defaults to None.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records that were decoded, if \
+            any. Defaults to None.
+        :type record_type: type or None
+
+        :raises KeyError: The page is not in the in-memory cache, or the \
+            client has no in-memory cache.
+
+        :return: The page.
+        :rtype: Any
+        """
+        key = self.__memory_cache_key(
+            url,
+            params,
+            cache_duration,
+            (sanitise, tuple(sanitise_ignore_keys or []), record_type),
+        )
+        if key is None:
+            raise KeyError(url)
+
+        return self.memory_cache.get(key)
 
     @typechecked
-    def __collect_response_value(
+    def decode_page(
         self,
+        response: Any,
         url: Url,
-        params: dict,
-        cache_duration: int,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
     ) -> Any:
-        """Collect response value from an endpoint. If the response returns a \
-        list of 500 records, then keep calling itself recursively to collect \
-        more records.
+        """Decode, and sanitise if needed, the page of a response in the \
+        same way as the pages of ``send_request()``.
 
-        :param url: The endpoint URL to send the request to.
+        The page is taken from the memo if the response was served from the \
+            cache and decoded before, and it is stored in the in-memory \
+            cache. Normally, this method does not need to be called \
+            directly. The asyncio clients use it for the responses that they \
+            receive.
+
+        :param response: The response of the request.
+        :type response: Response or CachedResponse
+
+        :param url: The endpoint URL of the request.
         :type url: Url
 
-        :param params: List of parameters to be passed to the endpoint URL.
-        :type params: dict
+        :param params: List of parameters of the request, including \
+            ``$skip``. Defaults to None.
+        :type params: dict or None
 
-        :param cache_duration: Number of seconds before the cache expires.
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
         :type cache_duration: int
 
-        :raises HTTPError: Error occurred during the request process.
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Defaults to True.
+        :type sanitise: bool
 
-        :return: Results from the response.
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to None.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of each record in the response value, \
+            or of the response value if it is not a list. Defaults to None.
+        :type record_type: type or None
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: The response has an error status code.
+
+        :return: The page.
         :rtype: Any
         """
-        response_value: Any
+        decoding = (
+            sanitise,
+            tuple(sanitise_ignore_keys or []),
+            record_type,
+        )
 
-        if '$skip' not in params:
-            params['$skip'] = 0
+        response_value = self.__decode_memoised_page(response, decoding)
 
-        response = self.session.get(
-            url,
-            params=params,
-            expire_after=cache_duration,
+        self.__set_memory_cache(
+            self.__memory_cache_key(url, params, cache_duration, decoding),
+            response,
+            response_value,
+            cache_duration=cache_duration,
         )
 
-        response_json = {}
-        try:
-            response_json = response.json()
-        except ValueError:
-            pass
+        return response_value
 
-        if response.status_code == requests_codes['server_error'] \
-            and 'fault' in response_json:
-            fault = response_json['fault']
-            faultstring = fault['faultstring']
-            faultdetail = [
-                f'{k}: {v}' for k, v in fault['detail'].items()
-            ]
+    @typechecked
+    def get_cached_response(
+        self,
+        url: Url,
+        params: dict | None=None,
+    ) -> Any:
+        """Get the response of a request from the session's cache, even if \
+        it has expired, without sending the request.
 
-            raise APIError(
-                faultstring,
-                errors=faultdetail,
-            )
+        :param url: The endpoint URL of the request.
+        :type url: Url
 
-        if response.status_code != requests_codes['ok']:
-            response.raise_for_status()
+        :param params: List of parameters of the request, including \
+            ``$skip``. Defaults to None.
+        :type params: dict or None
 
-        response_value = response_json.get('value') \
-            if 'value' in response_json else response_json
+        :return: The cached response, with its ``cache_key``, or None if the \
+            response is not cached.
+        :rtype: CachedResponse or None
+        """
+        request = self.session.prepare_request(
+            Request('GET', url, params=params),
+        )
+        cache_key = self.session.cache.create_key(request)
+        response = self.session.cache.get_response(cache_key)
 
-        # it is possible to paginate "forever" by skipping by 500 records
-        # so check if there are any records in the current results first
-        if isinstance(response_value, list) and len(response_value) == 500:
-            # get the next page of results
-            current_skip = params.pop('$skip', 0)
-            skip = current_skip + 500
-            params['$skip'] = skip
+        if response is not None:
+            response.cache_key = cache_key
 
-            # wait a while so as not to flood the endpoint
-            if skip % 1000 == 0:
-                time.sleep(1)
+        return response
 
-            next_response_value = self.__collect_response_value(
-                url,
-                params=params,
-                cache_duration=cache_duration,
-            )
-            # next_response_value should be a list too
-            response_value += next_response_value
+# private
 
-        return response_value
+    @typechecked
+    def __create_session(self, cache_backend: str | BaseCache) -> CachedSession:
+        """Create a session with a cache, and an adapter that retries \
+        requests and takes them through the rate limiter and circuit breaker.
+
+        :param cache_backend: Cache backend name or instance to use.
+        :type cache_backend: str | BaseCache
+
+        :return: The session.
+        :rtype: CachedSession
+        """
+        retries = DeadlineRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            # the last failed response is returned instead of raised as a
+            # RetryError, so that the circuit breaker can record its status
+            # code and Retry-After header
+            raise_on_status=False,
+        )
+
+        if cache_backend == 'bounded_sqlite':
+            cache_backend = BoundedSQLiteCache()
+
+        if isinstance(cache_backend, str):
+            session = CachedSession(
+                CACHE_NAME,
+                backend=cache_backend,
+                stale_if_error=False,
+            )
+        else:
+            # a backend instance already has its own cache name
+            session = CachedSession(
+                backend=cache_backend,
+                stale_if_error=False,
+            )
+        session.mount(
+            'https://',
+            RateLimitedHTTPAdapter(
+                rate_limiter=self.connection.rate_limiter,
+                circuit_breaker=self.resilience.circuit_breaker,
+                pool_connections=self.connection.pool_connections,
+                pool_maxsize=self.connection.pool_maxsize,
+                pool_block=self.connection.pool_block,
+                max_retries=retries,
+            ),
+        )
+
+        return session
+
+    @typechecked
+    def __start_deadline(self, seconds: float | None=None) -> Deadline | None:
+        """Start the deadline of a request, and return the earliest of it and \
+        the deadlines that are entered in the current thread.
+
+        :param seconds: Number of seconds that the request may take, instead \
+            of the client's ``resilience.deadline``. Defaults to None.
+        :type seconds: float or None
+
+        :raises ValueError: seconds is not more than 0.
+
+        :return: The deadline, or None if there is no deadline.
+        :rtype: Deadline or None
+        """
+        if seconds is not None and seconds <= 0:
+            raise ValueError('Argument "deadline" must be more than 0.')
+
+        if seconds is None:
+            seconds = self.resilience.deadline
+
+        return Deadline.earliest(
+            current_deadline(),
+            None if seconds is None else Deadline(seconds),
+        )
+
+    @typechecked
+    def __collect_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        record_type: type | None=None,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Collect the pages from the cursor's position into one response \
+        value.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type iterate: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_options: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched. The records from those pages are attached as ``data``.
+
+        :return: Results from the response, or None if there are no more \
+            pages to fetch.
+        :rtype: Any
+        """
+        data: Any = None
+
+        try:
+            for page in self.__iter_sanitised_pages(
+                cursor,
+                sanitise=sanitise,
+                sanitise_ignore_keys=sanitise_ignore_keys,
+                record_type=record_type,
+                deadline=deadline,
+                hedge=hedge,
+            ):
+                # only a full list of records is followed by more pages
+                if data is None:
+                    data = page
+                else:
+                    data += page
+        except PaginationError as e:
+            e.data = data
+            raise
+
+        return data
+
+    @typechecked
+    def __collect_coalesced_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        record_type: type | None=None,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> dict:
+        """Collect the pages of a request whose result is shared with \
+        identical requests, and whether its deadline was missed, so that the \
+        identical requests do not use a fallback for a deadline that is not \
+        their own.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from the response as ``data``, and \
+            ``is_deadline_missed``, which is True if a cached page was used \
+            because of the deadline.
+        :rtype: dict
+        """
+        data = self.__collect_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            deadline=deadline,
+            hedge=hedge,
+        )
+
+        return {
+            'data': data,
+            'is_deadline_missed': deadline is not None and deadline.is_missed,
+        }
+
+    @typechecked
+    def __iter_sanitised_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        record_type: type | None=None,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Iterator[Any]:
+        """Yield the pages from the cursor's position, sanitising each page \
+        if required.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type iterate: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_options: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from each page of the response.
+        :rtype: Iterator[Any]
+        """
+        if sanitise_ignore_keys is None:
+            sanitise_ignore_keys = []
+
+        refresh_cache_durations = getattr(
+            self.__local,
+            'refresh_cache_durations',
+            None,
+        )
+        if refresh_cache_durations is not None:
+            refresh_cache_durations.append(cursor.cache_duration)
+
+        # pages are sanitised as they are fetched, so that the unsanitised
+        # records can be discarded as early as possible
+        yield from self.__iter_response_pages(
+            cursor,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+            force_refresh=refresh_cache_durations is not None,
+            deadline=deadline,
+            hedge=hedge,
+        )
+
+    @typechecked
+    def __iter_response_pages(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str],
+        record_type: type | None=None,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Iterator[Any]:
+        """Yield the response value from an endpoint one page at a time, \
+        starting from the cursor's position. If a page returns a list of 500 \
+        records, then keep fetching the next page until a page with fewer \
+        records is returned.
+
+        The cursor is moved past each page as it is yielded. If \
+        ``pagination_workers`` is more than 1, then the pages after the first \
+        page are fetched concurrently.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param force_refresh: If True, then cached responses are not used. \
+            Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred before any page was fetched.
+        :raises DeadlineExceededError: The request did not finish before the \
+            deadline, and ``deadline_fallback`` did not return a cached page.
+        :raises PaginationError: Error occurred after some pages were \
+            fetched.
+
+        :return: Results from each page of the response.
+        :rtype: Iterator[Any]
+        """
+        try:
+            while not cursor.is_complete:
+                if self.pagination_workers > 1 and cursor.pages > 0:
+                    yield from self.__iter_pages_concurrently(
+                        cursor,
+                        sanitise=sanitise,
+                        sanitise_ignore_keys=sanitise_ignore_keys,
+                        record_type=record_type,
+                        force_refresh=force_refresh,
+                        deadline=deadline,
+                        hedge=hedge,
+                    )
+                    return
+
+                # it is possible to paginate "forever" by skipping by 500
+                # records, so the cursor stops at the first page that is not
+                # a full list of records
+                response_value = self.__fetch_page(
+                    cursor.url,
+                    params=cursor.page_params(),
+                    cache_duration=cursor.cache_duration,
+                    sanitise=sanitise,
+                    sanitise_ignore_keys=sanitise_ignore_keys,
+                    record_type=record_type,
+                    force_refresh=force_refresh,
+                    deadline=deadline,
+                    hedge=hedge,
+                )
+                cursor.advance(response_value)
+                yield response_value
+        except DeadlineExceededError:
+            # the deadline of the whole request has passed, so resuming it
+            # would fail too
+            raise
+        except (APIError, RequestException) as e:
+            if cursor.pages == 0:
+                raise
+
+            raise PaginationError(
+                f'Request failed after {cursor.pages} page(s) were fetched.',
+                cursor=cursor,
+                errors=[str(e)],
+            ) from e
+
+    @typechecked
+    def __iter_pages_concurrently(
+        self,
+        cursor: PaginationCursor,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str],
+        record_type: type | None=None,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Iterator[Any]:
+        """Yield the pages from the cursor's position, fetching up to \
+        ``pagination_workers`` pages at a time.
+
+        Pages are yielded in ``$skip`` order. Fetching stops at the first \
+        page that has fewer than 500 records; any pages fetched after it in \
+        the same batch are discarded.
+
+        :param cursor: Position of the request.
+        :type cursor: PaginationCursor
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising.
+        :type sanitise_ignore_keys: list[str]
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param force_refresh: If True, then cached responses are not used. \
+            Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True, then hedge the request. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from each page of the response.
+        :rtype: Iterator[Any]
+        """
+        def fetch_page(page_params: dict) -> Any:
+            return self.__fetch_page(
+                cursor.url,
+                params=page_params,
+                cache_duration=cursor.cache_duration,
+                sanitise=sanitise,
+                sanitise_ignore_keys=sanitise_ignore_keys,
+                record_type=record_type,
+                force_refresh=force_refresh,
+                deadline=deadline,
+                hedge=hedge,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.pagination_workers,
+        ) as executor:
+            while not cursor.is_complete:
+                batch_params = [
+                    cursor.params | {'$skip': cursor.skip + (i * PAGE_SIZE)} \
+                        for i in range(self.pagination_workers)
+                ]
+                for page in executor.map(fetch_page, batch_params):
+                    cursor.advance(page)
+                    yield page
+                    if cursor.is_complete:
+                        return
+
+    @typechecked
+    def __fetch_page(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        sanitise: bool=False,
+        sanitise_ignore_keys: list[str] | None=None,
+        record_type: type | None=None,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Fetch one page of the response value from an endpoint.
+
+        If the page is in the in-memory cache, then it is returned without \
+        sending the request. Otherwise, the request is sent, and its \
+        response is decoded, or taken from the memo if it was served from \
+        the cache and decoded before.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised. \
+            Defaults to False.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising. Defaults to None.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param record_type: TypedDict of the records to decode, if any. \
+            Defaults to None.
+        :type record_type: type or None
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached, and the page is cached again. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True and the client has a hedger, then the request \
+            is sent again if it is slower than usual. Defaults to False.
+        :type hedge: bool
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: Error occurred during the request process.
+        :raises CircuitOpenError: The endpoint's circuit is open, and the \
+            page cannot be taken from the cache.
+        :raises DeadlineExceededError: The page was not fetched before the \
+            deadline, and it cannot be taken from the cache.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        if not force_refresh:
+            try:
+                return self.get_memory_cached_page(
+                    url,
+                    params,
+                    cache_duration,
+                    sanitise=sanitise,
+                    sanitise_ignore_keys=sanitise_ignore_keys,
+                    record_type=record_type,
+                )
+            except KeyError:
+                pass
+
+        response = self.__send_page_request(
+            url,
+            params,
+            cache_duration,
+            force_refresh=force_refresh,
+            deadline=deadline,
+            hedge=hedge,
+        )
+
+        return self.decode_page(
+            response,
+            url,
+            params,
+            cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            record_type=record_type,
+        )
+
+    @typechecked
+    def __send_page_request(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+        hedge: bool=False,
+    ) -> Any:
+        """Send the request for one page, or take its response from the \
+        cache.
+
+        If there is a deadline, then the request is sent with a timeout that \
+        ends at the deadline, and it is not retried after the deadline. If \
+        the page is not fetched before the deadline and the client's \
+        ``resilience.deadline_fallback`` is True, or if the endpoint's \
+        circuit is open and ``resilience.circuit_breaker_fallback`` is True, \
+        then its cached response is used even if it has expired.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :param hedge: If True and the client has a hedger, then the request \
+            is sent again if it is slower than usual. Defaults to False.
+        :type hedge: bool
+
+        :raises HTTPError: Error occurred during the request process.
+        :raises CircuitOpenError: The endpoint's circuit is open, and the \
+            page cannot be taken from the cache.
+        :raises DeadlineExceededError: The page was not fetched before the \
+            deadline, and it cannot be taken from the cache.
+
+        :return: The response.
+        :rtype: Any
+        """
+        get_response = partial(
+            self.__get_response,
+            url,
+            params,
+            cache_duration,
+            force_refresh=force_refresh,
+            deadline=deadline,
+        )
+        hedger = self.resilience.hedger if hedge else None
+
+        if deadline is not None and deadline.is_expired:
+            return self.__get_deadline_fallback(url, params, deadline)
+
+        try:
+            if hedger is None:
+                return get_response()
+
+            # cached responses would make the hedging delay too short
+            return hedger.run(
+                url,
+                get_response,
+                is_sample=lambda r: not getattr(r, 'from_cache', False),
+                discard=lambda r: r.close(),
+            )
+        except CircuitOpenError as e:
+            if not self.resilience.circuit_breaker_fallback:
+                raise
+            return self.__get_expired_response(url, params, e)
+        except DeadlineExceededError:
+            # the rate limiter allows no request before the deadline
+            return self.__get_deadline_fallback(url, params, deadline)
+        except RequestException:
+            if deadline is None or not deadline.is_expired:
+                raise
+            return self.__get_deadline_fallback(url, params, deadline)
+
+    @typechecked
+    def __get_response(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+        deadline: Deadline | None=None,
+    ) -> Any:
+        """Send a request with the session, within its deadline.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If True, then the request is sent even if the \
+            page is cached. Defaults to False.
+        :type force_refresh: bool
+
+        :param deadline: Deadline of the request. Defaults to None.
+        :type deadline: Deadline or None
+
+        :return: The response.
+        :rtype: Any
+        """
+        headers = None
+        max_staleness = self.caching.max_staleness(url)
+        if cache_duration > 0 and max_staleness > 0:
+            # requests-cache refreshes the stale response in a thread
+            headers = {
+                'Cache-Control': f'stale-while-revalidate={max_staleness}',
+            }
+
+        timeout = self.connection.timeout
+        if deadline is not None:
+            timeout = DeadlineTimeout(deadline, timeout)
+
+        # the deadline is entered in the thread that sends the request, which
+        # may be a pagination worker or a hedger's thread, so that the retries
+        # stop at it
+        with nullcontext() if deadline is None else deadline:
+            if self.stream_json and cache_duration > 0:
+                return self.__get_streamed_response(
+                    url,
+                    params,
+                    force_refresh=force_refresh,
+                    timeout=timeout,
+                )
+
+            return self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                expire_after=cache_duration,
+                force_refresh=force_refresh,
+                timeout=timeout,
+                stream=self.stream_json,
+            )
+
+    @typechecked
+    def __get_streamed_response(
+        self,
+        url: Url,
+        params: dict,
+        force_refresh: bool=False,
+        timeout: Any=None,
+    ) -> Any:
+        """Take the response of a request with a cache duration from the \
+        cache backend if it has not expired, or else send the request past \
+        the cache backend, so that its body can be streamed.
+
+        The cache backend reads the whole body of a response that it stores, \
+        so the response is not stored there. Its page is stored in the \
+        in-memory cache instead when it is decoded.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param force_refresh: If True, then the request is sent even if the \
+            response is cached. Defaults to False.
+        :type force_refresh: bool
+
+        :param timeout: Timeout of the request. Defaults to None.
+        :type timeout: Any
+
+        :return: The cached response, or the response whose body has not \
+            been read yet.
+        :rtype: Any
+        """
+        if not force_refresh:
+            response = self.get_cached_response(url, params=params)
+            if response is not None and not response.is_expired:
+                return response
+
+        request = self.session.prepare_request(
+            Request('GET', url, params=params),
+        )
+        settings = self.session.merge_environment_settings(
+            request.url,
+            {},
+            True,
+            None,
+            None,
+        )
+
+        # the session's adapter still rate limits and retries the request
+        return Session.send(self.session, request, timeout=timeout, **settings)
+
+    @typechecked
+    def __get_deadline_fallback(
+        self,
+        url: Url,
+        params: dict,
+        deadline: Deadline | None,
+    ) -> Any:
+        """Get the cached response of a request that did not finish before \
+        its deadline, even if it has expired, if ``deadline_fallback`` is \
+        True. The deadline is marked as missed either way.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request.
+        :type params: dict
+
+        :param deadline: The deadline that was missed.
+        :type deadline: Deadline or None
+
+        :raises DeadlineExceededError: ``deadline_fallback`` is False, or the \
+            response is not cached.
+
+        :return: The cached response.
+        :rtype: Any
+        """
+        if deadline is not None:
+            deadline.is_missed = True
+
+        error = DeadlineExceededError(
+            'Request did not finish before its deadline.',
+            errors=[url],
+        )
+        if not self.resilience.deadline_fallback:
+            raise error
+
+        return self.__get_expired_response(url, params, error)
+
+    @typechecked
+    def __decode_memoised_page(self, response: Any, decoding: tuple) -> Any:
+        """Decode the page of a response, or take it from the memo if the \
+        response was served from the cache and decoded before.
+
+        :param response: The response.
+        :type response: Any
+
+        :param decoding: Arguments of ``__decode_page()`` after the response.
+        :type decoding: tuple
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        if self.response_memo is None \
+            or not getattr(response, 'from_cache', False) \
+            or response.status_code != requests_codes['ok']:
+            return self.__decode_page(response, *decoding)
+
+        memo_key = (response.cache_key, response.created_at, *decoding)
+        try:
+            response_value = self.response_memo.get(memo_key)
+        except KeyError:
+            response_value = self.__decode_page(response, *decoding)
+            self.response_memo.set(memo_key, response_value)
+        else:
+            response.close()
+
+        return response_value
+
+    @typechecked
+    def __decode_page(
+        self,
+        response: Any,
+        sanitise: bool,
+        sanitise_ignore_keys: tuple[str, ...],
+        record_type: type | None,
+    ) -> Any:
+        """Decode, and sanitise if needed, the page of a response.
+
+        :param response: The response.
+        :type response: Any
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: Keys to ignore in the response value \
+            during sanitising.
+        :type sanitise_ignore_keys: tuple[str, ...]
+
+        :param record_type: TypedDict of the records to decode, if any.
+        :type record_type: type or None
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        response_value: Any
+
+        # records are sanitised one at a time, so that a streamed response
+        # never has to be decoded in full
+        decode_record = None
+        decode_page = None
+        if sanitise and record_type is not None:
+            decode_record = compile_decoder(
+                record_type,
+                ignore_keys=sanitise_ignore_keys,
+                key_path=LIST_ITEMS,
+            )
+            decode_page = compile_page_decoder(
+                record_type,
+                ignore_keys=sanitise_ignore_keys,
+            )
+        elif sanitise:
+            decode_record = partial(
+                sanitise_value,
+                ignore_keys=compile_ignore_keys(
+                    list(sanitise_ignore_keys),
+                    key_path=LIST_ITEMS,
+                ),
+            )
+
+        if self.stream_json and response.status_code == requests_codes['ok']:
+            try:
+                response_value = self.__decode_response_stream(
+                    response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE),
+                    decode_record=decode_record,
+                    decode_page=decode_page,
+                )
+            finally:
+                response.close()
+        else:
+            response_value = self.__decode_response(
+                response,
+                decode_record=decode_record,
+                decode_page=decode_page,
+            )
+
+        if isinstance(response_value, dict) \
+            and 'odata.metadata' in response_value:
+            # this isn't documented in LTA Datamall's API guide
+            del response_value['odata.metadata']
+
+        if sanitise and not isinstance(response_value, list):
+            response_value = self.sanitise_data(
+                response_value,
+                ignore_keys=list(sanitise_ignore_keys),
+            ) if record_type is None else compile_decoder(
+                record_type,
+                ignore_keys=sanitise_ignore_keys,
+            )(response_value)
+
+        return response_value
+
+    @typechecked
+    def __get_expired_response(
+        self,
+        url: Url,
+        params: dict,
+        error: APIError,
+    ) -> Any:
+        """Get the cached response of a request that cannot be sent, even if \
+        the response has expired.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request.
+        :type params: dict
+
+        :param error: Error to raise if the response is not cached.
+        :type error: APIError
+
+        :raises APIError: The response is not cached.
+
+        :return: The cached response.
+        :rtype: Any
+        """
+        response = self.get_cached_response(url, params=params)
+
+        if response is None:
+            raise error
+
+        return response
+
+    @typechecked
+    def __memory_cache_key(
+        self,
+        url: Url,
+        params: dict | None,
+        cache_duration: int,
+        decoding: tuple,
+    ) -> tuple | None:
+        """Return the key of a page in the in-memory cache.
+
+        :param url: The endpoint URL of the request.
+        :type url: Url
+
+        :param params: List of parameters of the request.
+        :type params: dict or None
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param decoding: Arguments of ``__decode_page()`` after the response.
+        :type decoding: tuple
+
+        :return: The key, or None if the page is not to be stored in the \
+            in-memory cache.
+        :rtype: tuple or None
+        """
+        if self.memory_cache is None or cache_duration <= 0:
+            return None
+
+        return (url, canonical_params(params), *decoding)
+
+    @typechecked
+    def __set_memory_cache(
+        self,
+        key: tuple | None,
+        response: Any,
+        response_value: Any,
+        cache_duration: int,
+    ) -> None:
+        """Store a page in the in-memory cache until the cache duration of \
+        its request ends, or until its response expires in the cache if the \
+        response was served from the cache.
+
+        :param key: Key of the page in the in-memory cache, or None if the \
+            page is not to be stored.
+        :type key: tuple or None
+
+        :param response: The response of the page.
+        :type response: Any
+
+        :param response_value: The page.
+        :type response_value: Any
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+        """
+        if key is None or self.memory_cache is None \
+            or response.status_code != requests_codes['ok']:
+            return
+
+        ttl = cache_duration
+        expires_delta = getattr(response, 'expires_delta', None) \
+            if getattr(response, 'from_cache', False) else None
+        if expires_delta is not None:
+            ttl = min(ttl, expires_delta)
+
+        self.memory_cache.set(key, response_value, ttl=ttl)
+
+    @typechecked
+    def __decode_response(
+        self,
+        response: Any,
+        decode_record: Callable[[Any], Any] | None=None,
+        decode_page: Callable[[list], list] | None=None,
+    ) -> Any:
+        """Decode the response value from a response body.
+
+        :param response: The response.
+        :type response: Any
+
+        :param decode_record: Function to apply to each record if the \
+            response value is a list of records. Defaults to None.
+        :type decode_record: Callable[[Any], Any] or None
+
+        :param decode_page: Function to apply to the list of records, \
+            instead of applying ``decode_record`` to each record. Defaults \
+            to None.
+        :type decode_page: Callable[[list], list] or None
+
+        :raises APIError: The endpoint returned a fault.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        response_value: Any
+
+        response_json = {}
+        try:
+            response_json = response.json()
+        except ValueError:
+            pass
+
+        if response.status_code == requests_codes['server_error'] \
+            and 'fault' in response_json:
+            fault = response_json['fault']
+            faultstring = fault['faultstring']
+            faultdetail = [
+                f'{k}: {v}' for k, v in fault['detail'].items()
+            ]
+
+            raise APIError(
+                faultstring,
+                errors=faultdetail,
+            )
+
+        if response.status_code != requests_codes['ok']:
+            response.raise_for_status()
+
+        response_value = response_json.get('value') \
+            if 'value' in response_json else response_json
+
+        if isinstance(response_value, list):
+            response_value = self.__decode_records(
+                response_value,
+                decode_record=decode_record,
+                decode_page=decode_page,
+            )
+
+        return response_value
+
+    @typechecked
+    def __decode_response_stream(
+        self,
+        chunks: Iterator[bytes],
+        decode_record: Callable[[Any], Any] | None=None,
+        decode_page: Callable[[list], list] | None=None,
+    ) -> Any:
+        """Decode the response value from a response body that is read in \
+        chunks, decoding the records in its ``value`` array one at a time.
+
+        :param chunks: Chunks of the response body.
+        :type chunks: Iterator[bytes]
+
+        :param decode_record: Function to apply to each record if the \
+            response value is a list of records. Defaults to None.
+        :type decode_record: Callable[[Any], Any] or None
+
+        :param decode_page: Function to apply to the list of records if the \
+            response body is not streamed, instead of applying \
+            ``decode_record`` to each record. Defaults to None.
+        :type decode_page: Callable[[list], list] or None
+
+        :raises APIError: The response body is not valid JSON.
+
+        :return: Results from the response.
+        :rtype: Any
+        """
+        response_value: Any
+
+        stream = JSONValueStream(chunks)
+        try:
+            response_value = [
+                v if decode_record is None else decode_record(v) \
+                    for v in stream
+            ]
+        except JSONDecodeError as error:
+            raise APIError(
+                'Response body is not valid JSON.',
+                errors=[str(error)],
+            ) from error
+
+        if stream.is_streamed:
+            return response_value
+
+        response_json = stream.document
+
+        response_value = response_json.get('value') \
+            if isinstance(response_json, dict) and 'value' in response_json \
+            else response_json
+
+        if isinstance(response_value, list):
+            response_value = self.__decode_records(
+                response_value,
+                decode_record=decode_record,
+                decode_page=decode_page,
+            )
+
+        return response_value
+
+    @typechecked
+    def __decode_records(
+        self,
+        records: list,
+        decode_record: Callable[[Any], Any] | None=None,
+        decode_page: Callable[[list], list] | None=None,
+    ) -> list:
+        """Decode the records of a response value.
+
+        :param records: The records.
+        :type records: list
+
+        :param decode_record: Function to apply to each record. Defaults to \
+            None.
+        :type decode_record: Callable[[Any], Any] or None
+
+        :param decode_page: Function to apply to the list of records, \
+            instead of applying ``decode_record`` to each record. Defaults \
+            to None.
+        :type decode_page: Callable[[list], list] or None
+
+        :return: The decoded records.
+        :rtype: list
+        """
+        if decode_page is not None:
+            return decode_page(records)
+
+        if decode_record is not None:
+            return [decode_record(v) for v in records]
+
+        return records
 
 __all__ = [
     'LandTransportSg',
@@ -0,0 +1,98 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Track the progress of requests to endpoints that return many pages."""
+
+from typing import Any
+
+from typeguard import typechecked
+
+from .constants import PAGE_SIZE
+from .types import Url
+
+class PaginationCursor:
+    """Position of a request in an endpoint's pages of records.
+
+    A cursor is created for every request that is sent by a client. If a \
+        request fails after some pages have been fetched, then the cursor is \
+        attached to the raised ``PaginationError``, and it can be passed to \
+        ``LandTransportSg.resume_request()`` to fetch the remaining pages.
+
+    :param url: The endpoint URL to send the request to.
+    :type url: Url
+
+    :param params: List of parameters to be passed to the endpoint URL. If \
+        ``$skip`` is included, then it is used as the number of records to \
+        skip for the first page. Defaults to None.
+    :type params: dict or None
+
+    :param cache_duration: Number of seconds before the cache expires. \
+        Defaults to 0, i.e. do not cache.
+    :type cache_duration: int
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+    ) -> None:
+        """Constructor method"""
+        if params is None:
+            params = {}
+
+        self.url = url
+        self.params = {k: v for k, v in params.items() if k != '$skip'}
+        self.cache_duration = cache_duration
+
+        self.skip: int = params.get('$skip', 0)
+        """Number of records to skip for the next page."""
+        self.pages: int = 0
+        """Number of pages that have been fetched."""
+        self.is_complete: bool = False
+        """True if the last page has been fetched."""
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({self.url}, skip={self.skip}, ' \
+            f'pages={self.pages}, is_complete={self.is_complete})'
+
+    @typechecked
+    def page_params(self) -> dict:
+        """Return the parameters for fetching the next page.
+
+        :return: The set of parameters, including ``$skip``.
+        :rtype: dict
+        """
+        return self.params | {'$skip': self.skip}
+
+    @typechecked
+    def advance(self, page: Any) -> None:
+        """Move the cursor past a page that has been fetched.
+
+        A page that is not a list of exactly 500 records is the last page.
+
+        :param page: The response value of the page that has been fetched.
+        :type page: Any
+        """
+        self.pages += 1
+        self.skip += PAGE_SIZE
+        self.is_complete = not isinstance(page, list) \
+            or len(page) != PAGE_SIZE
+
+__all__ = [
+    'PaginationCursor',
+]
@@ -14,7 +14,8 @@
 
 """Client for interacting with the Public Transport API endpoints."""
 
-from typing import Unpack
+from collections.abc import Callable, Iterator
+from typing import Any, Unpack
 
 from typeguard import typechecked
 
@@ -25,6 +26,7 @@ from ..constants import (
     CACHE_ONE_HOUR,
     CACHE_ONE_DAY,
 )
+from ..concurrency import map_concurrently
 from ..landtransportsg import LandTransportSg
 from ..timezone import date_is_within_last_three_months
 from ..types import Url
@@ -57,6 +59,8 @@ from .constants import (
     PLANNED_BUS_ROUTES_SANITISE_IGNORE_KEYS,
 
     TRAIN_LINES,
+
+    BUS_ARRIVALS_MAX_WORKERS,
 )
 from .types_args import (
     BusArrivalArgsDict,
@@ -72,6 +76,8 @@ from .types import (
     PlannedBusRoutesDict,
     StationCrowdDensityRealTimeDict,
     StationCrowdDensityForecastDict,
+    StationCrowdDensityRealTimeAllDict,
+    StationCrowdDensityForecastAllDict,
     TaxiAvailabilityDict,
     TaxiStandsDict,
     TrainServiceAlertsDict,
@@ -87,35 +93,32 @@ class Client(LandTransportSg):
     @typechecked
     def bus_arrival(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[BusArrivalArgsDict],
     ) -> BusArrivalDict:
         """Get real-time Bus Arrival information of Bus Services at a queried \
         Bus Stop, including Est. Arrival Time, Est. Current Location, Est. \
         Current Load.
 
+        If the client has a ``resilience.hedger``, then a request that is \
+        slower than usual is hedged with a second identical request.
+
         :param kwargs: Key-value arguments to be passed as parameters to the \
             endpoint URL.
         :type kwargs: BusArrivalArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: bus_stop_code is not exactly 5 characters long.
         :raises ValueError: bus_stop_code is not a number-like string.
 
         :return: Information about bus arrival at the specified bus stop.
         :rtype: BusArrivalDict
         """
-        bus_stop_code = kwargs['bus_stop_code']
-
-        try:
-            _ = int(bus_stop_code)
-        except Exception as e:
-            raise ValueError(
-                'Argument "bus_stop_code" is not a valid number.'
-            ) from e
-
-        if len(bus_stop_code) != 5:
-            raise ValueError(
-                'Argument "bus_stop_code" must be 5-digits long.'
-            )
+        self.__validate_bus_stop_code(kwargs['bus_stop_code'])
 
         params = self.build_params(
             params_expected_type=BusArrivalArgsDict,
@@ -130,16 +133,102 @@ class Client(LandTransportSg):
             params=params,
             cache_duration=CACHE_ONE_MINUTE,
             sanitise_ignore_keys=BUS_ARRIVAL_SANITISE_IGNORE_KEYS,
+            record_type=BusArrivalDict,
+            deadline=deadline,
+            hedge=True,
         )
 
         return bus_arrival
 
     @typechecked
-    def bus_routes(self) -> list[BusRoutesDict]:
+    def bus_arrivals(
+        self,
+        bus_stop_codes: list[str],
+        service_number: str | None=None,
+        max_workers: int=BUS_ARRIVALS_MAX_WORKERS,
+        deadline: float | None=None,
+    ) -> dict[str, BusArrivalDict | Exception]:
+        """Get real-time Bus Arrival information at several Bus Stops at \
+        once.
+
+        The bus stops are requested concurrently with ``bus_arrival()``, and \
+            their requests share the client's rate limiter. A bus stop whose \
+            request fails does not stop the others, and its exception is \
+            returned in place of its bus arrival information.
+
+        Example usage:
+
+        .. code-block:: python
+
+            bus_arrivals = client.bus_arrivals(['83139', '83141'])
+            for bus_stop_code, bus_arrival in bus_arrivals.items():
+                if isinstance(bus_arrival, Exception):
+                    ...  # the request for this bus stop failed
+
+        :param bus_stop_codes: Bus stop reference codes. Duplicate codes are \
+            requested once.
+        :type bus_stop_codes: list[str]
+
+        :param service_number: Bus service number to get at every bus stop. \
+            Defaults to None, i.e. all bus services.
+        :type service_number: str or None
+
+        :param max_workers: Maximum number of bus stops to request at the \
+            same time. Defaults to 8.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each bus stop \
+            may take, instead of the client's ``resilience.deadline``. \
+            Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: A bus stop code is not exactly 5 characters long.
+        :raises ValueError: A bus stop code is not a number-like string.
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Information about bus arrival, or the exception that was \
+            raised while getting it, by bus stop code in the order of \
+            ``bus_stop_codes``.
+        :rtype: dict[str, BusArrivalDict | Exception]
+        """
+        for bus_stop_code in bus_stop_codes:
+            self.__validate_bus_stop_code(bus_stop_code)
+
+        kwargs: dict[str, str] = {}
+        if service_number is not None:
+            kwargs['service_number'] = service_number
+
+        def get_bus_arrival(bus_stop_code: str) -> BusArrivalDict:
+            return self.bus_arrival(
+                deadline=deadline,
+                bus_stop_code=bus_stop_code,
+                **kwargs,
+            )
+
+        bus_arrivals: dict[str, BusArrivalDict | Exception]
+
+        bus_arrivals = map_concurrently(
+            get_bus_arrival,
+            bus_stop_codes,
+            max_workers=max_workers,
+        )
+
+        return bus_arrivals
+
+    @typechecked
+    def bus_routes(
+        self,
+        deadline: float | None=None,
+    ) -> list[BusRoutesDict]:
         """Get detailed route information for all services currently in \
         operation, including: all bus stops along each route, first/last bus \
         timings for each stop.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Information about bus routes currently in operation.
         :rtype: list[BusRoutesDict]
         """
@@ -149,16 +238,50 @@ class Client(LandTransportSg):
             BUS_ROUTES_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
             sanitise_ignore_keys=BUS_ROUTES_SANITISE_IGNORE_KEYS,
+            record_type=BusRoutesDict,
+            deadline=deadline,
         )
 
         return bus_routes
 
     @typechecked
-    def bus_services(self) -> list[BusServicesDict]:
+    def iter_bus_routes(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[BusRoutesDict]:
+        """Same as ``bus_routes()``, but yield each bus route as soon as its page \
+        of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Information about bus routes currently in operation.
+        :rtype: Iterator[BusRoutesDict]
+        """
+        yield from self.iter_records(
+            BUS_ROUTES_API_ENDPOINT,
+            cache_duration=CACHE_ONE_DAY,
+            sanitise_ignore_keys=BUS_ROUTES_SANITISE_IGNORE_KEYS,
+            record_type=BusRoutesDict,
+            deadline=deadline,
+        )
+
+    @typechecked
+    def bus_services(
+        self,
+        deadline: float | None=None,
+    ) -> list[BusServicesDict]:
         """Get detailed service information for all buses currently in \
         operation, including: first stop, last stop, peak / offpeak frequency \
         of dispatch.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Information about bus services currently in operation.
         :rtype: list[BusServicesDict]
         """
@@ -168,15 +291,49 @@ class Client(LandTransportSg):
             BUS_SERVICES_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
             sanitise_ignore_keys=BUS_SERVICES_SANITISE_IGNORE_KEYS,
+            record_type=BusServicesDict,
+            deadline=deadline,
         )
 
         return bus_services
 
     @typechecked
-    def bus_stops(self) -> list[BusStopsDict]:
+    def iter_bus_services(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[BusServicesDict]:
+        """Same as ``bus_services()``, but yield each bus service as soon as its \
+        page of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Information about bus services currently in operation.
+        :rtype: Iterator[BusServicesDict]
+        """
+        yield from self.iter_records(
+            BUS_SERVICES_API_ENDPOINT,
+            cache_duration=CACHE_ONE_DAY,
+            sanitise_ignore_keys=BUS_SERVICES_SANITISE_IGNORE_KEYS,
+            record_type=BusServicesDict,
+            deadline=deadline,
+        )
+
+    @typechecked
+    def bus_stops(
+        self,
+        deadline: float | None=None,
+    ) -> list[BusStopsDict]:
         """Get detailed information for all bus stops currently being \
         serviced by buses, including: Bus Stop Code, location coordinate.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Location coordinaties of bus stops with active services.
         :rtype: list[BusStopsDict]
         """
@@ -186,14 +343,48 @@ class Client(LandTransportSg):
             BUS_STOPS_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
             sanitise_ignore_keys=BUS_STOPS_SANITISE_IGNORE_KEYS,
+            record_type=BusStopsDict,
+            deadline=deadline,
         )
 
         return bus_stops
 
     @typechecked
-    def facilities_maintenance(self) -> list[FacilitiesMaintenanceDict]:
+    def iter_bus_stops(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[BusStopsDict]:
+        """Same as ``bus_stops()``, but yield each bus stop as soon as its page of \
+        records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Location coordinaties of bus stops with active services.
+        :rtype: Iterator[BusStopsDict]
+        """
+        yield from self.iter_records(
+            BUS_STOPS_API_ENDPOINT,
+            cache_duration=CACHE_ONE_DAY,
+            sanitise_ignore_keys=BUS_STOPS_SANITISE_IGNORE_KEYS,
+            record_type=BusStopsDict,
+            deadline=deadline,
+        )
+
+    @typechecked
+    def facilities_maintenance(
+        self,
+        deadline: float | None=None,
+    ) -> list[FacilitiesMaintenanceDict]:
         """Returns adhoc lift maintenance in MRT stations.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Station codes and namse with IDs of lifts being serviced.
         :rtype: list[FacilitiesMaintenanceDict]
         """
@@ -203,6 +394,8 @@ class Client(LandTransportSg):
             FACILITIES_MAINTENANCE_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
             sanitise_ignore_keys=BUS_STOPS_SANITISE_IGNORE_KEYS,
+            record_type=FacilitiesMaintenanceDict,
+            deadline=deadline,
         )
 
         return facilities_maintenance
@@ -210,6 +403,7 @@ class Client(LandTransportSg):
     @typechecked
     def passenger_volume_by_bus_stops(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[PassengerVolumeArgsDict],
     ) -> Url:
         """Get tap in and tap out passenger volume by weekdays and weekends \
@@ -219,6 +413,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: PassengerVolumeArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: dt is not within the last 3 months.
 
         :return: Download link of file containing passenger volume data.
@@ -241,6 +440,7 @@ class Client(LandTransportSg):
             PASSENGER_VOLUME_BY_BUS_STOPS_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_FIVE_MINUTES,
+            deadline=deadline,
         )
 
         return passenger_volume_link
@@ -248,6 +448,7 @@ class Client(LandTransportSg):
     @typechecked
     def passenger_volume_by_origin_destination_bus_stops(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[PassengerVolumeArgsDict],
     ) -> Url:
         """Get number of trips by weekdays and weekends from origin to \
@@ -257,6 +458,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: PassengerVolumeArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: dt is not within the last 3 months.
 
         :return: Download link of file containing passenger volume data.
@@ -279,6 +485,7 @@ class Client(LandTransportSg):
             PASSENGER_VOLUME_BY_ORIGIN_DESTINATION_BUS_STOPS_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_ONE_DAY,
+            deadline=deadline,
         )
 
         return passenger_volume_link
@@ -286,6 +493,7 @@ class Client(LandTransportSg):
     @typechecked
     def passenger_volume_by_origin_destination_train_stations(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[PassengerVolumeArgsDict],
     ) -> Url:
         """Get number of trips by weekdays and weekends from origin to \
@@ -295,6 +503,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: PassengerVolumeArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: dt is not within the last 3 months.
 
         :return: Download link of file containing passenger volume data.
@@ -317,6 +530,7 @@ class Client(LandTransportSg):
             PASSENGER_VOLUME_BY_ORIGIN_DESTINATION_TRAIN_STATIONS_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_ONE_DAY,
+            deadline=deadline,
         )
 
         return passenger_volume_link
@@ -324,6 +538,7 @@ class Client(LandTransportSg):
     @typechecked
     def passenger_volume_by_train_stations(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[PassengerVolumeArgsDict],
     ) -> Url:
         """Get tap in and tap out passenger volume by weekdays and weekends \
@@ -333,6 +548,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: PassengerVolumeArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: dt is not within the last 3 months.
 
         :return: Download link of file containing passenger volume data.
@@ -355,16 +575,25 @@ class Client(LandTransportSg):
             PASSENGER_VOLUME_BY_TRAIN_STATIONS_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_ONE_DAY,
+            deadline=deadline,
         )
 
         return passenger_volume_link
 
     @typechecked
-    def planned_bus_routes(self) -> list[PlannedBusRoutesDict]:
+    def planned_bus_routes(
+        self,
+        deadline: float | None=None,
+    ) -> list[PlannedBusRoutesDict]:
         """Get planned new/updated bus routes information.
 
         Important note: Data to be released only ON/AFTER the Effective Date.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Information about planned bus routes.
         :rtype: list[PlannedBusRoutesDict]
         """
@@ -374,10 +603,36 @@ class Client(LandTransportSg):
             PLANNED_BUS_ROUTES_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
             sanitise_ignore_keys=PLANNED_BUS_ROUTES_SANITISE_IGNORE_KEYS,
+            record_type=PlannedBusRoutesDict,
+            deadline=deadline,
         )
 
         return planned_bus_routes
 
+    @typechecked
+    def iter_planned_bus_routes(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[PlannedBusRoutesDict]:
+        """Same as ``planned_bus_routes()``, but yield each planned bus route as \
+        soon as its page of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Information about planned bus routes.
+        :rtype: Iterator[PlannedBusRoutesDict]
+        """
+        yield from self.iter_records(
+            PLANNED_BUS_ROUTES_API_ENDPOINT,
+            cache_duration=CACHE_ONE_DAY,
+            sanitise_ignore_keys=PLANNED_BUS_ROUTES_SANITISE_IGNORE_KEYS,
+            record_type=PlannedBusRoutesDict,
+            deadline=deadline,
+        )
+
     @typechecked
     def train_lines(self) -> tuple[str, ...]:
         """Return the tuple of valid train lines.
@@ -394,6 +649,7 @@ class Client(LandTransportSg):
     @typechecked
     def station_crowd_density_real_time(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[StationCrowdDensityArgsDict],
     ) -> list[StationCrowdDensityRealTimeDict]:
         """Get real-time MRT/LRT station crowdedness level of a particular \
@@ -404,6 +660,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: StationCrowdDensityArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: train_line is not specified.
         :raises ValueError: train_line is not a valid train network line.
 
@@ -432,6 +693,8 @@ class Client(LandTransportSg):
             STATION_CROWD_DENSITY_REAL_TIME_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_TEN_MINUTES,
+            record_type=StationCrowdDensityRealTimeDict,
+            deadline=deadline,
         )
 
         return station_crowd_density_real_time
@@ -439,6 +702,7 @@ class Client(LandTransportSg):
     @typechecked
     def station_crowd_density_forecast(
         self,
+        deadline: float | None=None,
         **kwargs: Unpack[StationCrowdDensityArgsDict],
     ) -> list[StationCrowdDensityForecastDict]:
         """Get forecasted MRT/LRT statiion crowdedness level of a particular \
@@ -449,6 +713,11 @@ class Client(LandTransportSg):
             endpoint URL.
         :type kwargs: StationCrowdDensityArgsDict
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :raises ValueError: train_line is not specified.
         :raises ValueError: train_line is not a valid train network line.
 
@@ -477,15 +746,112 @@ class Client(LandTransportSg):
             STATION_CROWD_DENSITY_FORECAST_API_ENDPOINT,
             params=params,
             cache_duration=CACHE_ONE_DAY,
+            record_type=StationCrowdDensityForecastDict,
+            deadline=deadline,
+        )
+
+        return station_crowd_density_forecast
+
+    @typechecked
+    def station_crowd_density_real_time_all(
+        self,
+        max_workers: int=len(TRAIN_LINES),
+        deadline: float | None=None,
+    ) -> StationCrowdDensityRealTimeAllDict:
+        """Get real-time MRT/LRT station crowdedness level of every train \
+        network line.
+
+        The train network lines are requested concurrently, so this takes \
+            about as long as the slowest line instead of all of the lines. A \
+            train network line that fails does not stop the others, and its \
+            exception is returned in ``errors``.
+
+        :param max_workers: Maximum number of train network lines to request \
+            at the same time. Defaults to the number of train network lines.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each train \
+            network line may take, instead of the client's \
+            ``resilience.deadline``. Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Station crowdedness level by station code, and the error of \
+            each train network line that failed.
+        :rtype: StationCrowdDensityRealTimeAllDict
+        """
+        station_crowd_density_real_time: StationCrowdDensityRealTimeAllDict
+
+        results = self.__for_each_train_line(
+            self.station_crowd_density_real_time,
+            max_workers=max_workers,
+            deadline=deadline,
+        )
+
+        station_crowd_density_real_time = \
+            merge_station_crowd_density_real_time(results)
+
+        return station_crowd_density_real_time
+
+    @typechecked
+    def station_crowd_density_forecast_all(
+        self,
+        max_workers: int=len(TRAIN_LINES),
+        deadline: float | None=None,
+    ) -> StationCrowdDensityForecastAllDict:
+        """Get forecasted MRT/LRT station crowdedness level of every train \
+        network line at 30 minutes interval.
+
+        The train network lines are requested concurrently, so this takes \
+            about as long as the slowest line instead of all of the lines. A \
+            train network line that fails does not stop the others, and its \
+            exception is returned in ``errors``.
+
+        Every forecasted date of a station is kept, in the order that it was \
+            received.
+
+        :param max_workers: Maximum number of train network lines to request \
+            at the same time. Defaults to the number of train network lines.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each train \
+            network line may take, instead of the client's \
+            ``resilience.deadline``. Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Forecasted station crowdedness level of each date by station \
+            code, and the error of each train network line that failed.
+        :rtype: StationCrowdDensityForecastAllDict
+        """
+        station_crowd_density_forecast: StationCrowdDensityForecastAllDict
+
+        results = self.__for_each_train_line(
+            self.station_crowd_density_forecast,
+            max_workers=max_workers,
+            deadline=deadline,
         )
 
+        station_crowd_density_forecast = \
+            merge_station_crowd_density_forecast(results)
+
         return station_crowd_density_forecast
 
     @typechecked
-    def taxi_availability(self) -> list[TaxiAvailabilityDict]:
+    def taxi_availability(
+        self,
+        deadline: float | None=None,
+    ) -> list[TaxiAvailabilityDict]:
         """Get location coordinates of all Taxis that are currently available \
         for hire. Does not include "Hired" or "Busy" Taxis.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Location coordinaties of available taxis.
         :rtype: list[TaxiAvailabilityDict]
         """
@@ -494,14 +860,47 @@ class Client(LandTransportSg):
         taxi_availabilities = self.send_request(
             TAXI_AVAILABILITY_API_ENDPOINT,
             cache_duration=CACHE_ONE_MINUTE,
+            record_type=TaxiAvailabilityDict,
+            deadline=deadline,
         )
 
         return taxi_availabilities
 
-    def taxi_stands(self) -> list[TaxiStandsDict]:
+    @typechecked
+    def iter_taxi_availability(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[TaxiAvailabilityDict]:
+        """Same as ``taxi_availability()``, but yield each available taxi as soon \
+        as its page of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Location coordinaties of available taxis.
+        :rtype: Iterator[TaxiAvailabilityDict]
+        """
+        yield from self.iter_records(
+            TAXI_AVAILABILITY_API_ENDPOINT,
+            cache_duration=CACHE_ONE_MINUTE,
+            record_type=TaxiAvailabilityDict,
+            deadline=deadline,
+        )
+
+    def taxi_stands(
+        self,
+        deadline: float | None=None,
+    ) -> list[TaxiStandsDict]:
         """Get detailed information of Taxi stands, such as location and \
         whether is it barrier free.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Detailed information of taxi stands.
         :rtype: list[TaxiStandsDict]
         """
@@ -510,14 +909,24 @@ class Client(LandTransportSg):
         taxi_stands = self.send_request(
             TAXI_STANDS_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
+            record_type=TaxiStandsDict,
+            deadline=deadline,
         )
 
         return taxi_stands
 
-    def train_service_alerts(self) -> list[TrainServiceAlertsDict]:
+    def train_service_alerts(
+        self,
+        deadline: float | None=None,
+    ) -> list[TrainServiceAlertsDict]:
         """Get detailed information on train service unavailability during \
         scheduled operating hours, such as affected line and stations etc.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Information about train service unavailability.
         :rtype: list[TrainServiceAlertsDict]
         """
@@ -526,10 +935,152 @@ class Client(LandTransportSg):
         train_service_alerts = self.send_request(
             TRAIN_SERVICE_ALERTS_API_ENDPOINT,
             cache_duration=CACHE_ONE_HOUR,
+            record_type=TrainServiceAlertsDict,
+            deadline=deadline,
         )
 
         return train_service_alerts
 
+# private
+
+    @typechecked
+    def __for_each_train_line(
+        self,
+        method: Callable[..., list[Any]],
+        max_workers: int,
+        deadline: float | None=None,
+    ) -> dict[str, list[Any] | Exception]:
+        """Call a station crowd density method for every train network line \
+        concurrently.
+
+        :param method: The method, e.g. ``station_crowd_density_real_time``.
+        :type method: Callable[..., list[Any]]
+
+        :param max_workers: Maximum number of train network lines to request \
+            at the same time.
+        :type max_workers: int
+
+        :param deadline: Number of seconds that the request of each train \
+            network line may take. Defaults to None.
+        :type deadline: float or None
+
+        :raises ValueError: max_workers is less than 1.
+
+        :return: Result of the method, or the exception that was raised \
+            while calling it, by train network line in the order of \
+            ``TRAIN_LINES``.
+        :rtype: dict[str, list[Any] | Exception]
+        """
+        return map_concurrently(
+            lambda train_line: method(
+                deadline=deadline,
+                train_line=train_line,
+            ),
+            TRAIN_LINES,
+            max_workers=max_workers,
+        )
+
+    @typechecked
+    def __validate_bus_stop_code(self, bus_stop_code: str) -> None:
+        """Check that a bus stop code is valid.
+
+        :param bus_stop_code: The bus stop code.
+        :type bus_stop_code: str
+
+        :raises ValueError: bus_stop_code is not exactly 5 characters long.
+        :raises ValueError: bus_stop_code is not a number-like string.
+        """
+        try:
+            _ = int(bus_stop_code)
+        except Exception as e:
+            raise ValueError(
+                'Argument "bus_stop_code" is not a valid number.'
+            ) from e
+
+        if len(bus_stop_code) != 5:
+            raise ValueError(
+                'Argument "bus_stop_code" must be 5-digits long.'
+            )
+
+@typechecked
+def merge_station_crowd_density_real_time(
+    results: dict[str, list[StationCrowdDensityRealTimeDict] | Exception],
+) -> StationCrowdDensityRealTimeAllDict:
+    """Merge the real-time station crowdedness levels of several train \
+    network lines by station code.
+
+    :param results: Station crowdedness levels, or the exception that was \
+        raised while getting them, by train network line.
+    :type results: dict[str, list[StationCrowdDensityRealTimeDict] | \
+        Exception]
+
+    :return: Station crowdedness level by station code, and the error of \
+        each train network line that failed.
+    :rtype: StationCrowdDensityRealTimeAllDict
+    """
+    station_crowd_density_real_time: StationCrowdDensityRealTimeAllDict = {
+        'data': {},
+        'errors': {},
+    }
+
+    for train_line, result in results.items():
+        if isinstance(result, Exception):
+            station_crowd_density_real_time['errors'][train_line] = result
+            continue
+
+        for station in result:
+            station_crowd_density_real_time['data'][station['Station']] = \
+                station
+
+    return station_crowd_density_real_time
+
+@typechecked
+def merge_station_crowd_density_forecast(
+    results: dict[str, list[StationCrowdDensityForecastDict] | Exception],
+) -> StationCrowdDensityForecastAllDict:
+    """Merge the forecasted station crowdedness levels of several train \
+    network lines by station code, keeping every forecasted date of a \
+    station in the order that it was received.
+
+    :param results: Forecasted station crowdedness levels, or the exception \
+        that was raised while getting them, by train network line.
+    :type results: dict[str, list[StationCrowdDensityForecastDict] | \
+        Exception]
+
+    :return: Forecasted station crowdedness level of each date by station \
+        code, and the error of each train network line that failed.
+    :rtype: StationCrowdDensityForecastAllDict
+    """
+    station_crowd_density_forecast: StationCrowdDensityForecastAllDict = {
+        'data': {},
+        'errors': {},
+    }
+
+    for train_line, result in results.items():
+        if isinstance(result, Exception):
+            station_crowd_density_forecast['errors'][train_line] = result
+            continue
+
+        for forecast in result:
+            for station in forecast['Stations']:
+                forecasts = station_crowd_density_forecast['data'] \
+                    .setdefault(station['Station'], [])
+                for station_forecast in forecasts:
+                    # the same date of a station is split across records
+                    if station_forecast['Date'] == forecast['Date']:
+                        station_forecast['Interval'] += station['Interval']
+                        break
+                else:
+                    forecasts.append({
+                        'Date': forecast['Date'],
+                        'Station': station['Station'],
+                        'Interval': list(station['Interval']),
+                    })
+
+    return station_crowd_density_forecast
+
 __all__ = [
     'Client',
+    'merge_station_crowd_density_forecast',
+    'merge_station_crowd_density_real_time',
 ]
@@ -93,6 +93,8 @@ TRAIN_LINES = (
     'TEL',
 )
 
+BUS_ARRIVALS_MAX_WORKERS = 8
+
 __all__ = [
     'BUS_ARRIVAL_API_ENDPOINT',
     'BUS_SERVICES_API_ENDPOINT',
@@ -122,4 +124,6 @@ __all__ = [
     'PLANNED_BUS_ROUTES_SANITISE_IGNORE_KEYS',
 
     'TRAIN_LINES',
+
+    'BUS_ARRIVALS_MAX_WORKERS',
 ]
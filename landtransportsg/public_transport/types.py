@@ -404,6 +404,55 @@ class StationCrowdDensityForecastDict(TypedDict):
     Stations: list[_StationCrowdDensityForecastStationDict]
     """Array of station crowd density forecast."""
 
+class _StationCrowdDensityForecastAllStationDict(TypedDict):
+    """Type definition for StationCrowdDensityForecastAllDict"""
+
+    Date: datetime
+    """Midnight of the forecasted date.
+
+    :example: datetime(2021, 9, 15, 0, 0, 0)
+    """
+    Station: str
+    """Station code.
+
+    :example: "EW13"
+    """
+    Interval: list[_StationCrowdDensityForecastStationIntervalDict]
+    """Array of station crowd density forecast per time interval."""
+
+class StationCrowdDensityRealTimeAllDict(TypedDict):
+    """Type definition for station_crowd_density_real_time_all()"""
+
+    data: dict[str, StationCrowdDensityRealTimeDict]
+    """Station crowdedness level of each train network line that was \
+        requested successfully, by station code.
+
+    :example: {"EW13": {...}, "NS25": {...}}
+    """
+    errors: dict[str, Exception]
+    """Exception that was raised while requesting each train network line \
+        that failed, by train network line.
+
+    :example: {"CCL": HTTPError(...)}
+    """
+
+class StationCrowdDensityForecastAllDict(TypedDict):
+    """Type definition for station_crowd_density_forecast_all()"""
+
+    data: dict[str, list[_StationCrowdDensityForecastAllStationDict]]
+    """Forecasted station crowdedness level of each train network line that \
+        was requested successfully, by station code, with one forecast for \
+        each forecasted date.
+
+    :example: {"EW13": [{...}, {...}], "NS25": [{...}, {...}]}
+    """
+    errors: dict[str, Exception]
+    """Exception that was raised while requesting each train network line \
+        that failed, by train network line.
+
+    :example: {"CCL": HTTPError(...)}
+    """
+
 class TaxiAvailabilityDict(TypedDict):
     """Type definition for taxi_availability()"""
 
@@ -571,6 +620,9 @@ __all__ = [
     '_StationCrowdDensityForecastStationDict',
     'StationCrowdDensityRealTimeDict',
     'StationCrowdDensityForecastDict',
+    '_StationCrowdDensityForecastAllStationDict',
+    'StationCrowdDensityRealTimeAllDict',
+    'StationCrowdDensityForecastAllDict',
     'TaxiAvailabilityDict',
     'TaxiStandsDict',
     'TrainServiceAlertsDict',
@@ -0,0 +1,274 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Limit the rate of requests that are sent to the API endpoints."""
+
+import asyncio
+from math import ceil, isinf
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from typeguard import typechecked
+
+from .circuit_breaker import CircuitBreaker
+from .constants import RATE_LIMIT_BURST, RATE_LIMIT_REQUESTS_PER_SECOND
+from .deadline import Deadline, current_deadline
+from .exceptions import DeadlineExceededError
+
+class RateLimiter:
+    """Token bucket that limits how many requests can be sent per second.
+
+    The bucket holds up to ``burst`` tokens and is refilled at ``rate`` \
+        tokens per second. Every request takes one token, and waits for the \
+        bucket to be refilled if it is empty. A rate limiter is thread-safe, \
+        so it can be shared by several clients and threads.
+
+    :param rate: Number of requests that can be sent per second. Use \
+        ``math.inf`` to send requests without limit. Defaults to 20.
+    :type rate: float
+
+    :param burst: Number of requests that can be sent at once after a quiet \
+        period. Defaults to None, i.e. the same as ``rate`` (at least 1).
+    :type burst: int or None
+
+    :raises ValueError: rate is not more than 0.
+    :raises ValueError: burst is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        rate: float=RATE_LIMIT_REQUESTS_PER_SECOND,
+        burst: int | None=RATE_LIMIT_BURST,
+    ) -> None:
+        """Constructor method"""
+        self.__lock = Lock()
+        self.configure(rate, burst=burst)
+
+    @typechecked
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}(rate={self.rate}, ' \
+            f'burst={self.burst})'
+
+    @typechecked
+    def configure(self, rate: float, burst: int | None=None) -> None:
+        """Change the rate and burst of the rate limiter. The bucket is \
+        refilled to the new burst.
+
+        :param rate: Number of requests that can be sent per second. Use \
+            ``math.inf`` to send requests without limit.
+        :type rate: float
+
+        :param burst: Number of requests that can be sent at once after a \
+            quiet period. Defaults to None, i.e. the same as ``rate`` (at \
+            least 1).
+        :type burst: int or None
+
+        :raises ValueError: rate is not more than 0.
+        :raises ValueError: burst is less than 1.
+        """
+        if not rate > 0:
+            raise ValueError('Argument "rate" must be more than 0.')
+
+        if burst is None:
+            burst = 1 if isinf(rate) else max(1, ceil(rate))
+        if burst < 1:
+            raise ValueError('Argument "burst" cannot be less than 1.')
+
+        with self.__lock:
+            self.rate = rate
+            self.burst = burst
+            self.__tokens = float(burst)
+            self.__updated_at = monotonic()
+
+    @typechecked
+    def try_acquire(self) -> bool:
+        """Take one token from the bucket without waiting.
+
+        :return: True if a token was taken.
+        :rtype: bool
+        """
+        return self.__take() == 0
+
+    @typechecked
+    def acquire(self, deadline: Deadline | None=None) -> float:
+        """Take one token from the bucket, waiting until the bucket has been \
+        refilled if it is empty.
+
+        :param deadline: Deadline by which the token must be taken. Defaults \
+            to None, i.e. wait for as long as it takes.
+        :type deadline: Deadline or None
+
+        :raises DeadlineExceededError: The bucket is not refilled before the \
+            deadline. No token is taken, and it is raised without waiting.
+
+        :return: Number of seconds spent waiting.
+        :rtype: float
+        """
+        waited = 0.0
+
+        while (wait := self.__take()) > 0:
+            if deadline is not None and wait > deadline.remaining:
+                raise DeadlineExceededError(
+                    'Rate limit allows no request before the deadline.',
+                )
+            sleep(wait)
+            waited += wait
+
+        return waited
+
+    async def acquire_async(self, deadline: Deadline | None=None) -> float:
+        """Same as ``acquire()``, but wait for the bucket to be refilled \
+        without blocking the event loop.
+
+        :param deadline: Deadline by which the token must be taken. Defaults \
+            to None, i.e. wait for as long as it takes.
+        :type deadline: Deadline or None
+
+        :raises DeadlineExceededError: The bucket is not refilled before the \
+            deadline. No token is taken, and it is raised without waiting.
+
+        :return: Number of seconds spent waiting.
+        :rtype: float
+        """
+        waited = 0.0
+
+        while (wait := self.__take()) > 0:
+            if deadline is not None and wait > deadline.remaining:
+                raise DeadlineExceededError(
+                    'Rate limit allows no request before the deadline.',
+                )
+            await asyncio.sleep(wait)
+            waited += wait
+
+        return waited
+
+# private
+
+    def __take(self) -> float:
+        """Take one token from the bucket if there is one.
+
+        :return: 0 if a token was taken, else the number of seconds until the \
+            next token is available.
+        :rtype: float
+        """
+        if isinf(self.rate):
+            return 0
+
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                float(self.burst),
+                self.__tokens + ((now - self.__updated_at) * self.rate),
+            )
+            self.__updated_at = now
+
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return 0
+
+            return (1 - self.__tokens) / self.rate
+
+class RateLimitedHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that takes a token from a rate limiter before sending \
+        every request. Responses that are served from the cache do not reach \
+        the adapter, so they are not rate-limited.
+
+    If it has a circuit breaker, then requests to an endpoint whose circuit \
+        is open fail fast without taking a token, and the result of every \
+        request that is sent, after its retries, is recorded in the circuit \
+        breaker.
+
+    If a deadline is entered in the thread that sends a request, then the \
+        request waits for a token only until the deadline.
+
+    :param rate_limiter: The rate limiter to use.
+    :type rate_limiter: RateLimiter
+
+    :param circuit_breaker: The circuit breaker to use. Defaults to None, \
+        i.e. no circuit breaker.
+    :type circuit_breaker: CircuitBreaker or None
+
+    :param kwargs: Other arguments to pass to ``HTTPAdapter``.
+    :type kwargs: Any
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        circuit_breaker: CircuitBreaker | None=None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor method"""
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        super().__init__(**kwargs)
+
+    def send(
+        self,
+        request: PreparedRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Check the circuit breaker and wait for the rate limiter, then send \
+        the request.
+
+        :param request: The request to send.
+        :type request: PreparedRequest
+
+        :raises CircuitOpenError: The circuit of the request's endpoint is \
+            open.
+        :raises DeadlineExceededError: The rate limiter allows no request \
+            before the current thread's deadline.
+
+        :return: The response.
+        :rtype: Response
+        """
+        deadline = current_deadline()
+
+        if self.circuit_breaker is None:
+            self.rate_limiter.acquire(deadline=deadline)
+            return super().send(request, *args, **kwargs)
+
+        self.circuit_breaker.before_request(request.url)
+
+        try:
+            self.rate_limiter.acquire(deadline=deadline)
+        except DeadlineExceededError:
+            # the request is not sent, so it says nothing about the endpoint
+            self.circuit_breaker.cancel_request(request.url)
+            raise
+
+        try:
+            response = super().send(request, *args, **kwargs)
+        except Exception:
+            self.circuit_breaker.record_failure(request.url)
+            raise
+
+        self.circuit_breaker.record_response(request.url, response)
+
+        return response
+
+DEFAULT_RATE_LIMITER = RateLimiter()
+"""Rate limiter that is shared by every client that is not given its own."""
+
+__all__ = [
+    'DEFAULT_RATE_LIMITER',
+    'RateLimiter',
+    'RateLimitedHTTPAdapter',
+]
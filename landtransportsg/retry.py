@@ -0,0 +1,86 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retry failed requests with backoff that spreads them out over time."""
+
+from random import uniform
+from typing import Any
+
+from requests.adapters import Retry
+from urllib3.exceptions import MaxRetryError, ResponseError
+
+class JitteredRetry(Retry):
+    """Retry configuration with full-jitter exponential backoff.
+
+    Each backoff is a random number of seconds between 0 and the backoff of \
+        ``urllib3.util.Retry``, i.e. ``backoff_factor * 2 ** (retries - 1)`` \
+        up to ``backoff_max``. Requests that failed at the same time, e.g. \
+        during an outage, are then retried at different times instead of all \
+        at once.
+
+    A ``Retry-After`` header on a 413, 429 or 503 response is honoured in \
+        full. If it asks to wait for longer than ``backoff_max``, then the \
+        request is not retried at all, so that a thread is not blocked for \
+        longer than any other backoff, and the response is given up as the \
+        final one, i.e. it is returned or raised as ``MaxRetryError`` \
+        depending on ``raise_on_status``.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Random number of seconds to wait before the next retry."""
+        return uniform(0, super().get_backoff_time())
+
+    def get_retry_after_max(self) -> float:
+        """Longest ``Retry-After`` wait, in seconds, before a retry is given \
+        up instead."""
+        return self.backoff_max
+
+    def increment(
+        self,
+        method: str | None=None,
+        url: str | None=None,
+        response: Any=None,
+        error: Exception | None=None,
+        _pool: Any=None,
+        _stacktrace: Any=None,
+    ) -> 'JitteredRetry':
+        """Return a new retry configuration with the retry counted, or raise \
+        ``MaxRetryError`` if the response asks to wait for longer than \
+        ``get_retry_after_max()``."""
+        retry_after = None if response is None \
+            else self.get_retry_after(response)
+
+        if retry_after is not None and retry_after > self.get_retry_after_max():
+            raise MaxRetryError(
+                _pool,
+                url,
+                ResponseError(
+                    ResponseError.SPECIFIC_ERROR.format(
+                        status_code=response.status,
+                    ),
+                ),
+            )
+
+        return super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
+
+__all__ = [
+    'JitteredRetry',
+]
@@ -0,0 +1,301 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sanitise response values whose types are not known in advance."""
+
+import re
+from functools import cache
+from sys import get_int_max_str_digits
+from typing import Any
+
+from typeguard import typechecked
+
+from .timezone import datetime_or_none_from_string
+
+KeyPathTrie = dict[Any, Any]
+"""Key paths as nested dicts, by dict key or ``LIST_ITEMS``, with None at \
+the end of each key path."""
+
+LIST_ITEMS = '[]'
+"""Key of the items of a list in a ``KeyPathTrie``."""
+
+# the syntax of the strings that int() and float() accept, so that strings
+# are classified before they are converted, instead of by failing to convert
+_DIGITS = r'\d+(?:_\d+)*'
+_SPACES = r'[^\S\x1c-\x1f]*'  # int() and float() do not strip "\x1c" to "\x1f"
+_FLOAT = (
+    rf'[+-]?(?:'
+    rf'(?:(?:{_DIGITS})?\.{_DIGITS}|{_DIGITS}\.?)(?:[eE][+-]?{_DIGITS})?'
+    rf'|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN]'
+    rf')'
+)
+_INT_PATTERN = re.compile(rf'{_SPACES}[+-]?{_DIGITS}{_SPACES}')
+_FLOAT_PATTERN = re.compile(rf'{_SPACES}{_FLOAT}{_SPACES}')
+
+# strings that may be a tuple of numbers, e.g. "1.29685,103.85207", whose
+# items are stripped of all whitespace
+_NUMBERS_PATTERN = re.compile(rf'\s*{_FLOAT}\s*(?:,\s*{_FLOAT}\s*)+')
+
+@typechecked
+def compile_ignore_keys(
+    ignore_keys: list[str] | None,
+    key_path: str='',
+) -> KeyPathTrie | None:
+    """Compile the key paths of values to ignore when sanitising, e.g. \
+    ``'Services[].NextBus.OriginCode'``, into a trie that is walked \
+    alongside the values.
+
+    The trie of each list of key paths is compiled once, and then reused.
+
+    :param ignore_keys: Key paths to ignore. Keys are separated by ``.``, \
+        and the items of a list are ``[]``.
+    :type ignore_keys: list[str] or None
+
+    :param key_path: Key path of the value that is sanitised with the trie. \
+        Defaults to blank string, i.e. the whole response.
+    :type key_path: str
+
+    :return: The trie of the key paths below ``key_path``, or None if there \
+        are none.
+    :rtype: KeyPathTrie or None
+    """
+    if not ignore_keys:
+        return None
+
+    return _compile_ignore_keys(tuple(ignore_keys), key_path)
+
+@typechecked
+def sanitise_value(value: Any, ignore_keys: KeyPathTrie | None=None) -> Any:
+    """Sanitise the strings in a value with ``sanitise_string()``, \
+    recursively through its ``dict`` and ``list`` objects.
+
+    :param value: Value to sanitise.
+    :type value: Any
+
+    :param ignore_keys: Trie of the key paths to ignore, from \
+        ``compile_ignore_keys()``. Defaults to None.
+    :type ignore_keys: KeyPathTrie or None
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    return _sanitise_value(value, ignore_keys)
+
+@typechecked
+def sanitise_string(value: str) -> Any:
+    """Convert a string to the type that it looks like:
+
+    - Blank string: convert to None.
+    - String of comma-separated numbers that are all integers or all \
+        floats: convert to a ``tuple`` of ``int`` or ``float``.
+    - String that is like date or datetime: convert to ``datetime.date`` \
+        or ``datetime.datetime`` object respectively.
+    - String that is number-like: convert to ``int`` or ``float`` \
+        appropriately.
+    - Finally: Leave the value as-is.
+
+    Each string is classified by its syntax before it is converted, so \
+        strings like road names and messages are left as they are without \
+        trying to convert them.
+
+    :param value: String to sanitise.
+    :type value: str
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    return _sanitise_string(value)
+
+@cache
+def _compile_ignore_keys(
+    ignore_keys: tuple[str, ...],
+    key_path: str,
+) -> KeyPathTrie | None:
+    """Compile key paths into a trie.
+
+    :param ignore_keys: Key paths to ignore.
+    :type ignore_keys: tuple[str, ...]
+
+    :param key_path: Key path of the value that is sanitised with the trie.
+    :type key_path: str
+
+    :return: The trie of the key paths below ``key_path``, or None if there \
+        are none.
+    :rtype: KeyPathTrie or None
+    """
+    parent_keys = _split_key_path(key_path)
+    if parent_keys is None:
+        return None
+
+    trie: KeyPathTrie = {}
+    for ignore_key in ignore_keys:
+        keys = _split_key_path(ignore_key)
+        if not keys or keys[-1] == LIST_ITEMS:
+            # only the values of dict keys are ignored
+            continue
+        if len(keys) <= len(parent_keys) \
+            or keys[:len(parent_keys)] != parent_keys:
+            continue
+
+        node: KeyPathTrie | None = trie
+        *path_keys, last_key = keys[len(parent_keys):]
+        for key in path_keys:
+            node = node.setdefault(key, {})
+            if node is None:
+                # the parent key is ignored already
+                break
+        else:
+            node[last_key] = None
+
+    return trie or None
+
+def _split_key_path(key_path: str) -> list[str] | None:
+    """Split a key path into its keys, e.g. ``'Services[].NextBus'`` into \
+    ``['Services', '[]', 'NextBus']``.
+
+    :param key_path: The key path.
+    :type key_path: str
+
+    :return: The keys, or None if the key path cannot be the path of a \
+        value, e.g. ``'.NextBus'``.
+    :rtype: list[str] or None
+    """
+    if key_path == '':
+        return []
+
+    keys = []
+    for i, key in enumerate(key_path.split('.')):
+        list_depth = 0
+        while key.endswith(LIST_ITEMS):
+            key = key[:-len(LIST_ITEMS)]
+            list_depth += 1
+
+        if i > 0:
+            keys.append(key)
+        elif key != '':
+            keys.append(key)
+        elif list_depth == 0:
+            # only the items of a list have a path without a first key
+            return None
+
+        keys.extend([LIST_ITEMS] * list_depth)
+
+    return keys
+
+def _sanitise_value(value: Any, ignore_keys: KeyPathTrie | None) -> Any:
+    """Sanitise a value recursively.
+
+    :param value: Value to sanitise.
+    :type value: Any
+
+    :param ignore_keys: Trie of the key paths to ignore below the value.
+    :type ignore_keys: KeyPathTrie or None
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    if isinstance(value, str):
+        return _sanitise_string(value)
+
+    if isinstance(value, list):
+        item_ignore_keys = None if ignore_keys is None \
+            else ignore_keys.get(LIST_ITEMS)
+        return [_sanitise_value(v, item_ignore_keys) for v in value]
+
+    if isinstance(value, dict):
+        if ignore_keys is None:
+            return {k: _sanitise_value(v, None) for k, v in value.items()}
+
+        sanitised_dict = {}
+        for k, v in value.items():
+            if k not in ignore_keys:
+                sanitised_dict[k] = _sanitise_value(v, None)
+            elif ignore_keys[k] is None:
+                sanitised_dict[k] = v
+            else:
+                sanitised_dict[k] = _sanitise_value(v, ignore_keys[k])
+        return sanitised_dict
+
+    return value
+
+def _sanitise_string(value: str) -> Any:
+    """Sanitise a string.
+
+    :param value: String to sanitise.
+    :type value: str
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    if value == '':
+        return None
+
+    if ',' in value and _NUMBERS_PATTERN.fullmatch(value) is not None:
+        # the items may still be other types, e.g. "2007" is a time
+        tuple_value = tuple(
+            _sanitise_scalar(v.strip()) for v in value.split(',')
+        )
+        values_are_int = all(isinstance(v, int) for v in tuple_value)
+        values_are_float = all(isinstance(v, float) for v in tuple_value)
+        if values_are_int or values_are_float:
+            return tuple_value
+
+    return _sanitise_scalar(value)
+
+def _sanitise_scalar(value: str) -> Any:
+    """Convert a string to a datetime, date, time, ``int`` or ``float``, or \
+    leave it as it is.
+
+    :param value: String to sanitise.
+    :type value: str
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    dt = datetime_or_none_from_string(value)
+    if dt is not None:
+        return dt
+
+    if _INT_PATTERN.fullmatch(value) is not None \
+        and _is_within_int_max_str_digits(value):
+        return int(value)
+
+    if _FLOAT_PATTERN.fullmatch(value) is not None:
+        return float(value)
+
+    return value
+
+def _is_within_int_max_str_digits(value: str) -> bool:
+    """True if ``int()`` can convert a string of digits without exceeding \
+    the maximum number of digits.
+
+    :param value: String of digits.
+    :type value: str
+
+    :return: True if it is within the maximum number of digits.
+    :rtype: bool
+    """
+    max_str_digits = get_int_max_str_digits()
+    if max_str_digits == 0 or len(value) <= max_str_digits:
+        return True
+
+    return sum(c.isdigit() for c in value) <= max_str_digits
+
+__all__ = [
+    'KeyPathTrie',
+    'LIST_ITEMS',
+    'compile_ignore_keys',
+    'sanitise_string',
+    'sanitise_value',
+]
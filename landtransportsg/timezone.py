@@ -14,12 +14,15 @@
 
 """Standardise all datetime-related timezones to SGT (Singapore Time)."""
 
+import re
 from datetime import date, datetime, time, timedelta
-from re import fullmatch, match
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from typeguard import typechecked
 
+from .constants import DATETIME_CACHE_SIZE
+
 ALLOWED_DATE_FORMATS = (
     '%Y-%m-%dT%H:%M:%S.%f%z',
     '%Y-%m-%dT%H:%M:%S%z',
@@ -47,6 +50,34 @@ ALLOWED_DATE_FORMATS = (
 TWO_MONTHS_AGO_DATE = (date.today() + timedelta(-40))
 FOUR_MONTHS_AGO_DATE = (date.today() + timedelta(-100))
 
+SGT_TIMEZONE = ZoneInfo('Asia/Singapore')
+"""Singapore Time (SGT) timezone."""
+
+# strings that can have one of the allowed formats, i.e. dates, "%H%M" times
+# and, like every other format, strings with ":" and only the digits,
+# whitespace, separators and UTC offsets of the formats
+_DATETIME_CANDIDATE = re.compile(
+    r'\d{4}-?\d{1,2}-?(?:\d{1,2}| \d)|\d{4}|[\d\s.+\-TtZ]*:[\d\s:.+\-TtZ]*',
+)
+
+# dates and times without a timezone, by their length
+_SHORT_SHAPES = {
+    4: (re.compile(r'(\d{2})(\d{2})', re.ASCII), time),         # %H%M
+    5: (re.compile(r'(\d{2}):(\d{2})', re.ASCII), time),        # %H:%M
+    8: (re.compile(r'(\d{4})(\d{2})(\d{2})', re.ASCII), date),  # %Y%m%d
+    10: (re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII), date), # %Y-%m-%d
+}
+
+# date and time in the ISO 8601 shapes that the endpoints return
+_ISO_DATETIME_PATTERN = re.compile(
+    r'(?P<year>\d{4})(?P<date_separator>-?)(?P<month>\d{2})'
+    r'(?P=date_separator)(?P<day>\d{2})(?P<separator>[T ])'
+    r'(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})'
+    r'(?:\.(?P<fraction>\d{1,6}))?'
+    r'(?:Z|[+-](?P<offset_hours>\d{2}):?[0-5]\d)?',
+    re.ASCII,
+)
+
 @typechecked
 def datetime_as_sgt(dt: datetime) -> datetime:
     """Update a datetime to use the SGT timezone and return the datetime.
@@ -57,7 +88,7 @@ def datetime_as_sgt(dt: datetime) -> datetime:
     :return: The datetime in SGT timezone.
     :rtype: datetime
     """
-    dt_sg: datetime = dt.replace(tzinfo=ZoneInfo('Asia/Singapore'))
+    dt_sg: datetime = dt.replace(tzinfo=SGT_TIMEZONE)
     return dt_sg
 
 @typechecked
@@ -86,6 +117,10 @@ def datetime_from_string(val: str) -> datetime | date | time:
     19. %H:%M
     20. %H%M
 
+    The common shapes, e.g. ISO 8601 dates and times, and ``HHMM`` times, \
+    are parsed directly by their length and separators. Other strings are \
+    parsed with the formats.
+
     :param val: String to convert to a datetime.
     :type val: str
 
@@ -95,6 +130,103 @@ def datetime_from_string(val: str) -> datetime | date | time:
         there is no date.
     :rtype: datetime | date | time
     """
+    dt = datetime_or_none_from_string(val)
+    if dt is None:
+        raise ValueError('val is not a recognised datetime string')
+
+    return dt
+
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+@typechecked
+def datetime_or_none_from_string(val: str) -> datetime | date | time | None:
+    """Convert a string into a datetime in SGT timezone, like \
+    ``datetime_from_string()``, but return None instead of raising an \
+    exception if it is not a recognised datetime string.
+
+    The results of the latest strings are cached, since the same values \
+    are often repeated in a response.
+
+    :param val: String to convert to a datetime.
+    :type val: str
+
+    :return: The value as a datetime, date or time, or None if it is not a \
+        recognised datetime string.
+    :rtype: datetime | date | time | None
+    """
+    # most strings in a response are not datetimes, so they are rejected
+    # before they are parsed
+    if _DATETIME_CANDIDATE.fullmatch(val) is None:
+        return None
+
+    try:
+        dt = _parse_datetime_shape(val)
+    except ValueError:
+        # e.g. the 30th of February, which the formats reject too
+        dt = None
+
+    if dt is None:
+        dt = _parse_datetime_formats(val)
+
+    return dt
+
+def _parse_datetime_shape(val: str) -> datetime | date | time | None:
+    """Parse a datetime string that has one of the common shapes. The \
+    result is the same as parsing it with the allowed formats.
+
+    :param val: String to convert to a datetime.
+    :type val: str
+
+    :raises ValueError: A part of the value is out of range.
+
+    :return: The value as a datetime, date or time, or None if it does not \
+        have a common shape.
+    :rtype: datetime | date | time | None
+    """
+    short_shape = _SHORT_SHAPES.get(len(val))
+    if short_shape is not None:
+        pattern, constructor = short_shape
+        match_ = pattern.fullmatch(val)
+        if match_ is None:
+            return None
+
+        return constructor(*map(int, match_.groups()))
+
+    match_ = _ISO_DATETIME_PATTERN.fullmatch(val)
+    if match_ is None:
+        return None
+
+    parts = match_.groupdict()
+    if parts['separator'] == ' ' and parts['date_separator'] == '':
+        # there is no "%Y%m%d %H:%M:%S" format
+        return None
+    if parts['offset_hours'] is not None and int(parts['offset_hours']) > 23:
+        # the offset is out of range, so the formats reject it
+        return None
+
+    fraction = parts['fraction'] or '0'
+
+    return datetime(
+        int(parts['year']),
+        int(parts['month']),
+        int(parts['day']),
+        int(parts['hour']),
+        int(parts['minute']),
+        int(parts['second']),
+        int(fraction.ljust(6, '0')),
+        tzinfo=SGT_TIMEZONE,
+    )
+
+def _parse_datetime_formats(val: str) -> datetime | date | time | None:
+    """Parse a datetime string with the allowed formats. If it matches more \
+    than one format, then the last format is used.
+
+    :param val: String to convert to a datetime.
+    :type val: str
+
+    :return: The value as a datetime, date or time, or None if it is not a \
+        recognised datetime string.
+    :rtype: datetime | date | time | None
+    """
     dt: datetime | date | time
 
     dt_datetime = None
@@ -112,15 +244,15 @@ def datetime_from_string(val: str) -> datetime | date | time:
             continue
 
     if dt_datetime is None:
-        raise ValueError('val is not a recognised datetime string')
+        return None
 
     dt_datetime_sgt = datetime_as_sgt(dt_datetime)
     dt_date_sgt = dt_datetime_sgt.date()
     dt_time_sgt = dt_datetime_sgt.time()
 
-    if match('%H:?%M', dt_format) is not None:
+    if re.match('%H:?%M', dt_format) is not None:
         dt = dt_time_sgt
-    elif fullmatch('%Y-?%m-?%d', dt_format) is not None:
+    elif re.fullmatch('%Y-?%m-?%d', dt_format) is not None:
         dt = dt_date_sgt
     else:
         dt = dt_datetime_sgt
@@ -213,6 +345,9 @@ def date_is_within_last_three_months(
     return result
 
 __all__ = [
+    'SGT_TIMEZONE',
+    'datetime_as_sgt',
     'datetime_from_string',
+    'datetime_or_none_from_string',
     'date_is_within_last_three_months',
 ]
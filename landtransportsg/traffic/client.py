@@ -14,6 +14,8 @@
 
 """Client for interacting with the Traffic API endpoints."""
 
+from collections.abc import Iterator
+
 from typeguard import typechecked
 
 from ..constants import (
@@ -66,9 +68,17 @@ class Client(LandTransportSg):
     """
 
     @typechecked
-    def carpark_availability(self) -> list[CarParkAvailabilityDict]:
+    def carpark_availability(
+        self,
+        deadline: float | None=None,
+    ) -> list[CarParkAvailabilityDict]:
         """Get number of available lots from HDB, LTA and URA carpark data.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Available carpark lots.
         :rtype: list[CarParkAvailabilityDict]
         """
@@ -78,14 +88,48 @@ class Client(LandTransportSg):
             CARPARK_AVAILABILITY_API_ENDPOINT,
             cache_duration=CACHE_ONE_MINUTE,
             sanitise_ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+            record_type=CarParkAvailabilityDict,
+            deadline=deadline,
         )
 
         return carpark_availability
 
     @typechecked
-    def estimated_travel_times(self) -> list[EstimatedTravelTimesDict]:
+    def iter_carpark_availability(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[CarParkAvailabilityDict]:
+        """Same as ``carpark_availability()``, but yield each carpark as soon as \
+        its page of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Available carpark lots.
+        :rtype: Iterator[CarParkAvailabilityDict]
+        """
+        yield from self.iter_records(
+            CARPARK_AVAILABILITY_API_ENDPOINT,
+            cache_duration=CACHE_ONE_MINUTE,
+            sanitise_ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+            record_type=CarParkAvailabilityDict,
+            deadline=deadline,
+        )
+
+    @typechecked
+    def estimated_travel_times(
+        self,
+        deadline: float | None=None,
+    ) -> list[EstimatedTravelTimesDict]:
         """Get estimated travel times of expressways (in segments).
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Expressway estimated travel times by segments.
         :rtype: list[EstimatedTravelTimesDict]
         """
@@ -94,15 +138,25 @@ class Client(LandTransportSg):
         estimated_travel_times = self.send_request(
             ESTIMATED_TRAVEL_TIMES_API_ENDPOINT,
             cache_duration=CACHE_FIVE_MINUTES,
+            record_type=EstimatedTravelTimesDict,
+            deadline=deadline,
         )
 
         return estimated_travel_times
 
     @typechecked
-    def faulty_traffic_lights(self) -> list[FaultyTrafficLightsDict]:
+    def faulty_traffic_lights(
+        self,
+        deadline: float | None=None,
+    ) -> list[FaultyTrafficLightsDict]:
         """Get alerts of traffic lights that are currently faulty, or \
         currently undergoing scheduled maintenance.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Traffic light alerts and their status.
         :rtype: list[FaultyTrafficLightsDict]
         """
@@ -112,14 +166,24 @@ class Client(LandTransportSg):
             FAULTY_TRAFFIC_LIGHTS_API_ENDPOINT,
             cache_duration=CACHE_TWO_MINUTES,
             sanitise_ignore_keys=FAULTY_TRAFFIC_LIGHTS_SANITISE_IGNORE_KEYS,
+            record_type=FaultyTrafficLightsDict,
+            deadline=deadline,
         )
 
         return faulty_traffic_lights
 
     @typechecked
-    def flood_alerts(self) -> list[FloodAlertsDict]:
+    def flood_alerts(
+        self,
+        deadline: float | None=None,
+    ) -> list[FloodAlertsDict]:
         """Get flood alert information across Singapore, provided by PUB.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Flood alerts.
         :rtype: list[FloodAlertsDict]
         """
@@ -129,14 +193,24 @@ class Client(LandTransportSg):
             FLOOD_ALERTS_API_ENDPOINT,
             cache_duration=CACHE_THREE_MINUTES,
             sanitise_ignore_keys=FLOOD_ALERTS_SANITISE_IGNORE_KEYS,
+            record_type=FloodAlertsDict,
+            deadline=deadline,
         )
 
         return flood_alerts
 
     @typechecked
-    def road_openings(self) -> list[RoadOpeningsDict]:
+    def road_openings(
+        self,
+        deadline: float | None=None,
+    ) -> list[RoadOpeningsDict]:
         """Get all planned road openings.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Road openings for road works.
         :rtype: list[RoadOpeningsDict]
         """
@@ -145,14 +219,24 @@ class Client(LandTransportSg):
         road_openings = self.send_request(
             ROAD_OPENINGS_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
+            record_type=RoadOpeningsDict,
+            deadline=deadline,
         )
 
         return road_openings
 
     @typechecked
-    def road_works(self) -> list[RoadWorksDict]:
+    def road_works(
+        self,
+        deadline: float | None=None,
+    ) -> list[RoadWorksDict]:
         """Get approved road works to be carried out/being carried out.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Road works to be carried out/being carried out.
         :rtype: list[RoadWorksDict]
         """
@@ -161,15 +245,25 @@ class Client(LandTransportSg):
         road_works = self.send_request(
             ROAD_WORKS_API_ENDPOINT,
             cache_duration=CACHE_ONE_DAY,
+            record_type=RoadWorksDict,
+            deadline=deadline,
         )
 
         return road_works
 
     @typechecked
-    def traffic_flow(self) -> Url:
+    def traffic_flow(
+        self,
+        deadline: float | None=None,
+    ) -> Url:
         """Get hourly average traffic flow, taken from a representative month \
         of every quarter during 0700-0900 hours.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Link to download the hourly average traffic flow. The link \
             will expire after 5 minutes.
         :rtype: Url
@@ -179,15 +273,24 @@ class Client(LandTransportSg):
         traffic_flow_link = self.send_download_request(
             TRAFFIC_FLOW_API_ENDPOINT,
             cache_duration=CACHE_FIVE_MINUTES,
+            deadline=deadline,
         )
 
         return traffic_flow_link
 
     @typechecked
-    def traffic_images(self) -> list[TrafficImagesDict]:
+    def traffic_images(
+        self,
+        deadline: float | None=None,
+    ) -> list[TrafficImagesDict]:
         """Get links to images of live traffic conditions along expressways \
         and Woodlands & Tuas Checkpoints.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Traffic images at expressways and checkpoints.
         :rtype: list[TrafficImagesDict]
         """
@@ -197,15 +300,25 @@ class Client(LandTransportSg):
             TRAFFIC_IMAGES_API_ENDPOINT,
             cache_duration=CACHE_FIVE_MINUTES,
             sanitise_ignore_keys=TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+            record_type=TrafficImagesDict,
+            deadline=deadline,
         )
 
         return traffic_images
 
     @typechecked
-    def traffic_incidents(self) -> list[TrafficIncidentsDict]:
+    def traffic_incidents(
+        self,
+        deadline: float | None=None,
+    ) -> list[TrafficIncidentsDict]:
         """Get incidents currently happening on the roads, such as Accidents, \
         Vehicle Breakdowns, Road Blocks, Traffic Diversions etc.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Traffic incidents currently happening.
         :rtype: list[TrafficIncidentsDict]
         """
@@ -214,15 +327,25 @@ class Client(LandTransportSg):
         traffic_incidents = self.send_request(
             TRAFFIC_INCIDENTS_API_ENDPOINT,
             cache_duration=CACHE_TWO_MINUTES,
+            record_type=TrafficIncidentsDict,
+            deadline=deadline,
         )
 
         return traffic_incidents
 
     @typechecked
-    def traffic_speed_bands(self) -> list[TrafficSpeedBandsDict]:
+    def traffic_speed_bands(
+        self,
+        deadline: float | None=None,
+    ) -> list[TrafficSpeedBandsDict]:
         """Get current traffic speeds on expressways and arterial roads, \
         expressed in speed bands.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Traffic speed bands on expressways and arterial roads.
         :rtype: list[TrafficSpeedBandsDict]
         """
@@ -232,16 +355,50 @@ class Client(LandTransportSg):
             TRAFFIC_SPEED_BANDS_API_ENDPOINT,
             cache_duration=CACHE_FIVE_MINUTES,
             sanitise_ignore_keys=TRAFFIC_SPEED_BANDS_SANITISE_IGNORE_KEYS,
+            record_type=TrafficSpeedBandsDict,
+            deadline=deadline,
         )
 
         return traffic_speed_bands
 
     @typechecked
-    def vms(self) -> list[VMSDict]:
+    def iter_traffic_speed_bands(
+        self,
+        deadline: float | None=None,
+    ) -> Iterator[TrafficSpeedBandsDict]:
+        """Same as ``traffic_speed_bands()``, but yield each stretch of road as \
+        soon as its page of records is received.
+
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
+        :return: Traffic speed bands on expressways and arterial roads.
+        :rtype: Iterator[TrafficSpeedBandsDict]
+        """
+        yield from self.iter_records(
+            TRAFFIC_SPEED_BANDS_API_ENDPOINT,
+            cache_duration=CACHE_FIVE_MINUTES,
+            sanitise_ignore_keys=TRAFFIC_SPEED_BANDS_SANITISE_IGNORE_KEYS,
+            record_type=TrafficSpeedBandsDict,
+            deadline=deadline,
+        )
+
+    @typechecked
+    def vms(
+        self,
+        deadline: float | None=None,
+    ) -> list[VMSDict]:
         """Get traffic advisories (via variable message services) concerning \
         current traffic conditions that are displayed on EMAS signboards \
         along expressways and arterial roads.
 
+        :param deadline: Number of seconds that the request may take, \
+            instead of the client's ``resilience.deadline``. Defaults to \
+            None.
+        :type deadline: float or None
+
         :return: Traffic advisories for expressways and arterial roads.
         :rtype: list[VMSDict]
         """
@@ -250,6 +407,8 @@ class Client(LandTransportSg):
         vms = self.send_request(
             VMS_API_ENDPOINT,
             cache_duration=CACHE_TWO_MINUTES,
+            record_type=VMSDict,
+            deadline=deadline,
         )
 
         return vms
@@ -14,11 +14,64 @@
 
 """LandTransportSg custom types."""
 
-from typing import TypeAlias
+from datetime import datetime
+from typing import Any, TypeAlias, TypedDict
 
 Url: TypeAlias = str
 """URL of link."""
 
+class CacheInfoDict(TypedDict):
+    """Type definition for the statistics of an in-memory cache"""
+
+    hits: int
+    """Number of lookups that found a value.
+
+    :example: 42
+    """
+    misses: int
+    """Number of lookups that did not find a value, or found an expired value.
+
+    :example: 7
+    """
+    size: int
+    """Number of values in the cache.
+
+    :example: 12
+    """
+    maxsize: int
+    """Maximum number of values in the cache.
+
+    :example: 256
+    """
+
+class SnapshotDict(TypedDict):
+    """Type definition for DataMall.snapshot()"""
+
+    captured_at: datetime
+    """Time in SGT when the snapshot was started.
+
+    :example: datetime(2026, 4, 9, 8, 30, 0)
+    """
+    data: dict[str, Any]
+    """Response of each endpoint that was fetched successfully, by name.
+
+    :example: {"taxi_availability": [...], "vms": [...]}
+    """
+    latencies: dict[str, float]
+    """Number of seconds that each endpoint took to fetch, by name.
+
+    :example: {"taxi_availability": 0.42, "vms": 0.08}
+    """
+    errors: dict[str, Exception]
+    """Exception that was raised while fetching each endpoint that failed, \
+        by name.
+
+    :example: {"flood_alerts": HTTPError(...)}
+    """
+
 __all__ = [
     'Url',
+
+    'CacheInfoDict',
+    'SnapshotDict',
 ]
@@ -16,6 +16,8 @@
 
 """Mock responses for the LandTransportSg module."""
 
+from json import dumps
+
 class APIResponseBadLink:
     status_code = 200
 
@@ -30,6 +32,33 @@ class APIResponseBadLink:
             ],
         }
 
+class APIResponseCached:
+    status_code = 200
+    from_cache = True
+    json_calls = 0
+
+    def __init__(self, response, cache_key='foobar', created_at=None):
+        self.response = response
+        self.cache_key = cache_key
+        self.created_at = created_at
+
+    def json(self):
+        APIResponseCached.json_calls += 1
+        return self.response.json()
+
+    def close(self):
+        pass
+
+class APIResponseEmptyValueList:
+    status_code = 200
+
+    @staticmethod
+    def json():
+        return {
+            'odata.metadata': 'https://datamall2.mytransport.sg/ltaodataservice/$metadata#ValueList',
+            'value': [],
+        }
+
 class APIResponseMissingLink:
     status_code = 200
 
@@ -91,6 +120,24 @@ class APIResponseMoreThan500RecordsPage3:
             "value": [mock_data.copy() for _ in range(499)],
         }
 
+class APIResponseStreamed:
+    status_code = 200
+
+    def __init__(self, response):
+        self.response = response
+        self.is_closed = False
+
+    def json(self):
+        return self.response.json()
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        body = dumps(self.json()).encode('utf-8')
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    def close(self):
+        self.is_closed = True
+
 class APIResponseValueList:
     status_code = 200
 
@@ -112,8 +159,11 @@ class APIResponseValueList:
 
 __all__ = [
     'APIResponseBadLink',
+    'APIResponseCached',
+    'APIResponseEmptyValueList',
     'APIResponseMissingLink',
     'APIResponseMoreThan500RecordsPage1',
     'APIResponseMoreThan500RecordsPage2',
+    'APIResponseStreamed',
     'APIResponseValueList',
 ]
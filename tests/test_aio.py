@@ -0,0 +1,520 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the asyncio clients are working properly."""
+
+import asyncio
+import threading
+from inspect import isasyncgenfunction, iscoroutinefunction
+from io import BytesIO
+from json import dumps
+from os import getenv
+from time import monotonic
+
+import httpx
+import pytest
+from dotenv import load_dotenv
+from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from requests_cache.backends import BaseCache, SQLiteCache
+from typeguard import check_type
+from urllib3 import HTTPResponse
+
+from landtransportsg import (
+    ActiveMobility,
+    AsyncActiveMobility,
+    AsyncElectricVehicle,
+    AsyncGeospatial,
+    AsyncPublicTransport,
+    AsyncTraffic,
+    ConnectionConfig,
+    ElectricVehicle,
+    Geospatial,
+    PublicTransport,
+    ResilienceConfig,
+    Traffic,
+)
+from landtransportsg.aio import AsyncLandTransportSg
+from landtransportsg.circuit_breaker import CircuitBreaker
+from landtransportsg.constants import ASYNC_MAX_CONCURRENCY
+from landtransportsg.exceptions import CircuitOpenError, DeadlineExceededError
+from landtransportsg.landtransportsg import LandTransportSg
+from landtransportsg.rate_limiter import RateLimiter
+from landtransportsg.public_transport.types import BusArrivalDict
+from landtransportsg.traffic.types import TrafficSpeedBandsDict
+
+from .mocks.api_response_landtransportsg import (
+    APIResponseMoreThan500RecordsPage1,
+    APIResponseMoreThan500RecordsPage2,
+    APIResponseMoreThan500RecordsPage3,
+    APIResponseValueList,
+)
+from .mocks.api_response_link import APIResponseLink
+from .mocks.api_response_public_transport import APIResponseBusArrival
+from .mocks.api_response_traffic import APIResponseTrafficSpeedBands
+
+URL = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+
+@pytest.fixture
+def api_key():
+    load_dotenv()
+    return getenv('ACCOUNT_KEY')
+
+@pytest.fixture
+def unlimited_connection():
+    return ConnectionConfig(rate_limiter=RateLimiter(10000, burst=10000))
+
+def mock_transport(mock_response, requests=None):
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, json=mock_response.json())
+
+    return httpx.MockTransport(handler)
+
+@pytest.mark.parametrize(
+    ('async_client_class', 'client_class'),
+    [
+        (AsyncActiveMobility, ActiveMobility),
+        (AsyncElectricVehicle, ElectricVehicle),
+        (AsyncGeospatial, Geospatial),
+        (AsyncPublicTransport, PublicTransport),
+        (AsyncTraffic, Traffic),
+    ],
+)
+def test_async_client_methods(async_client_class, client_class):
+    assert async_client_class.client_class is client_class
+
+    for name in dir(client_class):
+        if name.startswith('_') or not callable(getattr(client_class, name)):
+            continue
+        method = getattr(async_client_class, name)
+        if name == 'force_refresh':
+            assert method is AsyncLandTransportSg.force_refresh
+        elif name.startswith('iter_'):
+            assert isasyncgenfunction(method)
+        else:
+            assert iscoroutinefunction(method)
+
+def test_invalid_max_concurrency(api_key):
+    with pytest.raises(ValueError):
+        _ = AsyncLandTransportSg(api_key, max_concurrency=0)
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_max_concurrency'),
+    [
+        ({}, ASYNC_MAX_CONCURRENCY),
+        (
+            {'connection': ConnectionConfig(pool_maxsize=200)},
+            200,
+        ),
+        (
+            {
+                'connection': ConnectionConfig(pool_maxsize=200),
+                'max_concurrency': 2,
+            },
+            2,
+        ),
+    ],
+)
+def test_max_concurrency(api_key, kwargs, expected_max_concurrency):
+    client = AsyncLandTransportSg(api_key, **kwargs)
+    assert client.max_concurrency == expected_max_concurrency
+    asyncio.run(client.close())
+
+def test_async_bus_arrival(api_key):
+    requests = []
+
+    async def get_bus_arrivals():
+        async with AsyncPublicTransport(
+            api_key,
+            transport=mock_transport(APIResponseBusArrival, requests),
+        ) as client:
+            return await asyncio.gather(*[
+                client.bus_arrival(bus_stop_code='83139') for _ in range(10)
+            ])
+
+    bus_arrivals = asyncio.run(get_bus_arrivals())
+
+    assert len(bus_arrivals) == 10
+    for bus_arrival in bus_arrivals:
+        assert check_type(bus_arrival, BusArrivalDict) == bus_arrival
+    assert requests[0].url.params['BusStopCode'] == '83139'
+    assert requests[0].headers['AccountKey'] == api_key
+
+def test_async_bus_arrival_with_invalid_inputs(api_key):
+    async def get_bus_arrival():
+        async with AsyncPublicTransport(api_key) as client:
+            return await client.bus_arrival(bus_stop_code='8313')
+
+    with pytest.raises(ValueError):
+        asyncio.run(get_bus_arrival())
+
+def test_async_bus_arrivals_in_one_event_loop(api_key, unlimited_connection):
+    bus_stop_codes = [f'{code:05}' for code in range(300)]
+    in_flight = []
+    max_in_flight = []
+
+    async def handler(request):
+        in_flight.append(request)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.05)
+        in_flight.remove(request)
+        return httpx.Response(200, json=APIResponseBusArrival.json())
+
+    async def get_bus_arrivals():
+        async with AsyncPublicTransport(
+            api_key,
+            cache_backend='memory',
+            connection=unlimited_connection,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            threads = threading.active_count()
+            bus_arrivals = await client.bus_arrivals(
+                bus_stop_codes,
+                max_workers=len(bus_stop_codes),
+            )
+            assert threading.active_count() == threads
+            return bus_arrivals
+
+    bus_arrivals = asyncio.run(get_bus_arrivals())
+
+    assert list(bus_arrivals) == bus_stop_codes
+    for bus_arrival in bus_arrivals.values():
+        assert check_type(bus_arrival, BusArrivalDict) == bus_arrival
+    assert max(max_in_flight) == len(bus_stop_codes)
+
+def test_async_bus_arrivals_with_invalid_inputs(api_key):
+    requests = []
+
+    async def get_bus_arrivals():
+        async with AsyncPublicTransport(
+            api_key,
+            transport=mock_transport(APIResponseBusArrival, requests),
+        ) as client:
+            return await client.bus_arrivals(['83139', '8313'])
+
+    with pytest.raises(ValueError):
+        asyncio.run(get_bus_arrivals())
+    assert not requests
+
+def test_async_force_refresh(api_key):
+    requests = []
+
+    async def get_bus_arrivals():
+        async with AsyncPublicTransport(
+            api_key,
+            cache_backend='memory',
+            transport=mock_transport(APIResponseBusArrival, requests),
+        ) as client:
+            _ = await client.bus_arrival(bus_stop_code='83139')
+            async with client.force_refresh() as cache_durations:
+                _ = await asyncio.gather(*[
+                    client.bus_arrival(bus_stop_code='83139') for _ in range(2)
+                ])
+            _ = await client.bus_arrival(bus_stop_code='83139')
+            return cache_durations
+
+    cache_durations = asyncio.run(get_bus_arrivals())
+
+    assert len(requests) == 3
+    assert len(cache_durations) == 2
+
+def test_async_iter_traffic_speed_bands(api_key):
+    async def get_traffic_speed_bands():
+        async with AsyncTraffic(
+            api_key,
+            transport=mock_transport(APIResponseTrafficSpeedBands),
+        ) as client:
+            return [
+                record async for record in client.iter_traffic_speed_bands()
+            ]
+
+    records = asyncio.run(get_traffic_speed_bands())
+
+    assert len(records) > 0
+    for record in records:
+        assert check_type(record, TrafficSpeedBandsDict) == record
+
+def test_async_iter_records_with_more_than_500_records(api_key):
+    def handler(request):
+        skip = request.url.params.get('$skip', '0')
+        if skip == '0':
+            page = APIResponseMoreThan500RecordsPage1
+        elif skip == '500':
+            page = APIResponseMoreThan500RecordsPage2
+        else:
+            page = APIResponseMoreThan500RecordsPage3
+        return httpx.Response(200, json=page.json())
+
+    async def get_records():
+        async with AsyncLandTransportSg(
+            api_key,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return [
+                record async for record in client.iter_records(
+                    'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+                )
+            ]
+
+    records = asyncio.run(get_records())
+
+    assert len(records) == 500 + 500 + 499
+
+def test_async_cache_is_shared_with_blocking_client(api_key, monkeypatch):
+    cache_backend = BaseCache()
+    requests = []
+
+    def mock_send(self, request, **kwargs):
+        requests.append(request)
+        return self.build_response(request, HTTPResponse(
+            body=BytesIO(dumps(APIResponseValueList.json()).encode()),
+            headers={'Content-Type': 'application/json'},
+            status=200,
+            preload_content=False,
+        ))
+
+    monkeypatch.setattr(HTTPAdapter, 'send', mock_send)
+
+    client = LandTransportSg(api_key, cache_backend=cache_backend)
+    response_content = client.send_request(URL, cache_duration=60)
+
+    async def send_requests():
+        async with AsyncLandTransportSg(
+            api_key,
+            cache_backend=cache_backend,
+            transport=mock_transport(APIResponseValueList, requests),
+        ) as async_client:
+            return (
+                await async_client.send_request(URL, cache_duration=60),
+                await async_client.send_request(
+                    URL,
+                    params={'foo': 'bar'},
+                    cache_duration=60,
+                ),
+            )
+
+    cached_content, async_content = asyncio.run(send_requests())
+
+    # the async client reads the response that the blocking client cached
+    assert cached_content == response_content
+    assert len(requests) == 2
+
+    # and the blocking client reads the response that the async client cached
+    other_client = LandTransportSg(api_key, cache_backend=cache_backend)
+    assert other_client.send_request(
+        URL,
+        params={'foo': 'bar'},
+        cache_duration=60,
+    ) == async_content
+    assert len(requests) == 2
+
+def test_async_send_request_coalesces_identical_requests(api_key):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=APIResponseValueList.json())
+
+    async def send_requests():
+        async with AsyncLandTransportSg(
+            api_key,
+            cache_backend='memory',
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await asyncio.gather(*[
+                client.send_request(URL, cache_duration=60) for _ in range(5)
+            ])
+
+    results = asyncio.run(send_requests())
+
+    assert len(requests) == 1
+    assert all(r == APIResponseValueList.json()['value'] for r in results)
+    # every caller gets its own copy
+    assert len({id(r) for r in results}) == 5
+
+def test_async_send_request_with_coalesced_deadlines(api_key):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=APIResponseValueList.json())
+
+    async def send_requests():
+        async with AsyncLandTransportSg(
+            api_key,
+            cache_backend='memory',
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await asyncio.gather(
+                client.send_request(URL, cache_duration=60, deadline=0.1),
+                client.send_request(URL, cache_duration=60),
+                return_exceptions=True,
+            )
+
+    leader_result, waiter_result = asyncio.run(send_requests())
+
+    # the waiter has no deadline, so it does not share the leader's error
+    assert isinstance(leader_result, DeadlineExceededError)
+    assert waiter_result == APIResponseValueList.json()['value']
+    assert len(requests) == 2
+
+def test_async_send_download_request(api_key):
+    async def send_download_request():
+        async with AsyncLandTransportSg(
+            api_key,
+            transport=mock_transport(APIResponseLink),
+        ) as client:
+            return await client.send_download_request(URL)
+
+    assert asyncio.run(send_download_request()) \
+        == APIResponseLink.json()['value'][0]['Link']
+
+@pytest.mark.parametrize(
+    ('async_client_class', 'method_name', 'kwargs'),
+    [
+        (AsyncElectricVehicle, 'ev_charging_points_batch', {}),
+        (
+            AsyncGeospatial,
+            'geospatial_whole_island',
+            {'geospatial_layer_id': 'ArrowMarking'},
+        ),
+        (AsyncPublicTransport, 'passenger_volume_by_bus_stops', {}),
+        (AsyncTraffic, 'traffic_flow', {}),
+    ],
+)
+def test_async_download_link_endpoints(
+    api_key,
+    monkeypatch,
+    async_client_class,
+    method_name,
+    kwargs,
+):
+    requests = []
+
+    def mock_send(*args, **kwargs):
+        raise AssertionError('The blocking session sent a request.')
+
+    monkeypatch.setattr(CachedSession, 'send', mock_send)
+
+    async def get_download_link():
+        async with async_client_class(
+            api_key,
+            cache_backend='memory',
+            transport=mock_transport(APIResponseLink, requests),
+        ) as client:
+            return await getattr(client, method_name)(**kwargs)
+
+    assert asyncio.run(get_download_link()) \
+        == APIResponseLink.json()['value'][0]['Link']
+    assert len(requests) == 1
+
+def test_async_cache_backend_does_not_block_event_loop(api_key, tmp_path):
+    cache_backend = SQLiteCache(str(tmp_path / 'cache.sqlite'))
+    threads = []
+
+    for name in ('get_response', 'save_response'):
+        def call(*args, __func=getattr(cache_backend, name), **kwargs):
+            threads.append(threading.current_thread())
+            return __func(*args, **kwargs)
+
+        setattr(cache_backend, name, call)
+
+    async def send_requests():
+        async with AsyncLandTransportSg(
+            api_key,
+            cache_backend=cache_backend,
+            transport=mock_transport(APIResponseValueList),
+        ) as client:
+            return [
+                await client.send_request(URL, cache_duration=60)
+                for _ in range(2)
+            ]
+
+    first, second = asyncio.run(send_requests())
+
+    assert first == second == APIResponseValueList.json()['value']
+    assert len(threads) == 3
+    assert threading.main_thread() not in threads
+
+def test_async_send_request_retries(api_key):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=APIResponseValueList.json())
+
+    async def send_request():
+        async with AsyncLandTransportSg(
+            api_key,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.send_request(URL)
+
+    response_content = asyncio.run(send_request())
+
+    assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == 2
+
+def test_async_send_request_with_retry_after(api_key):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(429, headers={'Retry-After': '600'})
+
+    circuit_breaker = CircuitBreaker(failure_threshold=1)
+
+    async def send_requests():
+        async with AsyncLandTransportSg(
+            api_key,
+            resilience=ResilienceConfig(circuit_breaker=circuit_breaker),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            with pytest.raises(HTTPError):
+                _ = await client.send_request(URL)
+            with pytest.raises(CircuitOpenError) as e:
+                _ = await client.send_request(URL)
+            return e.value
+
+    error = asyncio.run(send_requests())
+
+    # the wait is too long to retry, and the circuit stays open for it
+    assert len(requests) == 1
+    assert error.retry_in > 300
+
+def test_async_send_request_with_deadline(api_key):
+    async def handler(request):
+        await asyncio.sleep(10)
+
+    async def send_request():
+        async with AsyncLandTransportSg(
+            api_key,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.send_request(URL, deadline=0.1)
+
+    start = monotonic()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(send_request())
+    assert monotonic() - start < 5
@@ -0,0 +1,303 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the cache module is working properly."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from requests import Request, Response
+from urllib3 import HTTPResponse
+
+from landtransportsg import cache
+from landtransportsg.cache import (
+    BoundedSQLiteCache,
+    MemoryCache,
+    ResponseMemo,
+    canonical_params,
+    copy_value,
+)
+
+VALUE = [
+    {
+        'BusStopCode': '01012',
+        'Latitude': 1.29684825487647,
+        'Services': ['10', '14'],
+        'Location': (1.2, 3.4),
+        'UpdatedAt': datetime(2024, 12, 1, 9, 57, 45),
+    },
+]
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {'value': 1000.0}
+    monkeypatch.setattr(cache, 'monotonic', lambda: now['value'])
+    return now
+
+def make_response(url, size=10):
+    response = Response()
+    response.status_code = 200
+    response.url = url
+    response._content = b'x' * size
+    response.raw = HTTPResponse(request_url=url)
+    response.request = Request('GET', url).prepare()
+    return response
+
+@pytest.fixture
+def bounded_cache(tmp_path):
+    return BoundedSQLiteCache(
+        str(tmp_path / 'cache.sqlite'),
+        max_entries=3,
+        maintenance_interval=1000,
+    )
+
+@pytest.mark.parametrize(
+    ('params', 'expected_params'),
+    [
+        (None, ()),
+        ({}, ()),
+        (
+            {'TrainLine': 'NEL', '$skip': 500},
+            (('$skip', 500), ('TrainLine', 'NEL')),
+        ),
+        ({'ID': ['a', 'b']}, (('ID', ('a', 'b')),)),
+    ],
+)
+def test_canonical_params(params, expected_params):
+    assert canonical_params(params) == expected_params
+    assert hash(canonical_params(params)) is not None
+
+def test_copy_value():
+    copied = copy_value(VALUE)
+
+    assert copied == VALUE
+    assert copied is not VALUE
+    assert copied[0] is not VALUE[0]
+    assert copied[0]['Services'] is not VALUE[0]['Services']
+    assert copied[0]['UpdatedAt'] is VALUE[0]['UpdatedAt']
+
+def test_memo():
+    memo = ResponseMemo()
+    memo.set('foo', VALUE)
+
+    value = memo.get('foo')
+    assert value == VALUE
+    assert len(memo) == 1
+    assert 'maxsize=128' in repr(memo)
+
+    # values are copied, so they can be modified freely
+    value[0]['BusStopCode'] = 'foobar'
+    assert memo.get('foo') == VALUE
+
+    memo.clear()
+    assert len(memo) == 0
+
+def test_memo_with_missing_key():
+    memo = ResponseMemo()
+
+    with pytest.raises(KeyError):
+        _ = memo.get('foo')
+
+def test_memo_eviction():
+    memo = ResponseMemo(maxsize=2)
+    memo.set('a', 1)
+    memo.set('b', 2)
+    _ = memo.get('a')
+    memo.set('c', 3)
+
+    assert len(memo) == 2
+    assert memo.get('a') == 1
+    assert memo.get('c') == 3
+    with pytest.raises(KeyError):
+        _ = memo.get('b')
+
+def test_invalid_memo_maxsize():
+    with pytest.raises(ValueError):
+        _ = ResponseMemo(maxsize=0)
+
+def test_memory_cache(clock):
+    memory_cache = MemoryCache()
+    memory_cache.set('foo', VALUE, ttl=60)
+
+    value = memory_cache.get('foo')
+    assert value == VALUE
+    assert value is not VALUE
+
+    clock['value'] += 59
+    assert memory_cache.get('foo') == VALUE
+
+    clock['value'] += 1
+    with pytest.raises(KeyError):
+        _ = memory_cache.get('foo')
+    with pytest.raises(KeyError):
+        _ = memory_cache.get('bar')
+
+    assert memory_cache.cache_info() == {
+        'hits': 2,
+        'misses': 2,
+        'size': 0,
+        'maxsize': 256,
+    }
+    assert 'hits=2' in repr(memory_cache)
+
+    memory_cache.set('foo', VALUE, ttl=60)
+    memory_cache.clear()
+    assert memory_cache.cache_info()['hits'] == 0
+    assert len(memory_cache) == 0
+
+def test_memory_cache_with_no_ttl(clock):
+    memory_cache = MemoryCache()
+    memory_cache.set('foo', VALUE, ttl=0)
+
+    assert len(memory_cache) == 0
+
+def test_memory_cache_eviction(clock):
+    memory_cache = MemoryCache(maxsize=2)
+    memory_cache.set('a', 1, ttl=60)
+    memory_cache.set('b', 2, ttl=60)
+    _ = memory_cache.get('a')
+    memory_cache.set('c', 3, ttl=60)
+
+    assert len(memory_cache) == 2
+    with pytest.raises(KeyError):
+        _ = memory_cache.get('b')
+
+def test_invalid_memory_cache_maxsize():
+    with pytest.raises(ValueError):
+        _ = MemoryCache(maxsize=0)
+
+def test_bounded_sqlite_cache_uses_wal(bounded_cache):
+    with bounded_cache.responses.connection() as con:
+        journal_mode = con.execute('PRAGMA journal_mode').fetchone()[0]
+
+    assert journal_mode == 'wal'
+
+def test_bounded_sqlite_cache_evicts_least_recently_used(bounded_cache):
+    for i in range(5):
+        bounded_cache.save_response(
+            make_response(f'https://example.com/{i}'),
+            cache_key=str(i),
+        )
+    _ = bounded_cache.get_response('0')
+
+    deleted = bounded_cache.maintain()
+
+    assert deleted == 2
+    assert sorted(bounded_cache.responses.keys()) == ['0', '3', '4']
+
+def test_bounded_sqlite_cache_deletes_expired(bounded_cache):
+    bounded_cache.save_response(
+        make_response('https://example.com/expired'),
+        cache_key='expired',
+        expires=datetime.utcnow() - timedelta(minutes=1),
+    )
+    bounded_cache.save_response(
+        make_response('https://example.com/fresh'),
+        cache_key='fresh',
+        expires=datetime.utcnow() + timedelta(minutes=1),
+    )
+
+    assert bounded_cache.maintain() == 1
+    assert list(bounded_cache.responses.keys()) == ['fresh']
+
+def test_bounded_sqlite_cache_keeps_expired(tmp_path):
+    bounded_cache = BoundedSQLiteCache(
+        str(tmp_path / 'cache.sqlite'),
+        keep_expired=3600,
+    )
+    bounded_cache.save_response(
+        make_response('https://example.com/expired'),
+        cache_key='expired',
+        expires=datetime.utcnow() - timedelta(minutes=1),
+    )
+
+    assert bounded_cache.maintain() == 0
+
+def test_bounded_sqlite_cache_max_bytes(tmp_path):
+    bounded_cache = BoundedSQLiteCache(
+        str(tmp_path / 'cache.sqlite'),
+        max_entries=None,
+        max_bytes=1,
+        maintenance_interval=1000,
+    )
+    for i in range(3):
+        bounded_cache.save_response(
+            make_response(f'https://example.com/{i}'),
+            cache_key=str(i),
+        )
+
+    assert bounded_cache.maintain() == 3
+    assert len(bounded_cache.responses) == 0
+
+def test_bounded_sqlite_cache_max_entries_and_max_bytes(tmp_path):
+    bounded_cache = BoundedSQLiteCache(
+        str(tmp_path / 'cache.sqlite'),
+        max_entries=4,
+        maintenance_interval=1000,
+    )
+    for i in range(6):
+        bounded_cache.save_response(
+            make_response(f'https://example.com/{i}'),
+            cache_key=str(i),
+        )
+    with bounded_cache.responses.connection() as con:
+        sizes = dict(con.execute(
+            'SELECT key, LENGTH(value) '
+            f'FROM {bounded_cache.responses.table_name}',
+        ).fetchall())
+    # room for the 3 most recently used responses
+    bounded_cache.max_bytes = sizes['3'] + sizes['4'] + sizes['5']
+
+    assert bounded_cache.maintain() == 3
+    assert sorted(bounded_cache.responses.keys()) == ['3', '4', '5']
+
+def test_bounded_sqlite_cache_maintains_periodically(tmp_path):
+    bounded_cache = BoundedSQLiteCache(
+        str(tmp_path / 'cache.sqlite'),
+        max_entries=1,
+        maintenance_interval=2,
+    )
+    for i in range(4):
+        bounded_cache.save_response(
+            make_response(f'https://example.com/{i}'),
+            cache_key=str(i),
+        )
+
+    # maintained after the 2nd and 4th saves
+    assert list(bounded_cache.responses.keys()) == ['3']
+
+def test_bounded_sqlite_cache_clear(bounded_cache):
+    bounded_cache.save_response(
+        make_response('https://example.com/0'),
+        cache_key='0',
+    )
+    bounded_cache.clear()
+
+    assert len(bounded_cache.responses) == 0
+    assert bounded_cache.maintain() == 0
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'max_entries': 0},
+        {'max_bytes': 0},
+        {'keep_expired': -1},
+        {'maintenance_interval': 0},
+    ],
+)
+def test_invalid_bounded_sqlite_cache_arguments(tmp_path, kwargs):
+    with pytest.raises(ValueError):
+        _ = BoundedSQLiteCache(str(tmp_path / 'cache.sqlite'), **kwargs)
@@ -0,0 +1,151 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the CacheWarmer class is working properly."""
+
+from math import inf
+from time import sleep
+
+import pytest
+from requests_cache import CachedSession
+
+from landtransportsg import cache_warmer
+from landtransportsg.cache_warmer import CacheWarmer
+from landtransportsg.constants import (
+    CACHE_ONE_DAY,
+    CACHE_ONE_MINUTE,
+    CACHE_TWO_MINUTES,
+)
+from landtransportsg import PublicTransport
+
+from .mocks.api_response_fault import APIResponseFault
+from .mocks.api_response_public_transport import (
+    APIResponseBusStops,
+    APIResponseTaxiAvailability,
+)
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {'value': 1000.0}
+    monkeypatch.setattr(cache_warmer, 'monotonic', lambda: now['value'])
+    return now
+
+@pytest.fixture
+def requests(monkeypatch):
+    sent = []
+
+    def mock_requests_get(*args, **kwargs):
+        sent.append(kwargs)
+        if 'BusStops' in args[1]:
+            return APIResponseBusStops()
+        return APIResponseTaxiAvailability()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    return sent
+
+@pytest.fixture
+def client():
+    return PublicTransport('foobar')
+
+def test_run_pending(clock, requests, client):
+    warmer = CacheWarmer(lead_time=5)
+    taxi_job = warmer.add(client.taxi_availability)
+    bus_job = warmer.add(client.bus_stops)
+
+    assert warmer.run_pending() == 2
+    assert len(requests) == 2
+    assert all(r['force_refresh'] is True for r in requests)
+
+    assert taxi_job.cache_duration == CACHE_ONE_MINUTE
+    assert taxi_job.next_refresh == 1000.0 + CACHE_ONE_MINUTE - 5
+    assert taxi_job.refreshes == 1
+    assert bus_job.cache_duration == CACHE_ONE_DAY
+    assert bus_job.next_refresh == 1000.0 + CACHE_ONE_DAY - 5
+    assert bus_job.last_error is None
+    assert 'refreshes=1' in repr(bus_job)
+
+    # nothing is due yet
+    assert warmer.run_pending() == 0
+
+    clock['value'] += CACHE_ONE_MINUTE - 5
+    assert warmer.run_pending() == 1
+    assert taxi_job.refreshes == 2
+    assert bus_job.refreshes == 1
+
+def test_run_pending_with_short_cache_duration(clock, requests, client):
+    warmer = CacheWarmer(lead_time=CACHE_TWO_MINUTES)
+    job = warmer.add(client.taxi_availability)
+
+    _ = warmer.run_pending()
+    assert job.next_refresh == 1000.0 + CACHE_ONE_MINUTE / 2
+
+def test_run_pending_with_error(clock, monkeypatch, client):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseFault()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    warmer = CacheWarmer(retry_interval=30)
+    job = warmer.add(client.taxi_availability)
+
+    assert warmer.run_pending() == 0
+    assert job.last_error is not None
+    assert job.next_refresh == 1000.0 + 30
+
+def test_run_pending_with_uncached_method(clock, requests, client):
+    warmer = CacheWarmer()
+    job = warmer.add(client.send_request, 'https://example.com')
+
+    assert warmer.run_pending() == 0
+    assert isinstance(job.last_error, ValueError)
+    assert job.next_refresh == inf
+
+def test_start_and_stop(requests, client):
+    warmer = CacheWarmer()
+
+    with warmer:
+        assert warmer.is_running is True
+        with pytest.raises(RuntimeError):
+            warmer.start()
+
+        job = warmer.add(client.taxi_availability)
+        for _ in range(50):
+            if job.refreshes > 0:
+                break
+            sleep(0.1)
+
+    assert warmer.is_running is False
+    assert job.refreshes == 1
+    assert 'is_running=False' in repr(warmer)
+
+def test_add_with_invalid_method():
+    warmer = CacheWarmer()
+
+    with pytest.raises(ValueError):
+        _ = warmer.add(print, 'foobar')
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'lead_time': -1},
+        {'retry_interval': 0},
+        {'max_workers': 0},
+    ],
+)
+def test_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        _ = CacheWarmer(**kwargs)
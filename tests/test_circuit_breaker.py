@@ -0,0 +1,175 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the circuit breaker is working properly."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from landtransportsg import circuit_breaker
+from landtransportsg.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    endpoint_of,
+    parse_retry_after,
+)
+from landtransportsg.exceptions import CircuitOpenError
+
+URL = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+
+class MockResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {'value': 1000.0}
+    monkeypatch.setattr(circuit_breaker, 'monotonic', lambda: now['value'])
+    return now
+
+def test_circuit_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    assert 'failure_threshold=3' in repr(breaker)
+
+    for _ in range(2):
+        breaker.before_request(URL)
+        breaker.record_failure(URL)
+    assert breaker.state(URL) == CIRCUIT_CLOSED
+
+    breaker.before_request(f'{URL}?$skip=500')
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CIRCUIT_OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(URL)
+    assert excinfo.value.endpoint == URL
+    assert excinfo.value.retry_in == 30
+
+    # other endpoints are not affected
+    breaker.before_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+    )
+
+    clock['value'] += 30
+    assert breaker.state(URL) == CIRCUIT_HALF_OPEN
+
+    breaker.before_request(URL)
+    # only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+    breaker.record_success(URL)
+    assert breaker.state(URL) == CIRCUIT_CLOSED
+    breaker.before_request(URL)
+
+def test_circuit_breaker_with_failed_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure(URL)
+
+    clock['value'] += 10
+    breaker.before_request(URL)
+    breaker.record_failure(URL)
+    assert breaker.state(URL) == CIRCUIT_OPEN
+
+    clock['value'] += 5
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(URL)
+
+def test_circuit_breaker_success_resets_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+
+    breaker.record_failure(URL)
+    breaker.record_success(URL)
+    breaker.record_failure(URL)
+
+    assert breaker.state(URL) == CIRCUIT_CLOSED
+
+@pytest.mark.parametrize(
+    ('status_code', 'headers', 'expected_state', 'expected_retry_in'),
+    [
+        (200, None, CIRCUIT_CLOSED, None),
+        (404, None, CIRCUIT_CLOSED, None),
+        (503, None, CIRCUIT_OPEN, 30),
+        (429, {'Retry-After': '120'}, CIRCUIT_OPEN, 120),
+        (429, {'Retry-After': '5'}, CIRCUIT_OPEN, 30),
+    ],
+)
+def test_circuit_breaker_record_response(
+    clock,
+    status_code,
+    headers,
+    expected_state,
+    expected_retry_in,
+):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    breaker.record_response(URL, MockResponse(status_code, headers=headers))
+
+    assert breaker.state(URL) == expected_state
+    if expected_retry_in is not None:
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.before_request(URL)
+        assert excinfo.value.retry_in == expected_retry_in
+
+def test_circuit_breaker_with_retry_after(clock):
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30)
+
+    # the server asked to wait, so the circuit opens before the threshold
+    breaker.record_failure(URL, retry_after=60)
+    assert breaker.state(URL) == CIRCUIT_OPEN
+
+    clock['value'] += 59
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(URL)
+    assert excinfo.value.retry_in == 1
+
+    clock['value'] += 1
+    assert breaker.state(URL) == CIRCUIT_HALF_OPEN
+
+def test_circuit_breaker_reset(clock):
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(URL)
+    breaker.reset()
+
+    assert breaker.state(URL) == CIRCUIT_CLOSED
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'failure_threshold': 0},
+        {'recovery_timeout': 0},
+        {'half_open_max_calls': 0},
+    ],
+)
+def test_invalid_circuit_breaker(kwargs):
+    with pytest.raises(ValueError):
+        _ = CircuitBreaker(**kwargs)
+
+def test_endpoint_of():
+    assert endpoint_of(f'{URL}?$skip=500') == URL
+    assert endpoint_of(URL) == URL
+
+def test_parse_retry_after():
+    retry_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('foobar') is None
+    assert parse_retry_after('12') == 12
+    assert 50 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
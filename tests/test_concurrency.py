@@ -0,0 +1,281 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the concurrency module is working properly."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+
+import pytest
+
+from landtransportsg.concurrency import (
+    AsyncSingleFlight,
+    SingleFlight,
+    map_concurrently,
+    map_concurrently_async,
+)
+from landtransportsg.deadline import Deadline, current_deadline
+from landtransportsg.exceptions import PaginationError
+from landtransportsg.pagination import PaginationCursor
+
+THREADS = 8
+
+def test_single_flight():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        started.set()
+        assert release.wait(timeout=5)
+        return [{'value': value}]
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        leader = executor.submit(single_flight.do, 'foo', func, 42)
+        assert started.wait(timeout=5)
+        assert len(single_flight) == 1
+        assert 'in_flight=1' in repr(single_flight)
+
+        waiters = [
+            executor.submit(single_flight.do, 'foo', func, 42) \
+                for _ in range(THREADS - 1)
+        ]
+        # give the waiters time to join the call that is in flight
+        sleep(0.2)
+        release.set()
+        results = [leader.result()] + [w.result() for w in waiters]
+
+    assert calls == [42]
+    assert all(r == [{'value': 42}] for r in results)
+    # every caller gets its own copy
+    assert len({id(r) for r in results}) == THREADS
+    assert len(single_flight) == 0
+
+    assert single_flight.do('foo', func, 43) == [{'value': 43}]
+    assert calls == [42, 43]
+
+    # a caller that no one waited for gets the result itself
+    result = [{'value': 43}]
+    assert single_flight.do('foo', lambda: result) is result
+
+def test_single_flight_with_exception():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+
+    def func():
+        started.set()
+        assert release.wait(timeout=5)
+        raise ValueError('foobar')
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, 'foo', func)
+        assert started.wait(timeout=5)
+        waiter = executor.submit(single_flight.do, 'foo', func)
+        sleep(0.2)
+        release.set()
+
+        leader_error = leader.exception()
+        waiter_error = waiter.exception()
+
+    # every caller raises its own exception
+    assert isinstance(leader_error, ValueError)
+    assert isinstance(waiter_error, ValueError)
+    assert waiter_error is not leader_error
+    assert waiter_error.args == ('foobar',)
+    assert waiter_error.__traceback__ is not leader_error.__traceback__
+    assert len(single_flight) == 0
+
+def test_single_flight_with_api_error():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+    cursor = PaginationCursor('https://datamall2.mytransport.sg/foobar')
+
+    def func():
+        started.set()
+        assert release.wait(timeout=5)
+        raise PaginationError('foobar', cursor=cursor, data=[1])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, 'foo', func)
+        assert started.wait(timeout=5)
+        waiter = executor.submit(single_flight.do, 'foo', func)
+        sleep(0.2)
+        release.set()
+
+        leader_error = leader.exception()
+        waiter_error = waiter.exception()
+
+    # the exception is copied without calling its constructor again
+    assert type(waiter_error) is PaginationError
+    assert waiter_error is not leader_error
+    assert waiter_error.message == 'foobar'
+    assert waiter_error.cursor is cursor
+    assert waiter_error.data == [1]
+
+def test_single_flight_with_wait_timeout():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+
+    def func():
+        started.set()
+        assert release.wait(timeout=5)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, 'foo', func)
+        assert started.wait(timeout=5)
+
+        with pytest.raises(TimeoutError):
+            _ = single_flight.do('foo', func, wait_timeout=0.05)
+
+        release.set()
+        assert leader.result() == 42
+
+def test_async_single_flight():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def func(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return [{'value': value}]
+
+    async def do():
+        callers = [single_flight.do('foo', func, 42) for _ in range(THREADS)]
+        results = await asyncio.gather(*callers)
+        assert len(single_flight) == 0
+        return results
+
+    results = asyncio.run(do())
+
+    assert calls == [42]
+    assert all(r == [{'value': 42}] for r in results)
+    # every caller gets its own copy
+    assert len({id(r) for r in results}) == THREADS
+    assert 'in_flight=0' in repr(single_flight)
+
+def test_async_single_flight_with_exception():
+    single_flight = AsyncSingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.05)
+        raise ValueError('foobar')
+
+    async def do():
+        return await asyncio.gather(
+            single_flight.do('foo', func),
+            single_flight.do('foo', func),
+            return_exceptions=True,
+        )
+
+    leader_error, waiter_error = asyncio.run(do())
+
+    # every caller raises its own exception
+    assert isinstance(leader_error, ValueError)
+    assert isinstance(waiter_error, ValueError)
+    assert waiter_error is not leader_error
+    assert waiter_error.args == ('foobar',)
+
+def test_async_single_flight_with_wait_timeout():
+    single_flight = AsyncSingleFlight()
+
+    async def func():
+        await asyncio.sleep(0.2)
+        return 42
+
+    async def do():
+        leader = asyncio.ensure_future(single_flight.do('foo', func))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            _ = await single_flight.do('foo', func, wait_timeout=0.05)
+        return await leader
+
+    assert asyncio.run(do()) == 42
+
+def test_map_concurrently():
+    calls = []
+
+    def func(value):
+        calls.append(value)
+        if value == 3:
+            raise ValueError('foobar')
+        sleep(0.01)
+        return value * 2
+
+    results = map_concurrently(func, [1, 2, 3, 2, 4], max_workers=THREADS)
+
+    assert list(results) == [1, 2, 3, 4]
+    assert results[1] == 2
+    assert results[4] == 8
+    assert isinstance(results[3], ValueError)
+    assert sorted(calls) == [1, 2, 3, 4]
+
+    assert map_concurrently(func, [], max_workers=THREADS) == {}
+
+def test_map_concurrently_with_deadline():
+    with Deadline(60) as deadline:
+        results = map_concurrently(
+            lambda _: current_deadline(),
+            ['foo', 'bar'],
+            max_workers=2,
+        )
+
+    assert results == {'foo': deadline, 'bar': deadline}
+
+def test_map_concurrently_with_invalid_max_workers():
+    with pytest.raises(ValueError):
+        _ = map_concurrently(str, ['foo'], max_workers=0)
+
+def test_map_concurrently_async():
+    in_flight = []
+    max_in_flight = []
+
+    async def func(value):
+        in_flight.append(value)
+        max_in_flight.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(value)
+        if value == 3:
+            raise ValueError('foobar')
+        return value * 2
+
+    results = asyncio.run(
+        map_concurrently_async(func, [1, 2, 3, 2, 4], max_workers=2),
+    )
+
+    assert list(results) == [1, 2, 3, 4]
+    assert results[1] == 2
+    assert results[4] == 8
+    assert isinstance(results[3], ValueError)
+    assert max(max_in_flight) == 2
+
+    assert asyncio.run(
+        map_concurrently_async(func, [], max_workers=THREADS),
+    ) == {}
+
+def test_map_concurrently_async_with_invalid_max_workers():
+    async def func(value):
+        return value
+
+    with pytest.raises(ValueError):
+        _ = asyncio.run(map_concurrently_async(func, ['foo'], max_workers=0))
@@ -0,0 +1,95 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the config module is working properly."""
+
+import pytest
+from typeguard import TypeCheckError
+
+from landtransportsg.config import (
+    CacheConfig,
+    ConnectionConfig,
+    ResilienceConfig,
+)
+from landtransportsg.constants import REQUEST_TIMEOUT
+from landtransportsg.rate_limiter import DEFAULT_RATE_LIMITER, RateLimiter
+
+def test_connection_config():
+    config = ConnectionConfig()
+    assert config.timeout == REQUEST_TIMEOUT
+    assert config.rate_limiter is DEFAULT_RATE_LIMITER
+
+    limiter = RateLimiter(5)
+    assert ConnectionConfig(rate_limiter=limiter).rate_limiter is limiter
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'pool_connections': 0},
+        {'pool_maxsize': 0},
+    ],
+)
+def test_invalid_connection_config(kwargs):
+    with pytest.raises(ValueError):
+        _ = ConnectionConfig(**kwargs)
+
+@pytest.mark.parametrize(
+    ('stale_while_revalidate', 'expected_max_staleness'),
+    [
+        (0, 0),
+        (60, 60),
+        ({'https://datamall2.mytransport.sg/ltaodataservice/BusRoutes': 9}, 9),
+        ({'https://datamall2.mytransport.sg/ltaodataservice/BusStops': 9}, 0),
+    ],
+)
+def test_cache_config_max_staleness(
+    stale_while_revalidate,
+    expected_max_staleness,
+):
+    config = CacheConfig(stale_while_revalidate=stale_while_revalidate)
+    assert config.max_staleness(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusRoutes',
+    ) == expected_max_staleness
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'memo_size': -1},
+        {'memory_cache_size': -1},
+        {'stale_while_revalidate': -1},
+        {
+            'stale_while_revalidate': {
+                'https://datamall2.mytransport.sg/ltaodataservice/BusRoutes': \
+                    -1,
+            },
+        },
+    ],
+)
+def test_invalid_cache_config(kwargs):
+    with pytest.raises(ValueError):
+        _ = CacheConfig(**kwargs)
+
+@pytest.mark.parametrize(
+    'deadline',
+    [0, -1.0],
+)
+def test_invalid_resilience_config(deadline):
+    with pytest.raises(ValueError):
+        _ = ResilienceConfig(deadline=deadline)
+
+def test_config_with_bad_arguments():
+    with pytest.raises(TypeCheckError):
+        _ = ConnectionConfig(timeout='foobar')
@@ -0,0 +1,166 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the DataMall class is working properly."""
+
+from datetime import datetime
+from os import getenv
+
+import pytest
+from dotenv import load_dotenv
+from requests import HTTPError
+from requests_cache import CachedSession
+from typeguard import check_type
+
+from landtransportsg import (
+    ActiveMobility,
+    ConnectionConfig,
+    DataMall,
+    ElectricVehicle,
+    Geospatial,
+    PublicTransport,
+    Traffic,
+)
+from landtransportsg.constants import USER_AGENT
+from landtransportsg.rate_limiter import RateLimiter
+from landtransportsg.constants import SNAPSHOT_ENDPOINTS
+from landtransportsg.public_transport.types import TaxiAvailabilityDict
+from landtransportsg.traffic.types import VMSDict
+from landtransportsg.types import SnapshotDict
+
+from .mocks.api_response_public_transport import APIResponseTaxiAvailability
+from .mocks.api_response_traffic import APIResponseVMS
+
+@pytest.fixture
+def datamall():
+    load_dotenv()
+    api_key = getenv('ACCOUNT_KEY')
+    return DataMall(api_key)
+
+def test_repr(datamall):
+    assert USER_AGENT in repr(datamall)
+
+@pytest.mark.parametrize(
+    ('attribute', 'client_class'),
+    [
+        ('active_mobility', ActiveMobility),
+        ('electric_vehicle', ElectricVehicle),
+        ('geospatial', Geospatial),
+        ('public_transport', PublicTransport),
+        ('traffic', Traffic),
+    ],
+)
+def test_clients_share_session(datamall, attribute, client_class):
+    client = getattr(datamall, attribute)
+
+    assert isinstance(client, client_class)
+    assert client.session is datamall.session
+    assert client.rate_limiter is datamall.public_transport.rate_limiter
+    assert client.session.headers['AccountKey'] == \
+        datamall.session.headers['AccountKey']
+
+def test_clients_share_rate_limiter():
+    limiter = RateLimiter(5)
+
+    datamall = DataMall(
+        'foobar',
+        connection=ConnectionConfig(rate_limiter=limiter),
+    )
+
+    assert datamall.traffic.rate_limiter is limiter
+
+def test_client_with_session():
+    session = CachedSession(backend='memory')
+
+    client = Traffic('foobar', session=session)
+
+    assert client.session is session
+    assert session.headers['AccountKey'] == 'foobar'
+    assert session.headers['User-Agent'] == USER_AGENT
+
+def test_datamall_request(datamall, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseVMS()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    with datamall:
+        vms = datamall.traffic.vms()
+
+    assert check_type(vms, list[VMSDict]) == vms
+
+def test_snapshot(datamall, monkeypatch):
+    def mock_requests_get(session, url, *args, **kwargs):
+        if url.endswith('/Taxi-Availability'):
+            return APIResponseTaxiAvailability()
+        if url.endswith('/VMS'):
+            return APIResponseVMS()
+        raise HTTPError('pytest')
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    snapshot = datamall.snapshot(
+        ['taxi_availability', 'vms', 'flood_alerts'],
+    )
+
+    assert check_type(snapshot, SnapshotDict) == snapshot
+    assert isinstance(snapshot['captured_at'], datetime)
+    assert snapshot['captured_at'].tzinfo is not None
+
+    assert list(snapshot['data']) == ['taxi_availability', 'vms']
+    assert check_type(
+        snapshot['data']['taxi_availability'],
+        list[TaxiAvailabilityDict],
+    ) == snapshot['data']['taxi_availability']
+    assert check_type(
+        snapshot['data']['vms'],
+        list[VMSDict],
+    ) == snapshot['data']['vms']
+
+    assert list(snapshot['errors']) == ['flood_alerts']
+    assert isinstance(snapshot['errors']['flood_alerts'], HTTPError)
+
+    assert list(snapshot['latencies']) == [
+        'taxi_availability',
+        'vms',
+        'flood_alerts',
+    ]
+    for latency in snapshot['latencies'].values():
+        assert latency >= 0
+
+def test_snapshot_default_endpoints(datamall, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        raise HTTPError('pytest')
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    snapshot = datamall.snapshot()
+
+    assert list(snapshot['errors']) == list(SNAPSHOT_ENDPOINTS)
+
+@pytest.mark.parametrize(
+    ('endpoints', 'max_workers'),
+    [
+        (['bus_arrival'], 8), # needs arguments
+        (['iter_bus_stops'], 8), # not a list of records
+        (['send_request'], 8), # not an endpoint
+        (['foobar'], 8), # not a method
+        (['vms'], 0),
+    ],
+)
+def test_snapshot_with_invalid_inputs(datamall, endpoints, max_workers):
+    with pytest.raises(ValueError):
+        _ = datamall.snapshot(endpoints, max_workers=max_workers)
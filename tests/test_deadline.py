@@ -0,0 +1,121 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the deadline module is working properly."""
+
+from time import sleep
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import RequestHistory
+
+from landtransportsg.deadline import (
+    Deadline,
+    DeadlineRetry,
+    DeadlineTimeout,
+    current_deadline,
+    current_deadlines,
+)
+
+def test_deadline():
+    deadline = Deadline(60)
+
+    assert 59 < deadline.remaining <= 60
+    assert not deadline.is_expired
+    assert 'seconds=60' in repr(deadline)
+
+def test_expired_deadline():
+    deadline = Deadline(0.01)
+    sleep(0.02)
+
+    assert deadline.remaining == 0
+    assert deadline.is_expired
+
+def test_earliest_deadline():
+    later = Deadline(60)
+    earlier = Deadline(30)
+
+    assert Deadline.earliest(later, None, earlier) is earlier
+    assert Deadline.earliest(None) is None
+
+def test_current_deadline():
+    later = Deadline(60)
+    earlier = Deadline(30)
+
+    assert current_deadline() is None
+
+    with later:
+        with earlier:
+            assert current_deadlines() == [later, earlier]
+            assert current_deadline() is earlier
+        assert current_deadline() is later
+
+    assert current_deadlines() == []
+
+@pytest.mark.parametrize(
+    ('timeout', 'expected_connect_timeout'),
+    [(None, None), (5.0, 5.0), ((3.05, 27.0), 3.05)],
+)
+def test_deadline_timeout(timeout, expected_connect_timeout):
+    deadline = Deadline(0.5)
+    deadline_timeout = DeadlineTimeout(deadline, timeout)
+
+    assert deadline_timeout._connect == expected_connect_timeout
+    assert deadline_timeout.total <= 0.5
+
+    sleep(0.1)
+    clone = deadline_timeout.clone()
+
+    assert isinstance(clone, DeadlineTimeout)
+    assert clone._connect == expected_connect_timeout
+    assert clone.total < deadline_timeout.total
+
+def test_deadline_retry():
+    retry = DeadlineRetry(total=5, backoff_factor=10)
+    # two errors so far, i.e. the next retry waits for up to 20 seconds
+    error = RequestHistory('GET', '/', None, 503, None)
+    retry = retry.new(total=3, history=(error, error))
+
+    assert not retry.is_exhausted()
+    assert 0 <= retry.get_backoff_time() <= 20
+
+    with Deadline(5):
+        assert not retry.is_exhausted()
+        assert retry.get_backoff_time() <= 5
+
+    deadline = Deadline(0.01)
+    sleep(0.02)
+    with deadline:
+        assert retry.is_exhausted()
+        assert retry.get_backoff_time() == 0
+
+def test_deadline_retry_after():
+    retry = DeadlineRetry(total=5, backoff_max=10)
+    response = HTTPResponse(status=429, headers={'Retry-After': '3'})
+
+    assert retry.get_retry_after_max() == 10
+    _ = retry.increment('GET', '/', response=response)
+
+    # the server asks to wait until after the deadline
+    with Deadline(1):
+        assert retry.get_retry_after_max() <= 1
+        with pytest.raises(MaxRetryError):
+            _ = retry.increment('GET', '/', response=response)
+
+def test_invalid_deadline():
+    with pytest.raises(ValueError):
+        _ = Deadline(0)
@@ -0,0 +1,291 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the decoders module is working properly."""
+
+from datetime import date, datetime, time
+from typing import NotRequired, TypedDict
+
+import pytest
+from typeguard import check_type
+
+from landtransportsg import decoders
+from landtransportsg.decoders import compile_decoder, compile_page_decoder
+from landtransportsg.electric_vehicle.constants import (
+    EV_CHARGING_POINTS_SANITISE_IGNORE_KEYS,
+)
+from landtransportsg.electric_vehicle.types import EVChargingPointsDict
+from landtransportsg.public_transport.types import (
+    BusArrivalDict,
+    BusRoutesDict,
+)
+from landtransportsg.sanitise import LIST_ITEMS
+from landtransportsg.timezone import datetime_as_sgt
+from landtransportsg.traffic.types import FloodAlertsDict
+
+from .mocks.api_response_electric_vehicle import APIResponseEVChargingPoints
+from .mocks.api_response_public_transport import (
+    APIResponseBusArrival,
+    APIResponseBusRoutes,
+)
+from .mocks.api_response_traffic import APIResponseFloodAlerts
+
+class _ItemDict(TypedDict):
+    Code: str
+    Count: int
+
+class _RecordDict(TypedDict):
+    Code: str
+    Count: int
+    Ratio: float
+    Note: str | None
+    Day: date
+    Start: time
+    Updated: datetime
+    Circle: tuple[float, float, float]
+    Items: list[_ItemDict]
+    Extra: NotRequired[int]
+
+def test_compile_decoder():
+    decode = compile_decoder(_RecordDict)
+
+    record = decode({
+        'Code': '01012',
+        'Count': '42',
+        'Ratio': '0.5',
+        'Note': '',
+        'Day': '2026-04-09',
+        'Start': '0530',
+        'Updated': '2026-04-09T08:30:00+08:00',
+        'Circle': '1.35479,103.88611,0.05',
+        'Items': [{'Code': '15', 'Count': 3}],
+        'Extra': '7',
+        'Unknown': '123',
+    })
+
+    assert record == {
+        'Code': '01012',
+        'Count': 42,
+        'Ratio': 0.5,
+        'Note': None,
+        'Day': date(2026, 4, 9),
+        'Start': time(5, 30, tzinfo=record['Start'].tzinfo),
+        'Updated': datetime_as_sgt(datetime(2026, 4, 9, 8, 30)),
+        'Circle': (1.35479, 103.88611, 0.05),
+        'Items': [{'Code': '15', 'Count': 3}],
+        'Extra': 7,
+        'Unknown': '123',
+    }
+
+@pytest.mark.parametrize(
+    ('field', 'value'),
+    [
+        ('Count', 'foobar'),
+        ('Ratio', 'foobar'),
+        ('Updated', 'foobar'),
+        ('Circle', '1.35479,103.88611'),
+        ('Circle', '1.35479,foo,bar'),
+        ('Items', 'foobar'),
+    ],
+)
+def test_compile_decoder_with_unexpected_values(field, value):
+    decode = compile_decoder(_RecordDict)
+
+    assert decode({field: value}) == {field: value}
+    assert decode('foobar') == 'foobar'
+
+@pytest.mark.parametrize(
+    'field',
+    ['Count', 'Ratio', 'Note', 'Updated', 'Circle'],
+)
+def test_compile_decoder_with_blank_value(field):
+    decode = compile_decoder(_RecordDict)
+
+    assert decode({field: ''}) == {field: None}
+    assert decode({'Code': ''}) == {'Code': ''}
+
+@pytest.mark.parametrize(
+    ('value', 'expected_result'),
+    [
+        ('22', 22),
+        (' -22 ', -22),
+        ('22.0', 22.0),
+        ('2.2e1', 22.0),
+        ('7.4', 7.4),
+    ],
+)
+def test_compile_decoder_with_integer_strings(value, expected_result):
+    decode = compile_decoder(_RecordDict)
+
+    ratio = decode({'Ratio': value})['Ratio']
+    assert type(ratio) is type(expected_result)
+    assert ratio == expected_result
+
+def test_compile_decoder_with_ignore_keys():
+    decode = compile_decoder(_RecordDict, ('Note', 'Items[].Count'))
+
+    assert decode({
+        'Note': '',
+        'Count': '42',
+        'Items': [{'Code': '15', 'Count': '3'}],
+    }) == {
+        'Note': '',
+        'Count': 42,
+        'Items': [{'Code': '15', 'Count': '3'}],
+    }
+
+    decode = compile_decoder(_RecordDict, ('[].Note',), key_path=LIST_ITEMS)
+    assert decode({'Note': '', 'Count': '42'}) == {'Note': '', 'Count': 42}
+
+    # no key paths to ignore below the record
+    assert compile_decoder(_RecordDict, ('[].Note',), key_path='Items') \
+        is compile_decoder(_RecordDict)
+
+def test_compile_decoder_with_ev_charging_points():
+    decode = compile_decoder(
+        EVChargingPointsDict,
+        tuple(EV_CHARGING_POINTS_SANITISE_IGNORE_KEYS),
+    )
+
+    location = decode(APIResponseEVChargingPoints.json()['value'])[
+        'evLocationsData'
+    ][0]
+    charging_point = location['chargingPoints'][0]
+    assert location['status'] == ''
+    assert charging_point['id'] == ''
+    assert type(charging_point['plugTypes'][0]['chargingSpeed']) is int
+
+def test_compile_decoder_is_cached():
+    assert compile_decoder(_RecordDict) is compile_decoder(_RecordDict)
+
+@pytest.mark.parametrize(
+    ('record_type', 'mocked_response_class', 'is_list'),
+    [
+        (BusArrivalDict, APIResponseBusArrival, False),
+        (BusRoutesDict, APIResponseBusRoutes, True),
+        (FloodAlertsDict, APIResponseFloodAlerts, True),
+    ],
+)
+def test_compile_decoder_with_response_types(
+    record_type,
+    mocked_response_class,
+    is_list,
+):
+    decode = compile_decoder(record_type)
+    value = mocked_response_class.json()
+    del value['odata.metadata']
+
+    if is_list:
+        records = [decode(r) for r in value['value']]
+        assert check_type(records, list[record_type]) == records
+    else:
+        record = decode(value)
+        assert check_type(record, record_type) == record
+
+_PAGE_RECORD = {
+    'Code': '01012',
+    'Count': '42',
+    'Ratio': '0.5',
+    'Note': '',
+    'Day': '2026-04-09',
+    'Start': '0530',
+    'Updated': '2026-04-09T08:30:00+08:00',
+    'Circle': '1.35479,103.88611,0.05',
+    'Items': [{'Code': '15', 'Count': 3}],
+    'Unknown': '123',
+}
+
+@pytest.mark.parametrize(
+    'page',
+    [
+        [],
+        [_PAGE_RECORD, _PAGE_RECORD | {'Count': 7, 'Start': '2330'}],
+        # values that cannot be converted
+        [_PAGE_RECORD, _PAGE_RECORD | {'Count': 'foobar', 'Ratio': ''}],
+        [_PAGE_RECORD, _PAGE_RECORD | {'Updated': ['foobar']}],
+        # records with different keys
+        [_PAGE_RECORD, _PAGE_RECORD | {'Extra': '7'}],
+        [{'Count': '1', 'Ratio': '2'}, {'Ratio': '3', 'Count': '4'}],
+        [{'Count': '1'}, {'Ratio': '2'}],
+        # records that are not dicts
+        [_PAGE_RECORD, 'foobar', None],
+    ],
+)
+def test_compile_page_decoder(page):
+    decode = compile_decoder(_RecordDict)
+    decode_page = compile_page_decoder(_RecordDict)
+
+    decoded_page = decode_page(page)
+    assert decoded_page == [decode(r) for r in page]
+    for decoded_record, record in zip(decoded_page, page):
+        if isinstance(record, dict):
+            assert list(decoded_record) == list(record)
+            assert decoded_record is not record
+
+def test_compile_page_decoder_with_ignore_keys():
+    ignore_keys = ('[].Note', '[].Items[].Count')
+    decode = compile_decoder(_RecordDict, ignore_keys, key_path=LIST_ITEMS)
+    decode_page = compile_page_decoder(_RecordDict, ignore_keys)
+    page = [
+        _PAGE_RECORD | {'Items': [{'Code': '15', 'Count': '3'}]},
+        _PAGE_RECORD | {'Ratio': '22'},
+    ]
+
+    decoded_page = decode_page(page)
+    assert decoded_page == [decode(r) for r in page]
+    assert decoded_page[0]['Note'] == ''
+    assert decoded_page[0]['Items'] == [{'Code': '15', 'Count': '3'}]
+    assert type(decoded_page[1]['Ratio']) is int
+
+def test_compile_page_decoder_parses_datetimes_once(monkeypatch):
+    parsed_values = []
+
+    def mock_datetime_or_none_from_string(value):
+        parsed_values.append(value)
+        return None
+
+    monkeypatch.setattr(
+        decoders,
+        'datetime_or_none_from_string',
+        mock_datetime_or_none_from_string,
+    )
+
+    decode_page = compile_page_decoder(_RecordDict)
+    _ = decode_page([_PAGE_RECORD] * 3)
+
+    assert sorted(parsed_values) == sorted(['2026-04-09', '0530', \
+        '2026-04-09T08:30:00+08:00'])
+
+def test_compile_page_decoder_is_cached():
+    assert compile_page_decoder(_RecordDict) \
+        is compile_page_decoder(_RecordDict)
+
+@pytest.mark.parametrize(
+    ('record_type', 'mocked_response_class'),
+    [
+        (BusRoutesDict, APIResponseBusRoutes),
+        (FloodAlertsDict, APIResponseFloodAlerts),
+    ],
+)
+def test_compile_page_decoder_with_response_types(
+    record_type,
+    mocked_response_class,
+):
+    decode = compile_decoder(record_type)
+    decode_page = compile_page_decoder(record_type)
+    page = mocked_response_class.json()['value']
+
+    assert decode_page(page) == [decode(r) for r in page]
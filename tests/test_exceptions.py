@@ -18,7 +18,13 @@
 
 import pytest
 
-from landtransportsg.exceptions import APIError
+from landtransportsg.exceptions import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    PaginationError,
+)
+from landtransportsg.pagination import PaginationCursor
 
 @pytest.mark.parametrize(
     ('message', 'data', 'errors'),
@@ -43,3 +49,40 @@ def test_raising_APIError(message, data, errors):
         assert not hasattr(excinfo.value, 'errors')
     else:
         assert excinfo.value.errors == errors
+
+def test_raising_PaginationError():
+    cursor = PaginationCursor('https://datamall2.mytransport.sg/ltaodataservice/BusStops')
+
+    with pytest.raises(APIError) as excinfo:
+        raise PaginationError(
+            message='pytest',
+            cursor=cursor,
+            data=[{'Message': 'pytest message'}],
+        )
+
+    assert isinstance(excinfo.value, PaginationError)
+    assert excinfo.value.message == 'pytest'
+    assert excinfo.value.cursor is cursor
+    assert excinfo.value.data == [{'Message': 'pytest message'}]
+
+def test_raising_DeadlineExceededError():
+    with pytest.raises(APIError) as excinfo:
+        raise DeadlineExceededError(
+            message='pytest',
+            errors=['https://datamall2.mytransport.sg/ltaodataservice/BusStops'],
+        )
+
+    assert isinstance(excinfo.value, DeadlineExceededError)
+    assert excinfo.value.message == 'pytest'
+
+def test_raising_CircuitOpenError():
+    with pytest.raises(APIError) as excinfo:
+        raise CircuitOpenError(
+            message='pytest',
+            endpoint='https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+            retry_in=30.0,
+        )
+
+    assert isinstance(excinfo.value, CircuitOpenError)
+    assert excinfo.value.endpoint == 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    assert excinfo.value.retry_in == 30.0
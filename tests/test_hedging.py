@@ -0,0 +1,155 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the hedging module is working properly."""
+
+import asyncio
+from itertools import count
+from threading import Event, Lock, Timer
+
+import pytest
+
+from landtransportsg.hedging import Hedger
+
+def make_func(slow_calls, result='foo'):
+    """Create a function whose calls in slow_calls (0 is the first) wait \
+    until they are released."""
+    calls = count()
+    lock = Lock()
+    release = Event()
+
+    def func():
+        with lock:
+            call = next(calls)
+        if call in slow_calls:
+            assert release.wait(timeout=5)
+        return f'{result}{call}'
+
+    func.release = release
+    return func
+
+def test_hedger_delay():
+    hedger = Hedger(percentile=90, initial_delay=2, min_samples=10)
+    assert hedger.delay('foo') == 2
+
+    for latency in range(1, 11):
+        hedger.record('foo', latency / 10)
+
+    assert hedger.delay('foo') == pytest.approx(0.9)
+    assert hedger.delay('bar') == 2
+
+def test_hedger_min_delay():
+    hedger = Hedger(min_delay=0.5, min_samples=1)
+    hedger.record('foo', 0.01)
+
+    assert hedger.delay('foo') == 0.5
+
+def test_hedger_without_hedging():
+    hedger = Hedger(initial_delay=1)
+    func = make_func(slow_calls=[])
+
+    assert hedger.run('foo', func) == 'foo0'
+    assert hedger.calls == 1
+    assert hedger.hedges == 0
+
+def test_hedger_with_hedging():
+    hedger = Hedger(budget=1, initial_delay=0.05)
+    func = make_func(slow_calls=[0])
+    discarded = []
+
+    assert hedger.run('foo', func, discard=discarded.append) == 'foo1'
+    assert hedger.hedges == 1
+    assert 'hedges=1' in repr(hedger)
+
+    func.release.set()
+    hedger.shutdown()
+    assert discarded == ['foo0']
+
+def test_hedger_budget():
+    hedger = Hedger(budget=0.5, initial_delay=0.01)
+
+    for _ in range(4):
+        func = make_func(slow_calls=[0, 1])
+        releaser = Timer(0.1, func.release.set)
+        releaser.start()
+        _ = hedger.run('foo', func)
+        releaser.join()
+
+    assert hedger.calls == 4
+    assert hedger.hedges == 2
+
+def test_hedger_records_first_call_latency():
+    hedger = Hedger(initial_delay=1, min_samples=1)
+    _ = hedger.run('foo', make_func(slow_calls=[]))
+    _ = hedger.run('foo', make_func(slow_calls=[]), is_sample=lambda r: False)
+    hedger.shutdown()
+
+    assert hedger.delay('foo') < 1
+
+def test_hedger_with_exception():
+    hedger = Hedger(budget=1, initial_delay=0.01)
+
+    def func():
+        raise ValueError('foobar')
+
+    with pytest.raises(ValueError):
+        _ = hedger.run('foo', func)
+
+def test_hedger_run_async():
+    hedger = Hedger(budget=1, initial_delay=0.05)
+    calls = count()
+    discarded = []
+
+    async def func():
+        call = next(calls)
+        if call == 0:
+            await asyncio.sleep(5)
+        return f'foo{call}'
+
+    async def run():
+        return await hedger.run_async('foo', func, discard=discarded.append)
+
+    assert asyncio.run(run()) == 'foo1'
+    assert hedger.hedges == 1
+    # the slower call is cancelled instead of discarded
+    assert not discarded
+
+def test_hedger_run_async_without_hedging():
+    hedger = Hedger(initial_delay=1)
+
+    async def func():
+        return 'foo'
+
+    assert asyncio.run(hedger.run_async('foo', func)) == 'foo'
+    assert hedger.hedges == 0
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'percentile': 0},
+        {'percentile': 101},
+        {'budget': -0.1},
+        {'budget': 1.1},
+        {'initial_delay': -1},
+        {'min_delay': -1},
+        {'window': 0},
+        {'min_samples': 0},
+        {'max_workers': 0},
+    ],
+)
+def test_invalid_hedger(kwargs):
+    with pytest.raises(ValueError):
+        _ = Hedger(**kwargs)
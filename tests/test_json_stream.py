@@ -0,0 +1,108 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the JSONValueStream class is working properly."""
+
+from json import JSONDecodeError, dumps
+
+import pytest
+
+from landtransportsg.json_stream import JSONValueStream
+
+def chunk(document, chunk_size):
+    body = dumps(document, ensure_ascii=False).encode('utf-8')
+    return [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [1, 3, 64, 65536],
+)
+@pytest.mark.parametrize(
+    'document',
+    [
+        {
+            'odata.metadata': 'https://datamall2.mytransport.sg/ltaodataservice/$metadata#BusStops',
+            'value': [
+                {
+                    'BusStopCode': '01012',
+                    'RoadName': 'Victoria St',
+                    'Description': 'Hôtel "Grand" Pacific',
+                    'Latitude': 1.29684825487647,
+                    'Longitude': 103.85253591654006,
+                    'Services': [12345, None, True, False],
+                } for _ in range(20)
+            ],
+        },
+        {
+            'value': [1, 22, 333, 4444.5, -55555],
+            'odata.nextLink': 'foobar',
+        },
+        {
+            'value': [],
+        },
+    ],
+)
+def test_stream_with_value_list(document, chunk_size):
+    stream = JSONValueStream(chunk(document, chunk_size))
+    items = list(stream)
+
+    assert stream.is_streamed is True
+    assert items == document['value']
+    assert stream.document == {
+        k: v for k, v in document.items() if k != 'value'
+    }
+
+@pytest.mark.parametrize(
+    'chunk_size',
+    [1, 64],
+)
+@pytest.mark.parametrize(
+    'document',
+    [
+        {},
+        {'value': {'Link': 'https://example.com'}},
+        {'foo': 'bar', 'meaning_of_universe': 42},
+        [1, 2, 3],
+        12345,
+        'foobar',
+    ],
+)
+def test_stream_without_value_list(document, chunk_size):
+    stream = JSONValueStream(chunk(document, chunk_size))
+
+    assert not list(stream)
+    assert stream.is_streamed is False
+    assert stream.document == document
+
+def test_stream_with_str_chunks():
+    stream = JSONValueStream(['{"val', 'ue": [1', '2, 3', '4]}'])
+
+    assert list(stream) == [12, 34]
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        '',
+        '{"value": [1, 2',
+        '{"value": [1, 2]} foobar',
+        '{"value": [1,]}',
+        '{"foo" "bar"}',
+        '{42: "foobar"}',
+    ],
+)
+def test_stream_with_invalid_json(body):
+    with pytest.raises(JSONDecodeError):
+        _ = list(JSONValueStream([body.encode('utf-8')]))
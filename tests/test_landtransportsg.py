@@ -16,27 +16,62 @@
 
 """Test that the LandTransportSg class is working properly."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from inspect import signature
+from io import BytesIO
+from json import dumps
 from os import getenv
+from threading import Event
+from time import sleep
+from tracemalloc import get_traced_memory, start, stop
 from zoneinfo import ZoneInfo
 
 import pytest
 from dotenv import load_dotenv
-from requests import HTTPError
-from requests_cache import CachedSession
+from requests import HTTPError, ReadTimeout
+from requests.adapters import HTTPAdapter
+from requests_cache import DO_NOT_CACHE, CachedSession
+from urllib3 import HTTPResponse
 
+from landtransportsg import (
+    ActiveMobility,
+    ElectricVehicle,
+    Geospatial,
+    PublicTransport,
+    Traffic,
+)
+from landtransportsg import cache as landtransportsg_cache
+from landtransportsg.cache import BoundedSQLiteCache
 from landtransportsg.landtransportsg import LandTransportSg
-from landtransportsg.constants import USER_AGENT
-from landtransportsg.exceptions import APIError
+from landtransportsg.config import (
+    CacheConfig,
+    ConnectionConfig,
+    ResilienceConfig,
+)
+from landtransportsg.constants import BASE_API_DOMAIN, USER_AGENT
+from landtransportsg.deadline import Deadline, DeadlineTimeout
+from landtransportsg.exceptions import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    PaginationError,
+)
+from landtransportsg.hedging import Hedger
+from landtransportsg.rate_limiter import RateLimiter
+from landtransportsg.public_transport.types import BusArrivalDict
 
 from .mocks.types_args import MockArgsDict
 from .mocks.api_response_fault import APIResponseFault
 from .mocks.api_response_landtransportsg import (
     APIResponseBadLink,
+    APIResponseCached,
+    APIResponseEmptyValueList,
     APIResponseMissingLink,
     APIResponseMoreThan500RecordsPage1,
     APIResponseMoreThan500RecordsPage2,
     APIResponseMoreThan500RecordsPage3,
+    APIResponseStreamed,
     APIResponseValueList,
 )
 from .mocks.api_response_public_transport import APIResponseBusArrival
@@ -298,6 +333,898 @@ def test_send_request_with_more_than_500_records(
     assert isinstance(response_content, list)
     assert len(response_content) == 500 + 500 + 499
 
+@pytest.mark.parametrize(
+    'pagination_workers',
+    [2, 3, 4],
+)
+def test_send_request_with_more_than_500_records_concurrently(
+    monkeypatch,
+    pagination_workers,
+):
+    requested_skips = []
+
+    def mock_requests_get(*args, **kwargs):
+        params = kwargs.get('params', {})
+        skip = params.get('$skip', None)
+        requested_skips.append(skip)
+        if skip is None or skip == 0:
+            return APIResponseMoreThan500RecordsPage1()
+        elif skip == 500:
+            return APIResponseMoreThan500RecordsPage2()
+        elif skip == 1000:
+            return APIResponseMoreThan500RecordsPage3()
+        return APIResponseEmptyValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        getenv('ACCOUNT_KEY', ''),
+        pagination_workers=pagination_workers,
+    )
+    response_content = client.send_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+    )
+    assert isinstance(response_content, list)
+    assert len(response_content) == 500 + 500 + 499
+    assert response_content[0]['BusStopCode'] == 1012
+    assert response_content[500]['BusStopCode'] == 1013
+    assert response_content[-1]['BusStopCode'] == 1019
+    assert sorted(requested_skips)[:3] == [0, 500, 1000]
+
+def test_iter_request_with_more_than_500_records(client, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        skip = kwargs.get('params', {}).get('$skip', None)
+        if skip is None or skip == 0:
+            return APIResponseMoreThan500RecordsPage1()
+        elif skip == 500:
+            return APIResponseMoreThan500RecordsPage2()
+        elif skip == 1000:
+            return APIResponseMoreThan500RecordsPage3()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    params = {'foo': 'bar'}
+    pages = client.iter_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+        params=params,
+        sanitise_ignore_keys=['[].BusStopCode'],
+    )
+    assert [len(page) for page in pages] == [500, 500, 499]
+    assert params == {'foo': 'bar'}
+
+    records = list(client.iter_records(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+        sanitise_ignore_keys=['[].BusStopCode'],
+    ))
+    assert len(records) == 500 + 500 + 499
+    assert records[0]['BusStopCode'] == '01012'
+    assert records[-1]['BusStopCode'] == '01019'
+
+def test_iter_records_with_dict_response(client, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseBusArrival()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    records = list(client.iter_records(
+        'https://datamall2.mytransport.sg/ltaodataservice/v3/BusArrival',
+        params={'BusStopCode': '83139'},
+    ))
+    assert len(records) == 1
+    assert 'Services' in records[0]
+
+@pytest.mark.parametrize(
+    'pagination_workers',
+    [1, 2],
+)
+def test_send_request_with_failed_page_and_resume(
+    monkeypatch,
+    pagination_workers,
+):
+    failures = {1000: 1}
+
+    def mock_requests_get(*args, **kwargs):
+        skip = kwargs.get('params', {}).get('$skip', None)
+        if skip is None or skip == 0:
+            return APIResponseMoreThan500RecordsPage1()
+        elif skip == 500:
+            return APIResponseMoreThan500RecordsPage2()
+        elif skip == 1000:
+            if failures[skip] > 0:
+                failures[skip] -= 1
+                return APIResponseFault()
+            return APIResponseMoreThan500RecordsPage3()
+        return APIResponseEmptyValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        getenv('ACCOUNT_KEY', ''),
+        pagination_workers=pagination_workers,
+    )
+
+    with pytest.raises(PaginationError) as excinfo:
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+        )
+
+    cursor = excinfo.value.cursor
+    assert cursor.pages == 2
+    assert cursor.skip == 1000
+    assert len(excinfo.value.data) == 500 + 500
+
+    remaining = client.resume_request(cursor)
+    assert len(remaining) == 499
+    assert cursor.is_complete is True
+    assert client.resume_request(cursor) == []
+
+def test_invalid_pagination_workers():
+    with pytest.raises(ValueError):
+        _ = LandTransportSg('foobar', pagination_workers=0)
+
+def test_connection_pool():
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(
+            pool_connections=2,
+            pool_maxsize=32,
+            pool_block=True,
+        ),
+    )
+    adapter = client.session.get_adapter(BASE_API_DOMAIN)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+def test_bounded_sqlite_cache_backend():
+    client = LandTransportSg('foobar', cache_backend='bounded_sqlite')
+    assert isinstance(client.session.cache, BoundedSQLiteCache)
+
+@pytest.mark.parametrize(
+    'timeout',
+    [None, 5.0, (3.05, 27.0)],
+)
+def test_send_request_with_timeout(monkeypatch, timeout):
+    timeouts = []
+
+    def mock_requests_get(*args, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(timeout=timeout),
+    )
+    _ = client.send_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+    )
+    assert timeouts == [timeout]
+
+@pytest.mark.parametrize(
+    'connections',
+    [1, 4],
+)
+def test_warm_up(monkeypatch, connections):
+    requests = []
+
+    class MockHeadResponse:
+        def close(self):
+            pass
+
+    def mock_requests_head(self, url, **kwargs):
+        requests.append((url, kwargs))
+        return MockHeadResponse()
+
+    monkeypatch.setattr(CachedSession, 'head', mock_requests_head)
+
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(timeout=5.0),
+    )
+    client.warm_up(connections=connections)
+    assert len(requests) == connections
+    for url, kwargs in requests:
+        assert url == BASE_API_DOMAIN
+        assert kwargs['expire_after'] == DO_NOT_CACHE
+        assert kwargs['timeout'] == 5.0
+
+@pytest.mark.parametrize(
+    'pagination_workers',
+    [1, 2],
+)
+def test_send_request_with_stream_json(monkeypatch, pagination_workers):
+    pages = {
+        0: APIResponseMoreThan500RecordsPage1,
+        500: APIResponseMoreThan500RecordsPage2,
+        1000: APIResponseMoreThan500RecordsPage3,
+    }
+    streams = []
+
+    def mock_requests_get(*args, **kwargs):
+        response = pages.get(kwargs['params']['$skip'], APIResponseValueList)()
+        if kwargs.get('stream') is True:
+            response = APIResponseStreamed(response)
+            streams.append(response)
+        return response
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    sanitise_ignore_keys = ['[].BusStopCode']
+
+    expected = LandTransportSg(
+        'foobar',
+        pagination_workers=pagination_workers,
+    ).send_request(url, sanitise_ignore_keys=sanitise_ignore_keys)
+
+    client = LandTransportSg(
+        'foobar',
+        pagination_workers=pagination_workers,
+        stream_json=True,
+    )
+    response_content = client.send_request(
+        url,
+        sanitise_ignore_keys=sanitise_ignore_keys,
+    )
+    assert response_content == expected
+    assert response_content[0]['BusStopCode'] == '01012'
+    assert len(streams) >= 3
+    assert all(s.is_closed for s in streams)
+
+def test_send_request_with_stream_json_peak_memory(monkeypatch):
+    # one page of large records, which is not followed by another page
+    body = dumps({
+        'value': [
+            {'BusStopCode': f'{i:05d}', 'RoadName': 'Victoria Street ' * 60} \
+                for i in range(499)
+        ],
+    }).encode('utf-8')
+
+    def mock_send(self, request, *args, **kwargs):
+        return self.build_response(request, HTTPResponse(
+            body=BytesIO(body),
+            status=200,
+            preload_content=False,
+        ))
+
+    monkeypatch.setattr(HTTPAdapter, 'send', mock_send)
+
+    def peak_memory(stream_json, cache_duration):
+        client = LandTransportSg(
+            'foobar',
+            cache_backend='memory',
+            stream_json=stream_json,
+        )
+        url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+        # leave out the memory that is only used by the first request
+        _ = client.send_request(url, params={'warm_up': 1})
+
+        start()
+        try:
+            _ = client.send_request(url, cache_duration=cache_duration)
+            return get_traced_memory()[1]
+        finally:
+            stop()
+
+    # a response that is not cached is streamed, so neither its body nor
+    # its unsanitised records are held in full
+    streamed = peak_memory(stream_json=True, cache_duration=0)
+    assert streamed < 0.75 * peak_memory(stream_json=False, cache_duration=0)
+
+    # a response with a cache duration is not stored in the cache backend,
+    # which would read its whole body, so it is streamed too
+    streamed_cached = peak_memory(stream_json=True, cache_duration=60)
+    assert streamed_cached \
+        < 0.75 * peak_memory(stream_json=False, cache_duration=60)
+
+
+def test_send_request_with_stream_json_and_cache_duration(monkeypatch):
+    requests = []
+
+    def mock_send(self, request, *args, **kwargs):
+        requests.append(kwargs)
+        return self.build_response(request, HTTPResponse(
+            body=BytesIO(dumps(APIResponseValueList.json()).encode('utf-8')),
+            status=200,
+            preload_content=False,
+        ))
+
+    monkeypatch.setattr(HTTPAdapter, 'send', mock_send)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    client = LandTransportSg(
+        'foobar',
+        cache_backend='memory',
+        stream_json=True,
+    )
+
+    # the page is kept in the in-memory cache instead of the cache backend
+    for _ in range(2):
+        response_content = client.send_request(url, cache_duration=60)
+        assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == 1
+    assert requests[0]['stream'] is True
+    assert len(client.session.cache.responses) == 0
+    assert client.memory_cache.cache_info()['hits'] == 1
+
+    # a response that is in the cache backend is served from there
+    other_client = LandTransportSg('foobar', cache_backend='memory')
+    other_client.session = client.session
+    _ = other_client.send_request(url, params={'foo': 'bar'}, cache_duration=60)
+    assert len(requests) == 2
+
+    response_content = client.send_request(
+        url,
+        params={'foo': 'bar'},
+        cache_duration=60,
+    )
+    assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == 2
+
+def test_send_request_with_stream_json_and_fault_response(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseFault()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg('foobar', stream_json=True)
+    with pytest.raises(APIError):
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+        )
+
+def test_send_request_with_stream_json_and_invalid_json(monkeypatch):
+    class MockInvalidJSONResponse(APIResponseStreamed):
+        def iter_content(self, chunk_size=1, decode_unicode=False):
+            yield b'{"value": [{"BusStopCode": "01012"}, {"Bus'
+
+    def mock_requests_get(*args, **kwargs):
+        return MockInvalidJSONResponse(APIResponseValueList())
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg('foobar', stream_json=True)
+    with pytest.raises(APIError):
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+        )
+
+@pytest.mark.parametrize(
+    ('memo_size', 'expected_json_calls'),
+    [
+        (0, 4),
+        (128, 2),
+    ],
+)
+def test_send_request_with_cached_response(
+    monkeypatch,
+    memo_size,
+    expected_json_calls,
+):
+    created_at = {'value': datetime(2026, 1, 1)}
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseCached(
+            APIResponseBusArrival(),
+            created_at=created_at['value'],
+        )
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    monkeypatch.setattr(APIResponseCached, 'json_calls', 0)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/v3/BusArrival'
+    client = LandTransportSg(
+        'foobar',
+        caching=CacheConfig(memo_size=memo_size),
+    )
+
+    first = client.send_request(url)
+    first['Services'] = []
+    second = client.send_request(url)
+    assert second['Services'] != []
+    assert isinstance(second['Services'][0]['NextBus']['Latitude'], float)
+
+    # a refreshed cache entry is decoded again
+    created_at['value'] = datetime(2026, 1, 2)
+    third = client.send_request(url)
+    fourth = client.send_request(url)
+    assert third == fourth == second
+
+    assert APIResponseCached.json_calls == expected_json_calls
+
+@pytest.mark.parametrize(
+    ('cache_duration', 'expected_requests'),
+    [
+        (0, 3),
+        (60, 2),
+    ],
+)
+def test_send_request_with_memory_cache(
+    monkeypatch,
+    cache_duration,
+    expected_requests,
+):
+    now = {'value': 1000.0}
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs['params'])
+        return APIResponseBusArrival()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    monkeypatch.setattr(landtransportsg_cache, 'monotonic', lambda: now['value'])
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/v3/BusArrival'
+    client = LandTransportSg(
+        'foobar',
+        caching=CacheConfig(memory_cache_size=8),
+    )
+
+    first = client.send_request(
+        url,
+        params={'BusStopCode': '83139', 'ServiceNo': '15'},
+        cache_duration=cache_duration,
+    )
+    first['Services'] = []
+
+    # the order of the parameters does not matter
+    second = client.send_request(
+        url,
+        params={'ServiceNo': '15', 'BusStopCode': '83139'},
+        cache_duration=cache_duration,
+    )
+    assert second['Services'] != []
+
+    now['value'] += 60
+    third = client.send_request(
+        url,
+        params={'BusStopCode': '83139', 'ServiceNo': '15'},
+        cache_duration=cache_duration,
+    )
+    assert third == second
+
+    assert len(requests) == expected_requests
+    if cache_duration > 0:
+        assert client.memory_cache.cache_info()['hits'] == 1
+
+@pytest.mark.parametrize(
+    ('cache_duration', 'coalesce_requests', 'expected_requests'),
+    [
+        (60, True, 1),
+        (60, False, 4),
+        (0, True, 4),
+    ],
+)
+def test_send_request_with_coalesced_requests(
+    monkeypatch,
+    cache_duration,
+    coalesce_requests,
+    expected_requests,
+):
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs['params'])
+        sleep(0.2)
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        caching=CacheConfig(coalesce_requests=coalesce_requests),
+    )
+
+    def send_request(_):
+        return client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+            cache_duration=cache_duration,
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(send_request, range(4)))
+
+    assert len(requests) == expected_requests
+    assert all(r == results[0] for r in results)
+    assert len({id(r) for r in results}) == 4
+
+@pytest.mark.parametrize(
+    ('stale_while_revalidate', 'cache_duration', 'expected_headers'),
+    [
+        (0, 60, None),
+        (300, 60, {'Cache-Control': 'stale-while-revalidate=300'}),
+        (300, 0, None),
+        (
+            {
+                'https://datamall2.mytransport.sg/ltaodataservice/BusRoutes': 3600,
+            },
+            60,
+            {'Cache-Control': 'stale-while-revalidate=3600'},
+        ),
+        (
+            {
+                'https://datamall2.mytransport.sg/ltaodataservice/BusStops': 3600,
+            },
+            60,
+            None,
+        ),
+    ],
+)
+def test_send_request_with_stale_while_revalidate(
+    monkeypatch,
+    stale_while_revalidate,
+    cache_duration,
+    expected_headers,
+):
+    headers = []
+
+    def mock_requests_get(*args, **kwargs):
+        headers.append(kwargs.get('headers'))
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        caching=CacheConfig(stale_while_revalidate=stale_while_revalidate),
+    )
+    _ = client.send_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusRoutes',
+        cache_duration=cache_duration,
+    )
+    assert headers == [expected_headers]
+
+def test_force_refresh(monkeypatch):
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs)
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+    client = LandTransportSg(
+        'foobar',
+        caching=CacheConfig(memory_cache_size=8),
+    )
+
+    _ = client.send_request(url, cache_duration=60)
+    _ = client.send_request(url, cache_duration=60)
+    assert len(requests) == 1
+    assert requests[0]['force_refresh'] is False
+
+    with client.force_refresh() as cache_durations:
+        _ = client.send_request(url, cache_duration=60)
+        _ = list(client.iter_records(url, cache_duration=300))
+    assert cache_durations == [60, 300]
+    assert len(requests) == 3
+    assert all(r['force_refresh'] is True for r in requests[1:])
+
+    _ = client.send_request(url, cache_duration=60)
+    assert len(requests) == 3
+
+@pytest.mark.parametrize(
+    ('client_deadline', 'deadline', 'max_total'),
+    [(None, 2.0, 2.0), (2.0, None, 2.0), (60.0, 2.0, 2.0)],
+)
+def test_send_request_with_deadline(
+    monkeypatch,
+    client_deadline,
+    deadline,
+    max_total,
+):
+    timeouts = []
+
+    def mock_requests_get(*args, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(timeout=(3.05, 27.0)),
+        resilience=ResilienceConfig(deadline=client_deadline),
+    )
+    _ = client.send_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+        deadline=deadline,
+    )
+    assert len(timeouts) == 1
+    assert isinstance(timeouts[0], DeadlineTimeout)
+    assert timeouts[0].total <= max_total
+    assert timeouts[0].request_timeout == (3.05, 27.0)
+
+def test_send_request_in_deadline_block(monkeypatch):
+    timeouts = []
+
+    def mock_requests_get(*args, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(deadline=60.0),
+    )
+    with Deadline(1.0):
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+        )
+    assert timeouts[0].total <= 1.0
+
+@pytest.mark.parametrize(
+    'pagination_workers',
+    [1, 2],
+)
+def test_send_request_with_exceeded_deadline(monkeypatch, pagination_workers):
+    def mock_requests_get(*args, **kwargs):
+        if kwargs['params'].get('$skip', 0) == 0:
+            return APIResponseMoreThan500RecordsPage1()
+        sleep(kwargs['timeout'].total)
+        raise ReadTimeout()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        pagination_workers=pagination_workers,
+    )
+
+    # the deadline is not a pagination error, as resuming the request would
+    # be past the deadline too
+    with pytest.raises(DeadlineExceededError):
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+            deadline=0.2,
+        )
+
+    with pytest.raises(DeadlineExceededError):
+        _ = list(client.iter_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+            deadline=0.2,
+        ))
+
+    # a request is not sent at all after its deadline
+    with Deadline(0.01):
+        sleep(0.02)
+        with pytest.raises(DeadlineExceededError):
+            _ = client.send_request(
+                'https://datamall2.mytransport.sg/ltaodataservice/BusStops',
+            )
+
+def test_send_request_with_deadline_fallback(monkeypatch):
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs)
+        sleep(kwargs['timeout'].total)
+        raise ReadTimeout()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(deadline=0.1, deadline_fallback=True),
+    )
+
+    cache_keys = []
+
+    def mock_get_response(key, default=None):
+        cache_keys.append(key)
+        return APIResponseCached(APIResponseValueList(), cache_key='')
+
+    monkeypatch.setattr(client.session.cache, 'get_response', mock_get_response)
+
+    response_content = client.send_request(url, cache_duration=60)
+    assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == 1
+    assert len(cache_keys) == 1
+
+    # the expired response is used only until the deadline passes
+    monkeypatch.setattr(
+        client.session.cache,
+        'get_response',
+        lambda key, default=None: None,
+    )
+    with pytest.raises(DeadlineExceededError):
+        _ = client.send_request(url, cache_duration=60)
+
+@pytest.mark.parametrize(
+    'deadline_fallback',
+    [False, True],
+)
+def test_send_request_with_coalesced_deadlines(monkeypatch, deadline_fallback):
+    requests = []
+    started = Event()
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs)
+        if len(requests) == 1:
+            started.set()
+            sleep(kwargs['timeout'].total)
+            raise ReadTimeout()
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(deadline_fallback=deadline_fallback),
+    )
+    monkeypatch.setattr(
+        client.session.cache,
+        'get_response',
+        lambda key, default=None: APIResponseCached(
+            APIResponseEmptyValueList(),
+        ),
+    )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(
+            client.send_request,
+            url,
+            cache_duration=60,
+            deadline=0.1,
+        )
+        assert started.wait(timeout=5)
+        waiter = executor.submit(
+            client.send_request,
+            url,
+            cache_duration=60,
+            deadline=60.0,
+        )
+
+        if deadline_fallback:
+            # the leader falls back to the expired response
+            assert leader.result() == []
+        else:
+            assert isinstance(leader.exception(), DeadlineExceededError)
+        waiter_content = waiter.result()
+
+    # the waiter's deadline has not passed, so it does not share the
+    # leader's error or fallback
+    assert waiter_content == APIResponseValueList.json()['value']
+    assert len(requests) == 2
+
+def test_send_request_with_deadline_and_rate_limit(monkeypatch):
+    requests = []
+
+    def mock_requests_get(self, *args, **kwargs):
+        # the rate limiter allows no request before the deadline
+        with kwargs['timeout'].deadline:
+            self.get_adapter(BASE_API_DOMAIN).rate_limiter.acquire(
+                deadline=kwargs['timeout'].deadline,
+            )
+        requests.append(kwargs)
+        return APIResponseValueList()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(rate_limiter=RateLimiter(0.1, burst=1)),
+        resilience=ResilienceConfig(deadline=1.0, deadline_fallback=True),
+    )
+    monkeypatch.setattr(
+        client.session.cache,
+        'get_response',
+        lambda key, default=None: APIResponseCached(APIResponseValueList()),
+    )
+
+    _ = client.send_request(url)
+    assert len(requests) == 1
+
+    # the expired response is used instead of waiting for the rate limiter
+    response_content = client.send_request(url)
+    assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == 1
+
+@pytest.mark.parametrize(
+    'circuit_breaker_fallback',
+    [False, True],
+)
+def test_send_request_with_open_circuit(
+    monkeypatch,
+    circuit_breaker_fallback,
+):
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusServices'
+
+    def mock_requests_get(*args, **kwargs):
+        raise CircuitOpenError('pytest', endpoint=url, retry_in=30.0)
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(
+            circuit_breaker_fallback=circuit_breaker_fallback,
+        ),
+    )
+    monkeypatch.setattr(
+        client.session.cache,
+        'get_response',
+        lambda key, default=None: APIResponseCached(APIResponseValueList()),
+    )
+
+    if circuit_breaker_fallback:
+        response_content = client.send_request(url, cache_duration=60)
+        assert response_content == APIResponseValueList.json()['value']
+    else:
+        with pytest.raises(CircuitOpenError):
+            _ = client.send_request(url, cache_duration=60)
+
+@pytest.mark.parametrize(
+    ('hedge', 'expected_requests'),
+    [(False, 1), (True, 2)],
+)
+def test_send_request_with_hedger(monkeypatch, hedge, expected_requests):
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs)
+        if len(requests) == 1:
+            sleep(0.2)
+        return APIResponseCached(APIResponseValueList())
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    hedger = Hedger(budget=1, initial_delay=0.05)
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(hedger=hedger),
+    )
+
+    response_content = client.send_request(
+        'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+        hedge=hedge,
+    )
+    hedger.shutdown()
+
+    assert response_content == APIResponseValueList.json()['value']
+    assert len(requests) == expected_requests
+    assert hedger.hedges == expected_requests - 1
+
+def test_invalid_deadline():
+    client = LandTransportSg('foobar')
+    with pytest.raises(ValueError):
+        _ = client.send_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+            deadline=-1,
+        )
+
+@pytest.mark.parametrize(
+    'client_class',
+    [ActiveMobility, ElectricVehicle, Geospatial, PublicTransport, Traffic],
+)
+def test_client_functions_accept_deadline(client_class):
+    # functions that do not send any request
+    no_request_functions = {'geospatial_layer_ids', 'train_lines'}
+
+    for name, function in vars(client_class).items():
+        if name.startswith('_') or name in no_request_functions:
+            continue
+        assert 'deadline' in signature(function).parameters, name
+
+def test_invalid_deadline_of_iter_request():
+    client = LandTransportSg('foobar')
+    with pytest.raises(ValueError):
+        _ = list(client.iter_request(
+            'https://datamall2.mytransport.sg/ltaodataservice/BusServices',
+            deadline=0,
+        ))
+
+def test_warm_up_with_invalid_connections(client):
+    with pytest.raises(ValueError):
+        client.warm_up(connections=0)
+
 @pytest.mark.parametrize(
     ('url', 'kwargs'),
     [
@@ -314,6 +1241,16 @@ def test_send_request_with_more_than_500_records(
                 ],
             },
         ),
+        (
+            'https://datamall2.mytransport.sg/ltaodataservice/v3/BusArrival',
+            {
+                'params': {
+                    'BusStopCode': '83139',
+                    'ServiceNo': '15',
+                },
+                'record_type': BusArrivalDict,
+            },
+        ),
     ],
 )
 def test_send_request_with_sanitise_ignored_keys(
@@ -0,0 +1,59 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the PaginationCursor class is working properly."""
+
+import pytest
+
+from landtransportsg.pagination import PaginationCursor
+
+URL = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+
+@pytest.mark.parametrize(
+    ('params', 'expected_params', 'expected_skip'),
+    [
+        (None, {}, 0),
+        ({'foo': 'bar'}, {'foo': 'bar'}, 0),
+        ({'foo': 'bar', '$skip': 1000}, {'foo': 'bar'}, 1000),
+    ],
+)
+def test_cursor(params, expected_params, expected_skip):
+    cursor = PaginationCursor(URL, params=params)
+
+    assert cursor.params == expected_params
+    assert cursor.skip == expected_skip
+    assert cursor.pages == 0
+    assert cursor.is_complete is False
+    assert cursor.page_params() == expected_params | {'$skip': expected_skip}
+    assert URL in repr(cursor)
+
+@pytest.mark.parametrize(
+    ('pages', 'expected_is_complete'),
+    [
+        ([[{}] * 500], False),
+        ([[{}] * 500, [{}] * 499], True),
+        ([[{}] * 500, []], True),
+        ([{'foo': 'bar'}], True),
+    ],
+)
+def test_cursor_advance(pages, expected_is_complete):
+    cursor = PaginationCursor(URL)
+    for page in pages:
+        cursor.advance(page)
+
+    assert cursor.pages == len(pages)
+    assert cursor.skip == 500 * len(pages)
+    assert cursor.is_complete is expected_is_complete
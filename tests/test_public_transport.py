@@ -21,6 +21,7 @@ from os import getenv
 
 import pytest
 from dotenv import load_dotenv
+from requests import HTTPError
 from requests_cache import CachedSession
 from typeguard import check_type
 
@@ -34,6 +35,8 @@ from landtransportsg.public_transport.types import (
     PlannedBusRoutesDict,
     StationCrowdDensityRealTimeDict,
     StationCrowdDensityForecastDict,
+    StationCrowdDensityRealTimeAllDict,
+    StationCrowdDensityForecastAllDict,
     TaxiAvailabilityDict,
     TaxiStandsDict,
     TrainServiceAlertsDict,
@@ -185,6 +188,59 @@ def test_bus_arrival_with_invalid_inputs(client, bus_stop_code, service_number):
             service_number=service_number,
         )
 
+def test_bus_arrivals(client, monkeypatch):
+    bad_bus_stop_code = '83141'
+    requests = []
+
+    def mock_requests_get(*args, **kwargs):
+        requests.append(kwargs['params'])
+        if kwargs['params']['BusStopCode'] == bad_bus_stop_code:
+            raise HTTPError('pytest')
+        return APIResponseBusArrival()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    bus_arrivals = client.bus_arrivals(
+        [GOOD_BUS_STOP_CODE, bad_bus_stop_code, GOOD_BUS_STOP_CODE],
+        service_number=GOOD_SERVICE_NUMBER,
+        max_workers=2,
+    )
+
+    assert list(bus_arrivals) == [GOOD_BUS_STOP_CODE, bad_bus_stop_code]
+    assert check_type(
+        bus_arrivals[GOOD_BUS_STOP_CODE],
+        BusArrivalDict,
+    ) == bus_arrivals[GOOD_BUS_STOP_CODE]
+    assert isinstance(bus_arrivals[bad_bus_stop_code], HTTPError)
+
+    assert len(requests) == 2
+    for params in requests:
+        assert params['ServiceNo'] == GOOD_SERVICE_NUMBER
+
+    assert client.bus_arrivals([]) == {}
+
+@pytest.mark.parametrize(
+    ('bus_stop_codes', 'max_workers'),
+    [
+        ([GOOD_BUS_STOP_CODE, '8313'], 8), # 4-character bus_stop_code
+        ([GOOD_BUS_STOP_CODE, 'foobr'], 8), # non-number bus_stop_code
+        ([GOOD_BUS_STOP_CODE], 0),
+    ],
+)
+def test_bus_arrivals_with_invalid_inputs(
+    client,
+    monkeypatch,
+    bus_stop_codes,
+    max_workers,
+):
+    def mock_requests_get(*args, **kwargs):
+        raise AssertionError('No request is sent for invalid inputs.')
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    with pytest.raises(ValueError):
+        _ = client.bus_arrivals(bus_stop_codes, max_workers=max_workers)
+
 @pytest.mark.parametrize(
     ('function', 'dt'),
     [
@@ -255,6 +311,124 @@ def test_station_crowd_density_class_function(
 
     assert check_type(result, expected_type) == result
 
+class APIResponseStationCrowdDensityByTrainLine:
+    status_code = 200
+
+    def __init__(self, response_class, train_line):
+        self.response_class = response_class
+        self.train_line = train_line
+
+    def json(self):
+        # name each line's station after the line, so that lines can be told
+        # apart after they are merged
+        data = self.response_class.json()
+        for record in data['value']:
+            for station in record.get('Stations', [record]):
+                station['Station'] = f'{self.train_line}1'
+        return data
+
+@pytest.mark.parametrize(
+    ('function', 'expected_type', 'mocked_response_class'),
+    [
+        (
+            'station_crowd_density_real_time_all',
+            StationCrowdDensityRealTimeAllDict,
+            APIResponseStationCrowdDensityRealTime,
+        ),
+        (
+            'station_crowd_density_forecast_all',
+            StationCrowdDensityForecastAllDict,
+            APIResponseStationCrowdDensityForecast,
+        ),
+    ],
+)
+def test_station_crowd_density_all_class_function(
+    client,
+    monkeypatch,
+    function,
+    expected_type,
+    mocked_response_class,
+):
+    train_lines = []
+
+    def mock_requests_get(*args, **kwargs):
+        train_lines.append(kwargs['params']['TrainLine'])
+        return APIResponseStationCrowdDensityByTrainLine(
+            mocked_response_class,
+            kwargs['params']['TrainLine'],
+        )
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    result = getattr(client, function)()
+
+    assert check_type(result, expected_type) == result
+    assert sorted(train_lines) == sorted(client.train_lines())
+    assert list(result['data']) == [f'{t}1' for t in client.train_lines()]
+    assert not result['errors']
+
+@pytest.mark.parametrize(
+    ('function', 'mocked_response_class'),
+    [
+        (
+            'station_crowd_density_real_time_all',
+            APIResponseStationCrowdDensityRealTime,
+        ),
+        (
+            'station_crowd_density_forecast_all',
+            APIResponseStationCrowdDensityForecast,
+        ),
+    ],
+)
+def test_station_crowd_density_all_class_function_with_error(
+    client,
+    monkeypatch,
+    function,
+    mocked_response_class,
+):
+    def mock_requests_get(*args, **kwargs):
+        if kwargs['params']['TrainLine'] == GOOD_TRAIN_LINE:
+            raise HTTPError('pytest')
+        return mocked_response_class()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    result = getattr(client, function)()
+
+    assert list(result['errors']) == [GOOD_TRAIN_LINE]
+    assert isinstance(result['errors'][GOOD_TRAIN_LINE], HTTPError)
+    assert result['data']
+
+def test_station_crowd_density_forecast_all_keeps_every_date(
+    client,
+    monkeypatch,
+):
+    class APIResponseStationCrowdDensityForecastDays:
+        status_code = 200
+
+        @staticmethod
+        def json():
+            data = APIResponseStationCrowdDensityForecast.json()
+            next_day = APIResponseStationCrowdDensityForecast.json()['value']
+            next_day[0]['Date'] = '2025-12-23T00:00:00+08:00'
+            data['value'] += next_day
+            return data
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseStationCrowdDensityForecastDays()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    result = client.station_crowd_density_forecast_all()
+
+    assert [
+        forecast['Date'].day for forecast in result['data']['EW1']
+    ] == [22, 23]
+    # every train network line returns the same station, so its intervals
+    # of each date are gathered
+    assert len(result['data']['EW1'][0]['Interval']) == \
+        len(client.train_lines())
+
 @pytest.mark.parametrize(
     ('function', 'train_line'),
     [
@@ -271,3 +445,50 @@ def test_station_crowd_density_class_function_invalid_inputs(
 ):
     with pytest.raises(ValueError):
         _ = getattr(client, function)(train_line=train_line)
+
+@pytest.mark.parametrize(
+    ('function', 'expected_type', 'mocked_response_class'),
+    [
+        (
+            'iter_bus_routes',
+            BusRoutesDict,
+            APIResponseBusRoutes,
+        ),
+        (
+            'iter_bus_services',
+            BusServicesDict,
+            APIResponseBusServices,
+        ),
+        (
+            'iter_bus_stops',
+            BusStopsDict,
+            APIResponseBusStops,
+        ),
+        (
+            'iter_planned_bus_routes',
+            PlannedBusRoutesDict,
+            APIResponsePlannedBusRoutes,
+        ),
+        (
+            'iter_taxi_availability',
+            TaxiAvailabilityDict,
+            APIResponseTaxiAvailability,
+        ),
+    ],
+)
+def test_iter_class_function_with_mocked_response_class(
+    client,
+    monkeypatch,
+    function,
+    expected_type,
+    mocked_response_class,
+):
+    def mock_requests_get(*args, **kwargs):
+        return mocked_response_class()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    records = getattr(client, function)()
+
+    for record in records:
+        assert check_type(record, expected_type) == record
@@ -0,0 +1,299 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the rate limiter is working properly."""
+
+import asyncio
+from io import BytesIO
+from math import inf
+from time import monotonic, sleep
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Request
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPConnectionPool
+
+from landtransportsg import rate_limiter
+from landtransportsg.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+)
+from landtransportsg.config import ConnectionConfig, ResilienceConfig
+from landtransportsg.deadline import Deadline
+from landtransportsg.exceptions import CircuitOpenError, DeadlineExceededError
+from landtransportsg.landtransportsg import LandTransportSg
+from landtransportsg.rate_limiter import (
+    DEFAULT_RATE_LIMITER,
+    RateLimitedHTTPAdapter,
+    RateLimiter,
+)
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the rate limiter's clock and sleep with a fake clock."""
+    now = [1000.0]
+
+    def mock_monotonic():
+        return now[0]
+
+    def mock_sleep(seconds):
+        now[0] += seconds
+
+    monkeypatch.setattr(rate_limiter, 'monotonic', mock_monotonic)
+    monkeypatch.setattr(rate_limiter, 'sleep', mock_sleep)
+
+    return now
+
+@pytest.mark.parametrize(
+    ('rate', 'burst', 'expected_burst'),
+    [
+        (5, None, 5),
+        (0.5, None, 1),
+        (5, 2, 2),
+        (inf, None, 1),
+    ],
+)
+def test_rate_limiter(rate, burst, expected_burst):
+    limiter = RateLimiter(rate, burst=burst)
+
+    assert limiter.rate == rate
+    assert limiter.burst == expected_burst
+    assert str(expected_burst) in repr(limiter)
+
+@pytest.mark.parametrize(
+    ('rate', 'burst'),
+    [
+        (0, None),
+        (-1, None),
+        (5, 0),
+    ],
+)
+def test_rate_limiter_with_invalid_inputs(rate, burst):
+    with pytest.raises(ValueError):
+        _ = RateLimiter(rate, burst=burst)
+
+def test_rate_limiter_burst(clock):
+    limiter = RateLimiter(2, burst=3)
+
+    assert [limiter.try_acquire() for _ in range(4)] == [
+        True, True, True, False,
+    ]
+
+    clock[0] += 0.5
+    assert limiter.try_acquire() is True
+    assert limiter.try_acquire() is False
+
+def test_rate_limiter_acquire_waits(clock):
+    limiter = RateLimiter(4, burst=1)
+
+    waits = [limiter.acquire() for _ in range(5)]
+
+    assert waits[0] == 0
+    assert waits[1:] == pytest.approx([0.25] * 4)
+    assert clock[0] == pytest.approx(1001.0)
+
+def test_rate_limiter_acquire_with_deadline(clock):
+    limiter = RateLimiter(4, burst=1)
+
+    assert limiter.acquire(deadline=Deadline(10)) == 0
+    assert limiter.acquire(deadline=Deadline(10)) == pytest.approx(0.25)
+
+    # the next token is not available before the deadline, so do not wait
+    with pytest.raises(DeadlineExceededError):
+        _ = limiter.acquire(deadline=Deadline(0.1))
+    assert clock[0] == pytest.approx(1000.25)
+
+def test_rate_limiter_acquire_async():
+    limiter = RateLimiter(20, burst=1)
+
+    async def acquire():
+        return await asyncio.gather(*[limiter.acquire_async() for _ in range(3)])
+
+    start = monotonic()
+    waits = asyncio.run(acquire())
+
+    assert sorted(waits)[0] == 0
+    assert monotonic() - start >= 0.09
+
+    # the next token is not available before the deadline, so do not wait
+    with pytest.raises(DeadlineExceededError):
+        _ = asyncio.run(limiter.acquire_async(deadline=Deadline(0.001)))
+
+def test_rate_limiter_without_limit(clock):
+    limiter = RateLimiter(inf)
+
+    assert sum(limiter.acquire() for _ in range(1000)) == 0
+
+def test_client_rate_limiter():
+    limiter = RateLimiter(5)
+
+    shared_client = LandTransportSg('foobar')
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(rate_limiter=limiter),
+    )
+
+    assert shared_client.rate_limiter is DEFAULT_RATE_LIMITER
+    assert client.rate_limiter is limiter
+
+    adapter = client.session.get_adapter('https://datamall2.mytransport.sg')
+    assert isinstance(adapter, RateLimitedHTTPAdapter)
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.rate_limiter is limiter
+
+def test_client_circuit_breaker():
+    breaker = CircuitBreaker()
+
+    default_client = LandTransportSg('foobar')
+    client = LandTransportSg(
+        'foobar',
+        resilience=ResilienceConfig(circuit_breaker=breaker),
+    )
+    session_client = LandTransportSg('foobar', session=client.session)
+
+    # the circuit breaker is opt-in
+    assert default_client.circuit_breaker is None
+    adapter = default_client.session.get_adapter(
+        'https://datamall2.mytransport.sg',
+    )
+    assert adapter.circuit_breaker is None
+
+    assert client.circuit_breaker is breaker
+    assert session_client.circuit_breaker is breaker
+
+    adapter = client.session.get_adapter('https://datamall2.mytransport.sg')
+    assert adapter.circuit_breaker is breaker
+
+def test_adapter_with_circuit_breaker(monkeypatch):
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    sent = []
+
+    def mock_send(self, request, *args, **kwargs):
+        sent.append(request.url)
+        raise RequestsConnectionError()
+
+    monkeypatch.setattr(HTTPAdapter, 'send', mock_send)
+
+    limiter = RateLimiter(inf)
+    breaker = CircuitBreaker(failure_threshold=2)
+    adapter = RateLimitedHTTPAdapter(
+        rate_limiter=limiter,
+        circuit_breaker=breaker,
+    )
+    request = Request('GET', url, params={'$skip': 500}).prepare()
+
+    for _ in range(2):
+        with pytest.raises(RequestsConnectionError):
+            _ = adapter.send(request)
+    assert breaker.state(url) == CIRCUIT_OPEN
+
+    # fails fast without sending the request
+    with pytest.raises(CircuitOpenError):
+        _ = adapter.send(request)
+    assert len(sent) == 2
+
+    class MockResponse:
+        status_code = 200
+        headers = {}
+
+    monkeypatch.setattr(HTTPAdapter, 'send', lambda *a, **k: MockResponse())
+    breaker.reset()
+    _ = adapter.send(request)
+    assert breaker.state(url) == CIRCUIT_CLOSED
+
+def test_client_circuit_breaker_with_retry_after(monkeypatch):
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    sent = []
+
+    # the response reaches the client through urllib3's retries and the
+    # client's adapter, without a connection to the server
+    def mock_make_request(self, conn, method, url, **kwargs):
+        sent.append(url)
+        return HTTPResponse(
+            body=BytesIO(b''),
+            headers={'Retry-After': '60'},
+            status=429,
+            preload_content=False,
+        )
+
+    monkeypatch.setattr(HTTPConnectionPool, '_make_request', mock_make_request)
+
+    breaker = CircuitBreaker()
+    client = LandTransportSg(
+        'foobar',
+        connection=ConnectionConfig(rate_limiter=RateLimiter(inf)),
+        resilience=ResilienceConfig(circuit_breaker=breaker),
+    )
+
+    started_at = monotonic()
+    with pytest.raises(HTTPError) as excinfo:
+        _ = client.send_request(url)
+    # the server asked to wait for longer than any backoff, so the request
+    # is not retried, and the thread is not blocked
+    assert excinfo.value.response.status_code == 429
+    assert len(sent) == 1
+    assert monotonic() - started_at < 5
+
+    # the circuit is open for as long as the server asked for
+    assert breaker.state(url) == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        _ = client.send_request(url)
+    assert excinfo.value.retry_in == pytest.approx(60, abs=5)
+    assert len(sent) == 1
+
+def test_adapter_with_deadline(monkeypatch, clock):
+    url = 'https://datamall2.mytransport.sg/ltaodataservice/BusStops'
+    sent = []
+
+    class MockResponse:
+        status_code = 200
+        headers = {}
+
+    def mock_send(self, request, *args, **kwargs):
+        sent.append(request.url)
+        return MockResponse()
+
+    monkeypatch.setattr(HTTPAdapter, 'send', mock_send)
+
+    limiter = RateLimiter(1, burst=1)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.001)
+    adapter = RateLimitedHTTPAdapter(
+        rate_limiter=limiter,
+        circuit_breaker=breaker,
+    )
+    request = Request('GET', url).prepare()
+
+    with Deadline(10):
+        _ = adapter.send(request)
+
+    # the circuit is half-open, and the request is not sent to probe it
+    breaker.record_failure(url)
+    clock[0] += 0.5
+    sleep(0.01)
+    assert breaker.state(url) == CIRCUIT_HALF_OPEN
+    with Deadline(0.1), pytest.raises(DeadlineExceededError):
+        _ = adapter.send(request)
+    assert len(sent) == 1
+    assert clock[0] == pytest.approx(1000.5)
+
+    # so another request can still probe it
+    _ = adapter.send(request)
+    assert len(sent) == 2
+    assert breaker.state(url) == CIRCUIT_CLOSED
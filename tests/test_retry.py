@@ -0,0 +1,71 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the retry module is working properly."""
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import RequestHistory
+
+from landtransportsg.retry import JitteredRetry
+
+def test_jittered_retry():
+    retry = JitteredRetry(total=5, backoff_factor=1, backoff_max=10)
+    error = RequestHistory('GET', '/', None, 503, None)
+
+    backoffs = set()
+    for errors in range(2, 8):
+        retry = retry.new(history=(error,) * errors)
+        for _ in range(20):
+            backoff = retry.get_backoff_time()
+            assert 0 <= backoff <= min(2 ** (errors - 1), 10)
+            backoffs.add(backoff)
+
+    # the backoff is random
+    assert len(backoffs) > 1
+
+def test_jittered_retry_without_errors():
+    assert JitteredRetry(total=5, backoff_factor=1).get_backoff_time() == 0
+
+def test_jittered_retry_after():
+    retry = JitteredRetry(total=5, backoff_max=10)
+
+    assert retry.get_retry_after(
+        HTTPResponse(status=429, headers={'Retry-After': '3'}),
+    ) == 3
+    # a long wait is not cut short
+    assert retry.get_retry_after(
+        HTTPResponse(status=429, headers={'Retry-After': '3600'}),
+    ) == 3600
+    assert retry.get_retry_after(HTTPResponse(status=429)) is None
+
+def test_jittered_retry_gives_up_on_long_retry_after():
+    retry = JitteredRetry(total=5, backoff_max=10)
+
+    retry = retry.increment(
+        'GET',
+        '/',
+        response=HTTPResponse(status=429, headers={'Retry-After': '10'}),
+    )
+    assert retry.total == 4
+
+    with pytest.raises(MaxRetryError):
+        _ = retry.increment(
+            'GET',
+            '/',
+            response=HTTPResponse(status=429, headers={'Retry-After': '60'}),
+        )
@@ -0,0 +1,178 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the sanitise module is working properly."""
+
+from datetime import date, datetime, time
+from math import isnan
+
+import pytest
+from typeguard import TypeCheckError
+
+from landtransportsg import sanitise, timezone
+from landtransportsg.sanitise import (
+    LIST_ITEMS,
+    compile_ignore_keys,
+    sanitise_string,
+    sanitise_value,
+)
+from landtransportsg.timezone import SGT_TIMEZONE
+
+@pytest.mark.parametrize(
+    ('value', 'expected_result'),
+    [
+        ('', None),
+        # dates and times
+        ('2019-07-13', date(2019, 7, 13)),
+        (
+            '2019-07-13T08:32:17+08:00',
+            datetime(2019, 7, 13, 8, 32, 17, tzinfo=SGT_TIMEZONE),
+        ),
+        ('0832', time(8, 32)),
+        ('2007', time(20, 7)),
+        # numbers
+        ('01012', 1012),
+        ('2500', 2500),
+        (' -42 ', -42),
+        ('1_000', 1000),
+        ('1.29685', 1.29685),
+        ('.5', 0.5),
+        ('1e3', 1000.0),
+        ('-Infinity', float('-inf')),
+        # tuples of numbers
+        ('1.29685,103.85207', (1.29685, 103.85207)),
+        ('1, 2, 3', (1, 2, 3)),
+        ('1.5,2', '1.5,2'),
+        ('1,2007', '1,2007'),
+        ('1,', '1,'),
+        # text
+        ('Victoria St', 'Victoria St'),
+        ('Train fault, expect delays', 'Train fault, expect delays'),
+        ('1__000', '1__000'),
+        ('1.5j', '1.5j'),
+        ('0x10', '0x10'),
+        ('\x1c5', '\x1c5'),
+    ],
+)
+def test_sanitise_string(value, expected_result):
+    result = sanitise_string(value)
+    assert type(result) is type(expected_result)
+    assert result == expected_result
+
+def test_sanitise_string_with_nan():
+    result = sanitise_string('nan')
+    assert isinstance(result, float) and isnan(result)
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        'Victoria St',
+        'Train fault, expect delays',
+        'Lift maintenance at Exit A, B',
+    ],
+)
+def test_sanitise_string_does_not_convert_text(monkeypatch, value):
+    def mock_convert(*args, **kwargs):
+        raise AssertionError('text should not be converted')
+
+    timezone.datetime_or_none_from_string.cache_clear()
+    monkeypatch.setattr(sanitise, 'int', mock_convert, raising=False)
+    monkeypatch.setattr(sanitise, 'float', mock_convert, raising=False)
+    monkeypatch.setattr(timezone, '_parse_datetime_shape', mock_convert)
+    monkeypatch.setattr(timezone, '_parse_datetime_formats', mock_convert)
+
+    assert sanitise_string(value) == value
+
+@pytest.mark.parametrize(
+    ('ignore_keys', 'key_path', 'expected_result'),
+    [
+        (None, '', None),
+        ([], '', None),
+        (['BusStopCode'], '', {'BusStopCode': None}),
+        (
+            ['BusStopCode', 'Services[].NextBus.OriginCode'],
+            '',
+            {
+                'BusStopCode': None,
+                'Services': {LIST_ITEMS: {'NextBus': {'OriginCode': None}}},
+            },
+        ),
+        (['[].ServiceNo', '[].BusStopCode'], LIST_ITEMS, {
+            'ServiceNo': None,
+            'BusStopCode': None,
+        }),
+        (['Services[].NextBus.OriginCode'], 'Services[]', {
+            'NextBus': {'OriginCode': None},
+        }),
+        # the parent key is ignored, so its children are ignored too
+        (['a', 'a.b'], '', {'a': None}),
+        (['a.b', 'a'], '', {'a': None}),
+        # the children of the value are still ignored
+        (['a', 'a.b'], 'a', {'b': None}),
+        # list items are only ignored through their dict keys
+        (['[]', 'a[]'], '', None),
+        # key paths that are not the path of a value
+        (['.a'], '', None),
+        (['[].a'], '.b', None),
+    ],
+)
+def test_compile_ignore_keys(ignore_keys, key_path, expected_result):
+    result = compile_ignore_keys(ignore_keys, key_path)
+    assert result == expected_result
+
+def test_sanitise_value():
+    value = [
+        {
+            'ServiceNo': '10',
+            'BusStopCode': '01012',
+            'Distance': '1.2',
+            'WD_FirstBus': '0500',
+            'Stops': [{'BusStopCode': '01013', 'Sequence': '2'}],
+            'Note': '',
+        },
+        '42',
+        ['1,2'],
+    ]
+    ignore_keys = compile_ignore_keys(
+        ['[].ServiceNo', '[].BusStopCode', '[].Stops[].BusStopCode'],
+    )
+
+    result = sanitise_value(value, ignore_keys)
+    assert result == [
+        {
+            'ServiceNo': '10',
+            'BusStopCode': '01012',
+            'Distance': 1.2,
+            'WD_FirstBus': time(5, 0),
+            'Stops': [{'BusStopCode': '01013', 'Sequence': 2}],
+            'Note': None,
+        },
+        42,
+        [(1, 2)],
+    ]
+
+    assert sanitise_value(value[0]) == {
+        'ServiceNo': 10,
+        'BusStopCode': 1012,
+        'Distance': 1.2,
+        'WD_FirstBus': time(5, 0),
+        'Stops': [{'BusStopCode': 1013, 'Sequence': 2}],
+        'Note': None,
+    }
+
+def test_sanitise_string_with_bad_arguments():
+    with pytest.raises(TypeCheckError):
+        _ = sanitise_string(1)
@@ -200,6 +200,69 @@ def test_datetime_from_bad_string(date_time_str):
     with pytest.raises(ValueError):
         _ = timezone.datetime_from_string(date_time_str)
 
+@pytest.mark.parametrize(
+    ('date_time_str', 'expected_date_time'),
+    [
+        ('2019-07-13', date(2019, 7, 13)),
+        ('0832', time(8, 32)),
+        ('foobar', None),
+        ('6:25', None),
+    ],
+)
+def test_datetime_or_none_from_string(date_time_str, expected_date_time):
+    date_time = timezone.datetime_or_none_from_string(date_time_str)
+    assert date_time == expected_date_time
+
+@pytest.mark.parametrize(
+    'date_time_str',
+    [
+        '2019-07-13T08:32:17.456+08:00',
+        '2019-07-13T08:32:17.123456-0530',
+        '2019-07-13T08:32:17Z',
+        '20190713T08:32:17.4',
+        '2019-07-13 08:32:17+23:59',
+        '2020-02-29T23:59:59',
+        '2019-07-13',
+        '20190713',
+        '08:32',
+        '0832',
+        '2359',
+        # values that only the formats can parse
+        '2019-07-13T08:32:17+08',
+        '2019-07-13  08:32:17',
+        '2019-07-13t08:32:17',
+        '2019-7-13',
+        '08:32:17.456',
+        # values that cannot be parsed
+        '2019-02-29',
+        '2019-13-01',
+        '2019-07-13T08:32:60',
+        '2019-07-13T08:32:17+24:00',
+        '2019-07-13T08:32:17+08:60',
+        '2019-07-13T08:32:17.1234567',
+        '20190713 08:32:17',
+        '2400',
+        '08:60',
+        '0000',
+        '00000101',
+        '1.2345',
+        '+65',
+        '',
+    ],
+)
+def test_datetime_from_string_matches_formats(date_time_str):
+    expected = timezone._parse_datetime_formats(date_time_str)
+
+    if expected is None:
+        with pytest.raises(ValueError):
+            _ = timezone.datetime_from_string(date_time_str)
+    else:
+        date_time = timezone.datetime_from_string(date_time_str)
+        assert type(date_time) is type(expected)
+        assert date_time == expected
+        assert getattr(date_time, 'tzinfo', None) \
+            is getattr(expected, 'tzinfo', None)
+
 @pytest.mark.parametrize(
     ('fake_today', 'offset_months', 'cutoff_day', 'expected'),
     [
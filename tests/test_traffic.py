@@ -24,6 +24,7 @@ from requests_cache import CachedSession
 from typeguard import check_type
 
 from landtransportsg import Traffic
+from landtransportsg.deadline import DeadlineTimeout
 from landtransportsg.traffic.types import (
     CarParkAvailabilityDict,
     EstimatedTravelTimesDict,
@@ -49,6 +50,7 @@ from .mocks.api_response_traffic import (
     APIResponseTrafficSpeedBands,
     APIResponseVMS,
 )
+from .mocks.api_response_link import APIResponseLink
 
 @pytest.fixture(scope='module')
 def client():
@@ -127,6 +129,33 @@ def test_class_function_with_mocked_response_class(
 
     assert check_type(result, expected_type) == result
 
+@pytest.mark.parametrize(
+    ('function', 'mocked_response_class'),
+    [
+        ('carpark_availability', APIResponseCarParkAvailability),
+        ('iter_carpark_availability', APIResponseCarParkAvailability),
+        ('traffic_flow', APIResponseLink),
+    ],
+)
+def test_class_function_with_deadline(
+    client,
+    monkeypatch,
+    function,
+    mocked_response_class,
+):
+    timeouts = []
+
+    def mock_requests_get(*args, **kwargs):
+        timeouts.append(kwargs.get('timeout'))
+        return mocked_response_class()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    _ = list(getattr(client, function)(deadline=2.0))
+
+    assert isinstance(timeouts[0], DeadlineTimeout)
+    assert timeouts[0].total <= 2.0
+
 def test_traffic_flow(
     client,
     mock_requests_link_response,
@@ -134,3 +163,35 @@ def test_traffic_flow(
     traffic_flow = client.traffic_flow()
 
     assert isinstance(traffic_flow, str)
+
+@pytest.mark.parametrize(
+    ('function', 'expected_type', 'mocked_response_class'),
+    [
+        (
+            'iter_carpark_availability',
+            CarParkAvailabilityDict,
+            APIResponseCarParkAvailability,
+        ),
+        (
+            'iter_traffic_speed_bands',
+            TrafficSpeedBandsDict,
+            APIResponseTrafficSpeedBands,
+        ),
+    ],
+)
+def test_iter_class_function_with_mocked_response_class(
+    client,
+    monkeypatch,
+    function,
+    expected_type,
+    mocked_response_class,
+):
+    def mock_requests_get(*args, **kwargs):
+        return mocked_response_class()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    records = getattr(client, function)()
+
+    for record in records:
+        assert check_type(record, expected_type) == record